@@ -0,0 +1 @@
+"""Standalone performance benchmarks run against the local DemoQA stand-in."""
@@ -0,0 +1,90 @@
+"""Benchmark form filling modes for TextBoxPage and WebTablesPage.
+
+Usage:
+    python -m benchmarks.form_fill --iterations 100 --modes fast fill type
+"""
+import argparse
+import os
+import time
+from playwright.sync_api import sync_playwright
+from pages.base_page import FILL_MODES
+from pages.elements.text_box_page import TextBoxPage
+from pages.elements.web_tables_page import WebTablesPage
+from stub_app import StubServer
+from utils.data_generator import DataGenerator
+
+
+def bench_text_box(page, records: list, mode: str) -> float:
+    """Submit the text box form once per record; returns seconds."""
+    text_box_page = TextBoxPage(page)
+    text_box_page.navigate_to_page()
+    
+    started = time.perf_counter()
+    for record in records:
+        text_box_page.submit_form(
+            full_name=record["full_name"],
+            email=record["email"],
+            current_address=record["current_address"],
+            permanent_address=record["permanent_address"],
+            fill_mode=mode
+        )
+    return time.perf_counter() - started
+
+
+def bench_web_tables(page, records: list, mode: str) -> float:
+    """Add one table record per record; returns seconds."""
+    web_tables_page = WebTablesPage(page)
+    web_tables_page.navigate_to_page()
+    
+    started = time.perf_counter()
+    for record in records:
+        web_tables_page.add_new_record(
+            first_name=record["first_name"],
+            last_name=record["last_name"],
+            email=record["email"],
+            age=record["age"],
+            salary=record["salary"],
+            department=record["department"],
+            fill_mode=mode
+        )
+    return time.perf_counter() - started
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=50)
+    parser.add_argument("--modes", nargs="+", choices=FILL_MODES, default=list(FILL_MODES))
+    parser.add_argument("--headed", action="store_true")
+    args = parser.parse_args()
+    
+    records = DataGenerator(seed=0).generate_records(args.iterations)
+    
+    results = []
+    with StubServer() as server, sync_playwright() as playwright:
+        # Page objects resolve their base URL from the environment; point it
+        # at the stub only while the benchmark runs
+        previous_base_url = os.environ.get("BASE_URL")
+        os.environ["BASE_URL"] = server.url
+        try:
+            browser = playwright.chromium.launch(headless=not args.headed)
+            for mode in args.modes:
+                for name, bench in (("text_box", bench_text_box), ("web_tables", bench_web_tables)):
+                    context = browser.new_context()
+                    page = context.new_page()
+                    elapsed = bench(page, records, mode)
+                    context.close()
+                    results.append((name, mode, elapsed))
+            browser.close()
+        finally:
+            if previous_base_url is None:
+                os.environ.pop("BASE_URL", None)
+            else:
+                os.environ["BASE_URL"] = previous_base_url
+    
+    print(f"{'form':<12}{'mode':<8}{'total s':>10}{'ms/form':>10}")
+    for name, mode, elapsed in results:
+        print(f"{name:<12}{mode:<8}{elapsed:>10.2f}{elapsed * 1000 / args.iterations:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,26 +1,32 @@
 """Base configuration for DemoQA test automation."""
 import os
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Optional
 
 
+LIVE_BASE_URL = "https://demoqa.com"
+
+
 @dataclass
 class BaseConfig:
     """Base configuration class."""
     
-    # Application URLs
-    BASE_URL: str = "https://demoqa.com"
+    # Application URLs (read at instantiation so the local stand-in can switch it)
+    BASE_URL: str = field(default_factory=lambda: os.getenv("BASE_URL", LIVE_BASE_URL))
+    
+    # Application target: "local" serves the bundled stand-in, "live" uses BASE_URL
+    APP_TARGET: str = field(default_factory=lambda: os.getenv("APP_TARGET", "local"))
     
     # Element URLs
-    TEXT_BOX_URL: str = f"{BASE_URL}/text-box"
-    CHECK_BOX_URL: str = f"{BASE_URL}/checkbox"
-    RADIO_BUTTON_URL: str = f"{BASE_URL}/radio-button"
-    WEB_TABLES_URL: str = f"{BASE_URL}/webtables"
-    BUTTONS_URL: str = f"{BASE_URL}/buttons"
-    LINKS_URL: str = f"{BASE_URL}/links"
-    BROKEN_LINKS_URL: str = f"{BASE_URL}/broken"
-    UPLOAD_DOWNLOAD_URL: str = f"{BASE_URL}/upload-download"
-    DYNAMIC_PROPERTIES_URL: str = f"{BASE_URL}/dynamic-properties"
+    TEXT_BOX_URL: str = field(init=False)
+    CHECK_BOX_URL: str = field(init=False)
+    RADIO_BUTTON_URL: str = field(init=False)
+    WEB_TABLES_URL: str = field(init=False)
+    BUTTONS_URL: str = field(init=False)
+    LINKS_URL: str = field(init=False)
+    BROKEN_LINKS_URL: str = field(init=False)
+    UPLOAD_DOWNLOAD_URL: str = field(init=False)
+    DYNAMIC_PROPERTIES_URL: str = field(init=False)
     
     # Timeouts
     DEFAULT_TIMEOUT: int = 30000
@@ -33,11 +39,21 @@ class BaseConfig:
     VIEWPORT_WIDTH: int = 1920
     VIEWPORT_HEIGHT: int = 1080
     
+    # Fast-forward page timers with Playwright's clock instead of waiting
+    VIRTUAL_CLOCK: bool = os.getenv("VIRTUAL_CLOCK", "False").lower() == "true"
+    
+    # Form fill mode: "fill" (actionability-checked), "fast" (one in-page evaluation, opt-in) or "type" (keystrokes)
+    FILL_MODE: str = os.getenv("FILL_MODE", "fill")
+    
     # Test data paths
     TEST_DATA_DIR: str = os.path.join(os.path.dirname(__file__), "..", "test_data")
     UPLOAD_FILES_DIR: str = os.path.join(TEST_DATA_DIR, "files")
     DOWNLOAD_DIR: str = os.path.join(os.path.dirname(__file__), "..", "downloads")
     
+    # Network recording
+    HAR_DIR: str = os.getenv("HAR_DIR", os.path.join(os.path.dirname(__file__), "..", "har"))
+    ASSET_CACHE_DIR: str = os.getenv("ASSET_CACHE_DIR", os.path.join(os.path.dirname(__file__), "..", ".asset-cache"))
+    
     # Logging
     LOG_LEVEL: str = os.getenv("LOG_LEVEL", "INFO")
     LOG_DIR: str = os.path.join(os.path.dirname(__file__), "..", "logs")
@@ -45,6 +61,22 @@ class BaseConfig:
     # Screenshots
     SCREENSHOT_ON_FAILURE: bool = True
     SCREENSHOT_DIR: str = os.path.join(os.path.dirname(__file__), "..", "reports", "screenshots")
+    # "png" or "jpeg"; JPEG encodes faster and smaller at SCREENSHOT_QUALITY (0-100)
+    SCREENSHOT_FORMAT: str = os.getenv("SCREENSHOT_FORMAT", "png")
+    SCREENSHOT_QUALITY: int = int(os.getenv("SCREENSHOT_QUALITY", "80"))
+    # Capture the whole scrollable page, or just the viewport
+    SCREENSHOT_FULL_PAGE: bool = os.getenv("SCREENSHOT_FULL_PAGE", "True").lower() == "true"
+    
+    def __post_init__(self):
+        self.TEXT_BOX_URL = f"{self.BASE_URL}/text-box"
+        self.CHECK_BOX_URL = f"{self.BASE_URL}/checkbox"
+        self.RADIO_BUTTON_URL = f"{self.BASE_URL}/radio-button"
+        self.WEB_TABLES_URL = f"{self.BASE_URL}/webtables"
+        self.BUTTONS_URL = f"{self.BASE_URL}/buttons"
+        self.LINKS_URL = f"{self.BASE_URL}/links"
+        self.BROKEN_LINKS_URL = f"{self.BASE_URL}/broken"
+        self.UPLOAD_DOWNLOAD_URL = f"{self.BASE_URL}/upload-download"
+        self.DYNAMIC_PROPERTIES_URL = f"{self.BASE_URL}/dynamic-properties"
 
 
 def get_config() -> BaseConfig:
@@ -0,0 +1 @@
+"""Pytest plugins registered from tests/conftest.py."""
@@ -0,0 +1,158 @@
+"""Pytest plugin reporting how long each page-object action took.
+
+With ``--action-timings=PATH`` every BasePage primitive (navigate, click,
+fill, waits, reads, scripts, ...) is timed with its page object and
+selector. Each test's timings travel on its report as a user property,
+so they are gathered from xdist workers too. At the end, per-test and
+per-selector latency histograms are printed and everything is written to
+PATH as JSON.
+"""
+from bisect import bisect_right
+from collections import defaultdict
+from dataclasses import asdict
+from pathlib import Path
+from typing import Dict, List
+import json
+import pytest
+from utils.action_timings import ActionTiming, action_timings
+
+
+# Upper bounds of the histogram buckets; the last bucket is open-ended
+BUCKETS_MS = (10, 50, 100, 250, 500, 1000, 2500, 5000)
+
+BUCKET_LABELS = tuple(f"<{bound}" for bound in BUCKETS_MS) + (f">={BUCKETS_MS[-1]}",)
+
+
+def pytest_addoption(parser):
+    """Register the action timings option."""
+    group = parser.getgroup("demoqa", "DemoQA application")
+    group.addoption(
+        "--action-timings",
+        action="store",
+        default=None,
+        metavar="PATH",
+        help="Time every BasePage action; print latency histograms and write them to PATH as JSON.",
+    )
+
+
+def pytest_configure(config):
+    """Turn on timing and register the reporter when requested."""
+    path = config.getoption("--action-timings")
+    if not path:
+        return
+    action_timings.enabled = True
+    if not hasattr(config, "workerinput"):
+        config.pluginmanager.register(ActionTimingReporter(Path(path)), "action-timing-reporter")
+
+
+def histogram(durations_ms: List[float]) -> List[int]:
+    """Count durations per bucket of ``BUCKETS_MS``."""
+    counts = [0] * len(BUCKET_LABELS)
+    for duration_ms in durations_ms:
+        counts[bisect_right(BUCKETS_MS, duration_ms)] += 1
+    return counts
+
+
+def percentile(sorted_ms: List[float], fraction: float) -> float:
+    return sorted_ms[min(int(len(sorted_ms) * fraction), len(sorted_ms) - 1)]
+
+
+def summarize(durations_ms: List[float]) -> dict:
+    """Count, total, percentiles and histogram of a list of durations."""
+    ordered = sorted(durations_ms)
+    return {
+        "count": len(ordered),
+        "total_ms": round(sum(ordered), 1),
+        "p50_ms": round(percentile(ordered, 0.5), 1),
+        "p95_ms": round(percentile(ordered, 0.95), 1),
+        "max_ms": round(ordered[-1], 1),
+        "histogram": histogram(ordered),
+    }
+
+
+class ActionTimingReporter:
+    """Gathers per-test action timings and reports them by test and selector."""
+    
+    TOP_N = 10
+    
+    def __init__(self, path: Path):
+        self.path = path
+        self.by_test: Dict[str, List[ActionTiming]] = {}
+    
+    def pytest_runtest_logreport(self, report):
+        if report.when != "teardown":
+            return
+        properties = dict(report.user_properties)
+        if properties.get("action_timings"):
+            self.by_test[report.nodeid] = [
+                ActionTiming(*fields) for fields in properties["action_timings"]
+            ]
+    
+    def by_selector(self) -> Dict[str, List[float]]:
+        durations = defaultdict(list)
+        for timings in self.by_test.values():
+            for timing in timings:
+                durations[timing.key].append(timing.duration_ms)
+        return durations
+    
+    def to_dict(self) -> dict:
+        return {
+            "buckets_ms": list(BUCKET_LABELS),
+            "tests": {
+                nodeid: {
+                    **summarize([timing.duration_ms for timing in timings]),
+                    "actions": [asdict(timing) for timing in timings],
+                }
+                for nodeid, timings in self.by_test.items()
+            },
+            "selectors": {
+                key: summarize(durations) for key, durations in self.by_selector().items()
+            },
+        }
+    
+    def pytest_sessionfinish(self, session):
+        if not self.by_test:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.path.write_text(json.dumps(self.to_dict(), indent=2))
+    
+    def pytest_terminal_summary(self, terminalreporter):
+        if not self.by_test:
+            return
+        report = self.to_dict()
+        header = " ".join(f"{label:>6}" for label in BUCKET_LABELS)
+        terminalreporter.write_sep("-", "action timings")
+        
+        terminalreporter.write_line(f"{'by test (ms)':<14}{'actions':>7}  {header}")
+        ranked = sorted(report["tests"].items(), key=lambda item: item[1]["total_ms"], reverse=True)
+        for nodeid, stats in ranked[:self.TOP_N]:
+            terminalreporter.write_line(self._row(stats, nodeid))
+        
+        terminalreporter.write_line(f"{'by selector':<14}{'actions':>7}  {header}")
+        ranked = sorted(report["selectors"].items(), key=lambda item: item[1]["total_ms"], reverse=True)
+        for key, stats in ranked[:self.TOP_N]:
+            terminalreporter.write_line(self._row(stats, f"{key}  p50 {stats['p50_ms']:.0f} p95 {stats['p95_ms']:.0f}"))
+        terminalreporter.write_line(f"written to {self.path}")
+    
+    @staticmethod
+    def _row(stats: dict, label: str) -> str:
+        counts = " ".join(f"{count:>6}" for count in stats["histogram"])
+        return f"  {stats['total_ms']:10.0f}  {stats['count']:>7}  {counts}  {label}"
+
+
+@pytest.fixture(autouse=True)
+def action_timing_report(request):
+    """Collect this test's action timings into its user properties."""
+    if not action_timings.enabled:
+        yield
+        return
+    action_timings.drain(request.node.nodeid)
+    yield
+    timings = action_timings.drain(request.node.nodeid)
+    if timings:
+        request.node.user_properties.append(
+            ("action_timings", [
+                (timing.page_object, timing.method, timing.selector, round(timing.duration_ms, 2))
+                for timing in timings
+            ])
+        )
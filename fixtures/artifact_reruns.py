@@ -0,0 +1,114 @@
+"""Pytest plugin running tests lean and re-running failures for artifacts.
+
+With ``--artifact-mode=rerun`` the run starts without tracing, video,
+screenshots, headed mode or slow motion, so passing tests pay nothing for
+artifacts they would throw away. Once every test has run, only the failed
+ones run again, on a freshly launched browser, with the configured
+artifact options (traces, video and screenshots at least on failure).
+
+Outcomes come from the lean run. Re-runs are not reported as test results;
+the summary lists each one as "failed again" or "passed on rerun" (flaky).
+Under xdist every worker re-runs its own failures.
+"""
+from typing import Dict, List, Optional, Set, Tuple
+import os
+import pytest
+from _pytest.runner import runtestprotocol
+
+
+# Values of pytest-playwright's options in the lean first run
+LEAN_OPTIONS = {"tracing": "off", "video": "off", "screenshot": "off", "headed": False, "slowmo": 0}
+
+
+def pytest_addoption(parser):
+    """Register the artifact mode option."""
+    group = parser.getgroup("demoqa", "DemoQA application")
+    group.addoption(
+        "--artifact-mode",
+        action="store",
+        default=os.getenv("ARTIFACT_MODE", "always"),
+        choices=("always", "rerun"),
+        help="Record artifacts for every test (always), or run lean and re-run failures with artifacts (rerun).",
+    )
+
+
+def pytest_configure(config):
+    """Switch to the lean options and register the re-runner."""
+    if config.getoption("--artifact-mode") != "rerun":
+        return
+    config.pluginmanager.register(ArtifactRerunner(config), "artifact-rerunner")
+
+
+def artifact_options(option) -> Dict[str, object]:
+    """The configured options, with traces, video and screenshots kept at least on failure."""
+    return {
+        "tracing": option.tracing if option.tracing != "off" else "retain-on-failure",
+        "video": option.video if option.video != "off" else "retain-on-failure",
+        "screenshot": option.screenshot if option.screenshot != "off" else "only-on-failure",
+        "headed": option.headed,
+        "slowmo": option.slowmo,
+    }
+
+
+class ArtifactRerunner:
+    """Re-runs the failures of the lean run with artifact recording on."""
+    
+    def __init__(self, config: pytest.Config):
+        self.config = config
+        self.artifact_options = artifact_options(config.option)
+        self._apply(LEAN_OPTIONS)
+        self.failed: Set[str] = set()
+        self.reruns: List[Tuple[str, bool]] = []
+        self.skipped_reason: Optional[str] = None
+    
+    def _apply(self, options: Dict[str, object]):
+        for name, value in options.items():
+            setattr(self.config.option, name, value)
+    
+    def pytest_runtest_logreport(self, report):
+        if report.failed:
+            self.failed.add(report.nodeid)
+    
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtestloop(self, session):
+        outcome = yield
+        # Still re-run after --maxfail stopped the run, but not after an interrupt
+        if outcome.excinfo and not isinstance(outcome.excinfo[1], session.Failed):
+            return
+        items = [item for item in session.items if item.nodeid in self.failed]
+        if not items:
+            return
+        
+        # A run stopped by --maxfail may leave the lean session, module and
+        # class fixtures (the browser included) set up; tear everything down
+        # so the re-runs rebuild them with the artifact options
+        try:
+            session._setupstate.teardown_exact(None)
+        except Exception as error:
+            self.skipped_reason = f"tearing down the lean run failed: {error!r}"
+            return
+        self._apply(self.artifact_options)
+        for index, item in enumerate(items):
+            nextitem = items[index + 1] if index + 1 < len(items) else None
+            # log=False keeps the re-run out of the results and the counts
+            reports = runtestprotocol(item, nextitem=nextitem, log=False)
+            self.reruns.append((item.nodeid, any(report.failed for report in reports)))
+        
+        if hasattr(self.config, "workerinput"):
+            self.config.workeroutput["artifact_reruns"] = self.reruns
+    
+    @pytest.hookimpl(optionalhook=True)
+    def pytest_testnodedown(self, node, error):
+        """Collect the re-runs of an xdist worker."""
+        self.reruns.extend(tuple(rerun) for rerun in getattr(node, "workeroutput", {}).get("artifact_reruns", []))
+    
+    def pytest_terminal_summary(self, terminalreporter):
+        if not self.reruns and not self.skipped_reason:
+            return
+        terminalreporter.write_sep("-", "artifact re-runs")
+        if self.skipped_reason:
+            terminalreporter.write_line(f"skipped: {self.skipped_reason}")
+        for nodeid, failed in self.reruns:
+            terminalreporter.write_line(f"  {'failed again' if failed else 'passed on rerun':<16}{nodeid}")
+        if self.reruns:
+            terminalreporter.write_line(f"artifacts in {self.config.getoption('--output')}")
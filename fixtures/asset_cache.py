@@ -0,0 +1,112 @@
+"""Pytest plugin serving static assets from a cache shared by all tests.
+
+Every context starts with an empty browser cache, so without this each test
+downloads the site's scripts, stylesheets, images and fonts again. With
+``--asset-cache=on`` they are kept in ``ASSET_CACHE_DIR`` across contexts,
+xdist workers and runs, revalidated with ETag/Last-Modified once per run,
+and evicted least-recently-used beyond ``--asset-cache-size`` MiB. Hit and
+miss counters are attached to each test report and totalled at the end.
+
+The default, ``auto``, only enables the cache against the live site: the
+local stand-in is served from the same machine, where routing its few
+assets through Python costs more than downloading them.
+"""
+import os
+import pytest
+from config.base_config import get_config
+from utils.asset_cache import AssetCache, AssetCacheRouter
+
+
+def pytest_addoption(parser):
+    """Register the asset cache options."""
+    group = parser.getgroup("demoqa", "DemoQA application")
+    group.addoption(
+        "--asset-cache",
+        action="store",
+        default=os.getenv("ASSET_CACHE", "auto"),
+        choices=("auto", "on", "off", "clear"),
+        help="Serve static assets from the on-disk cache (clear empties it first; auto: live site only).",
+    )
+    group.addoption(
+        "--asset-cache-size",
+        action="store",
+        type=int,
+        default=int(os.getenv("ASSET_CACHE_SIZE_MB", "200")),
+        help="Evict least recently used assets beyond this many MiB.",
+    )
+
+
+def pytest_configure(config):
+    """Empty the cache once, on the controller, and register the reporter."""
+    if config.getoption("--asset-cache") == "clear" and not hasattr(config, "workerinput"):
+        AssetCache(get_config().ASSET_CACHE_DIR).clear()
+    config.pluginmanager.register(AssetCacheReporter(), "asset-cache-reporter")
+
+
+class AssetCacheReporter:
+    """Totals the per-test cache counters, including from xdist workers."""
+    
+    def __init__(self):
+        self.counts = {"asset_cache_hits": 0, "asset_cache_revalidated": 0, "asset_cache_misses": 0, "asset_cache_bytes": 0}
+    
+    def pytest_runtest_logreport(self, report):
+        if report.when != "teardown":
+            return
+        properties = dict(report.user_properties)
+        for name in self.counts:
+            self.counts[name] += properties.get(name, 0)
+    
+    def pytest_terminal_summary(self, terminalreporter):
+        hits = self.counts["asset_cache_hits"] + self.counts["asset_cache_revalidated"]
+        requests = hits + self.counts["asset_cache_misses"]
+        if not requests:
+            return
+        terminalreporter.write_sep("-", "asset cache")
+        terminalreporter.write_line(
+            f"{hits}/{requests} static requests served from cache ({hits / requests:.0%}; "
+            f"{self.counts['asset_cache_revalidated']} revalidated), "
+            f"{self.counts['asset_cache_bytes'] / 1024 / 1024:.1f} MiB not downloaded"
+        )
+
+
+def cache_enabled(config: pytest.Config) -> bool:
+    """Whether this run uses the cache; ``auto`` means only against the live site."""
+    mode = config.getoption("--asset-cache")
+    if mode == "auto":
+        return (
+            config.getoption("--app-target", "local") == "live"
+            or config.getoption("--har-mode", "off") != "off"
+        )
+    return mode != "off"
+
+
+@pytest.fixture(scope="session")
+def asset_cache(pytestconfig):
+    """This worker's handle on the shared cache directory, or None when disabled."""
+    if not cache_enabled(pytestconfig):
+        return None
+    return AssetCache(get_config().ASSET_CACHE_DIR, max_bytes=pytestconfig.getoption("--asset-cache-size") * 1024 * 1024)
+
+
+@pytest.fixture(scope="session")
+def asset_cache_validated():
+    """URLs this worker has already revalidated during the run."""
+    return set()
+
+
+@pytest.fixture(scope="function")
+def asset_cache_router(request, asset_cache, asset_cache_validated):
+    """Per-test router; reports its counters as user properties."""
+    if asset_cache is None:
+        yield None
+        return
+    
+    router = AssetCacheRouter(asset_cache, validated=asset_cache_validated)
+    yield router
+    
+    summary = router.summary()
+    request.node.user_properties.extend(summary.items())
+    router.logger.debug(
+        "Asset cache: %s hits, %s revalidated, %s misses",
+        summary["asset_cache_hits"], summary["asset_cache_revalidated"], summary["asset_cache_misses"]
+    )
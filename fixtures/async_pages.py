@@ -0,0 +1,112 @@
+"""Pytest plugin for driving async page objects on a worker-wide event loop.
+
+``async def`` tests run on one event loop per worker, hosted on its own
+thread so it never collides with the sync API's loop. A test can open as
+many pages as it needs with ``async_page_factory`` and drive them
+concurrently with ``asyncio.gather``, all in one browser process.
+
+The async browser is launched on the loop thread with the sync browser's
+launch options, or connects to the shared server with
+``--browser-server=shared``. Every context gets the same asset cache, HAR
+and blocking routes as the sync ``context`` fixture.
+"""
+from collections import Counter
+from typing import List
+import asyncio
+import inspect
+import pytest
+from playwright.async_api import BrowserContext, async_playwright
+from utils.event_loop_thread import EventLoopThread
+from utils.page_runtime import RUNTIME_SCRIPT
+from utils.resource_policy import ResourceBlocker
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_pyfunc_call(pyfuncitem):
+    """Run coroutine tests to completion on the worker's event loop."""
+    if not inspect.iscoroutinefunction(pyfuncitem.obj):
+        return None
+    
+    async_loop = pyfuncitem._request.getfixturevalue("async_loop")
+    arguments = {name: pyfuncitem.funcargs[name] for name in pyfuncitem._fixtureinfo.argnames}
+    async_loop.run(pyfuncitem.obj(**arguments))
+    return True
+
+
+@pytest.fixture(scope="session")
+def async_loop():
+    """Event loop thread shared by every async test in this worker."""
+    runner = EventLoopThread("async-pages").start()
+    yield runner
+    runner.stop()
+
+
+@pytest.fixture(scope="session")
+def async_browser(async_loop, app_base_url, browser_endpoint, browser_name, browser_type_launch_args):
+    """Async browser launched with the sync one's options, or connected to the shared server."""
+    async def start():
+        playwright = await async_playwright().start()
+        browser_type = getattr(playwright, browser_name)
+        if browser_endpoint is None:
+            browser = await browser_type.launch(**browser_type_launch_args)
+        else:
+            browser = await browser_type.connect_over_cdp(
+                browser_endpoint, slow_mo=browser_type_launch_args.get("slow_mo")
+            )
+        return playwright, browser
+    
+    async def shutdown():
+        # Closes a launched browser; only disconnects from the shared server
+        await browser.close()
+        await playwright.stop()
+    
+    playwright, browser = async_loop.run(start())
+    yield browser
+    async_loop.run(shutdown())
+
+
+@pytest.fixture
+def async_page_factory(request, pytestconfig, async_loop, async_browser, browser_context_args,
+                       asset_cache_router, har_router, resource_size_hints):
+    """Coroutine opening a page in a fresh context; all are closed after the test."""
+    contexts: List[BrowserContext] = []
+    blockers: List[ResourceBlocker] = []
+    blocking = pytestconfig.getoption("--resource-policy") != "off"
+    
+    async def new_page(**context_args):
+        context = await async_browser.new_context(**{**browser_context_args, **context_args})
+        await context.add_init_script(RUNTIME_SCRIPT)
+        contexts.append(context)
+        # Same routes, in the same order, as the sync context fixture
+        if asset_cache_router:
+            await asset_cache_router.attach_async(context)
+        if har_router:
+            await har_router.attach_async(context)
+        if blocking:
+            # One blocker per context, as each page object activates its own policy
+            blocker = ResourceBlocker(size_hints=resource_size_hints)
+            await blocker.attach_async(context)
+            blockers.append(blocker)
+        page = await context.new_page()
+        page.set_default_timeout(30000)
+        page.set_default_navigation_timeout(30000)
+        return page
+    
+    yield new_page
+    
+    async def close_all():
+        await asyncio.gather(*(context.close() for context in contexts), return_exceptions=True)
+    
+    async_loop.run(close_all())
+    
+    if blockers:
+        totals = Counter()
+        for blocker in blockers:
+            totals.update(blocker.summary())
+        request.node.user_properties.extend(totals.items())
+
+
+@pytest.fixture
+def async_page(async_loop, async_page_factory):
+    """A single async page for tests that need only one."""
+    return async_loop.run(async_page_factory())
@@ -0,0 +1,201 @@
+"""Pytest plugin sharing Chromium servers between xdist workers.
+
+With ``--browser-server=shared`` the controller (the only process without
+``-n``) launches ``--browser-servers`` Chromium processes and restarts any
+that die. Workers connect to them over the DevTools websocket, spread
+round-robin, and open their own contexts; a worker that loses its server
+reconnects once it is back.
+
+Each test process samples the memory of its process tree (Python, the
+Playwright driver and, without shared servers, its own browser) while
+tests run. The peaks are listed per worker at the end of the run, next to
+the browser servers and the last total of the other mode, from the cache.
+"""
+from typing import Dict, Optional
+import os
+import time
+import pytest
+from utils import process_memory
+from utils.browser_server import BrowserServerPool, SharedBrowser
+
+
+# workerinput entry carrying the servers' endpoints to the workers
+ENDPOINTS_KEY = "browser_server_endpoints"
+
+MEMORY_KEY = "browser_server/memory"
+
+pool_key = pytest.StashKey[BrowserServerPool]()
+
+
+def pytest_addoption(parser):
+    """Register the browser server options."""
+    group = parser.getgroup("demoqa", "DemoQA application")
+    group.addoption(
+        "--browser-server",
+        action="store",
+        default=os.getenv("BROWSER_SERVER", "off"),
+        choices=("off", "shared"),
+        help="Launch a browser per worker (off) or share browser servers between workers (shared; Chromium only).",
+    )
+    group.addoption(
+        "--browser-servers",
+        action="store",
+        type=int,
+        default=int(os.getenv("BROWSER_SERVERS", "1")),
+        help="Browser servers to launch in shared mode; workers are spread over them.",
+    )
+
+
+def worker_index(workerid: str) -> int:
+    """0 for gw0, 1 for gw1, ..."""
+    return int(workerid[2:]) if workerid[2:].isdigit() else 0
+
+
+def pytest_configure(config):
+    """Launch the shared servers on the coordinator and start sampling memory."""
+    shared = config.getoption("--browser-server") == "shared"
+    workerinput = getattr(config, "workerinput", None)
+    if shared and workerinput is None:
+        browsers = config.getoption("--browser") or ["chromium"]
+        if browsers != ["chromium"]:
+            raise pytest.UsageError("--browser-server=shared supports --browser chromium only")
+        if config.getoption("--browser-servers") < 1:
+            raise pytest.UsageError("--browser-servers must be at least 1")
+        from playwright.sync_api import sync_playwright
+        
+        playwright = sync_playwright().start()
+        try:
+            executable = playwright.chromium.executable_path
+        finally:
+            playwright.stop()
+        if not os.path.exists(executable):
+            raise pytest.UsageError(f"Chromium is not installed ({executable}); run `playwright install chromium`")
+        pool = BrowserServerPool(
+            config.getoption("--browser-servers"), executable, headless=not config.getoption("--headed")
+        )
+        try:
+            pool.start()
+        except (RuntimeError, TimeoutError, OSError):
+            pool.stop()
+            raise
+        config.stash[pool_key] = pool
+    
+    if workerinput is not None or shared or config.getoption("numprocesses", None):
+        config.pluginmanager.register(MemoryMonitor(config, "shared" if shared else "off"), "browser-memory-monitor")
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_configure_node(node):
+    """Tell every worker where the browser servers listen."""
+    pool = node.config.stash.get(pool_key, None)
+    if pool is not None:
+        node.workerinput[ENDPOINTS_KEY] = pool.endpoints
+
+
+def pytest_unconfigure(config):
+    pool = config.stash.get(pool_key, None)
+    if pool is not None:
+        pool.stop()
+
+
+def shared_endpoint(config: pytest.Config) -> Optional[str]:
+    """The browser server this process should use, if any."""
+    workerinput = getattr(config, "workerinput", None)
+    if workerinput is not None:
+        endpoints = workerinput.get(ENDPOINTS_KEY)
+        if endpoints:
+            return endpoints[worker_index(workerinput["workerid"]) % len(endpoints)]
+        return None
+    pool = config.stash.get(pool_key, None)
+    return pool.endpoints[0] if pool else None
+
+
+@pytest.fixture(scope="session")
+def browser_endpoint(pytestconfig) -> Optional[str]:
+    """The shared browser server with ``--browser-server=shared``, else None."""
+    return shared_endpoint(pytestconfig)
+
+
+@pytest.fixture(scope="session")
+def browser(browser_endpoint, launch_browser, browser_type, browser_type_launch_args):
+    """pytest-playwright's browser, or a connection to a shared browser server."""
+    endpoint = browser_endpoint
+    if endpoint is None:
+        launched = launch_browser()
+        yield launched
+        launched.close()
+        return
+    shared = SharedBrowser(browser_type, endpoint, slow_mo=browser_type_launch_args.get("slow_mo"))
+    yield shared
+    shared.close()
+
+
+class MemoryMonitor:
+    """Samples per-process memory and reports it per worker."""
+    
+    # Seconds between samples; walking /proc costs a few milliseconds
+    SAMPLE_INTERVAL = 5.0
+    
+    def __init__(self, config: pytest.Config, mode: str):
+        self.config = config
+        self.mode = mode
+        self.peak_mib = 0.0
+        self.servers_peak_mib = 0.0
+        self.workers: Dict[str, float] = {}
+        self._last_sample = 0.0
+    
+    def _pool(self) -> Optional[BrowserServerPool]:
+        return self.config.stash.get(pool_key, None)
+    
+    def pytest_runtest_logreport(self, report):
+        """Sample while the browser is up; the controller samples the servers."""
+        now = time.monotonic()
+        if report.when != "call" or now - self._last_sample < self.SAMPLE_INTERVAL:
+            return
+        self._last_sample = now
+        pool = self._pool()
+        if pool is not None:
+            self.servers_peak_mib = max(self.servers_peak_mib, process_memory.tree_memory_mib(pool.pids) or 0.0)
+        if hasattr(self.config, "workerinput") or not self.config.getoption("numprocesses", None):
+            # Without -n the servers are this process's children; they are counted separately
+            own = process_memory.tree_memory_mib([os.getpid()], exclude=pool.pids if pool else []) or 0.0
+            self.peak_mib = max(self.peak_mib, own)
+            if hasattr(self.config, "workerinput"):
+                self.config.workeroutput["memory_peak_mib"] = self.peak_mib
+    
+    @pytest.hookimpl(optionalhook=True)
+    def pytest_testnodedown(self, node, error):
+        peak = getattr(node, "workeroutput", {}).get("memory_peak_mib")
+        if peak is not None:
+            self.workers[node.gateway.id] = peak
+    
+    def pytest_terminal_summary(self, terminalreporter):
+        if hasattr(self.config, "workerinput") or not process_memory.available():
+            return
+        workers = self.workers or ({"main": self.peak_mib} if self.peak_mib else {})
+        if not workers:
+            return
+        total = sum(workers.values()) + self.servers_peak_mib
+        terminalreporter.write_sep("-", "peak memory per worker (PSS)")
+        for name in sorted(workers, key=worker_index):
+            terminalreporter.write_line(f"  {name:<8}{workers[name]:8.0f} MiB")
+        pool = self._pool()
+        if pool is not None:
+            terminalreporter.write_line(
+                f"  {'servers':<8}{self.servers_peak_mib:8.0f} MiB  "
+                f"({len(pool.servers)} shared, {sum(server.restarts for server in pool.servers)} restarts)"
+            )
+        terminalreporter.write_line(f"  {'total':<8}{total:8.0f} MiB  ({self.mode} mode, {len(workers)} workers)")
+        
+        cache = getattr(self.config, "cache", None)
+        if cache is None:
+            return
+        history = cache.get(MEMORY_KEY, {})
+        other = "off" if self.mode == "shared" else "shared"
+        if other in history:
+            previous = history[other]
+            terminalreporter.write_line(
+                f"  last {other} run: {previous['total_mib']:.0f} MiB with {previous['workers']} workers"
+            )
+        history[self.mode] = {"total_mib": round(total, 1), "workers": len(workers)}
+        cache.set(MEMORY_KEY, history)
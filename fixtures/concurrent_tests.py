@@ -0,0 +1,331 @@
+"""Pytest plugin running independent tests concurrently inside one worker.
+
+With ``--concurrent-tests N``, consecutive tests marked ``parallel`` (and
+not ``serial``) from the same class or module run in batches of up to N:
+
+1. each test is set up on its own, getting its own context and page;
+2. the test bodies run together as greenlets whose browser waits interleave
+   on the worker's single Playwright connection;
+3. each test is then reported and torn down on its own.
+
+Reports, durations, log records, stdout/stderr, expired waits and
+Playwright artifacts stay attributed to the test that produced them. Other
+tests run one at a time as usual. The mode replaces xdist: one process and
+one browser serve N tests at once.
+
+Running several tests between their setup and teardown needs pytest's setup
+stack and Playwright's sync dispatcher, which are private. The runner only
+starts on the releases pinned in requirements.txt and refuses to run if the
+attributes it uses are gone, rather than misattributing results.
+"""
+from dataclasses import dataclass, field
+from contextlib import contextmanager
+from functools import partial
+from importlib.metadata import version
+from io import StringIO
+from typing import Dict, List, Optional, Tuple
+import asyncio
+import bdb
+import inspect
+import logging
+import os
+import sys
+import time
+import pytest
+from utils.current_test import current_test
+from utils.interleave import run_interleaved
+
+
+# Releases whose private internals the runner was written against (major.minor)
+SUPPORTED_RELEASES = {"pytest": "8.3", "playwright": "1.48"}
+
+
+def pytest_addoption(parser):
+    """Register the concurrent tests option."""
+    group = parser.getgroup("demoqa", "DemoQA application")
+    group.addoption(
+        "--concurrent-tests",
+        action="store",
+        type=int,
+        default=int(os.getenv("CONCURRENT_TESTS", "1")),
+        help="Run up to N tests marked 'parallel' at once in this process (default: 1, off).",
+    )
+
+
+def pytest_configure(config):
+    """Register the concurrent runner when enabled."""
+    width = config.getoption("--concurrent-tests")
+    if width <= 1:
+        return
+    if config.getoption("numprocesses", None) or hasattr(config, "workerinput"):
+        raise pytest.UsageError("--concurrent-tests replaces xdist; run it without -n")
+    pool_size = config.getoption("--context-pool-size", 0)
+    if 0 < pool_size < width:
+        raise pytest.UsageError(
+            f"--context-pool-size ({pool_size}) must be at least --concurrent-tests ({width})"
+        )
+    problems = unsupported_internals()
+    if problems:
+        raise pytest.UsageError(
+            "--concurrent-tests relies on pytest and Playwright internals that are not available: "
+            + "; ".join(problems)
+        )
+    config.pluginmanager.register(ConcurrentTestRunner(width), "concurrent-test-runner")
+
+
+def unsupported_internals() -> List[str]:
+    """Reasons the installed pytest/Playwright cannot run concurrent batches, if any."""
+    problems = []
+    for package, release in SUPPORTED_RELEASES.items():
+        installed = version(package)
+        if installed.split(".")[:2] != release.split("."):
+            problems.append(f"{package} {installed} is installed, the runner supports {release}.x")
+    if not hasattr(pytest.Function, "_initrequest"):
+        problems.append("pytest.Function._initrequest is missing")
+    if not hasattr(asyncio, "_set_running_loop"):
+        problems.append("asyncio._set_running_loop is missing")
+    return problems
+
+
+def _call_and_report(item: pytest.Item, when: str, **kwargs) -> pytest.TestReport:
+    """Run one phase of a test and report it, as pytest's own run loop does."""
+    ihook = item.ihook
+    hook = {
+        "setup": ihook.pytest_runtest_setup,
+        "call": ihook.pytest_runtest_call,
+        "teardown": ihook.pytest_runtest_teardown,
+    }[when]
+    reraise: Tuple[type, ...] = (pytest.exit.Exception,)
+    if not item.config.getoption("usepdb", False):
+        reraise += (KeyboardInterrupt,)
+    call = pytest.CallInfo.from_call(lambda: hook(item=item, **kwargs), when=when, reraise=reraise)
+    report = ihook.pytest_runtest_makereport(item=item, call=call)
+    ihook.pytest_runtest_logreport(report=report)
+    if (
+        call.excinfo is not None
+        and not hasattr(report, "wasxfail")
+        and not isinstance(call.excinfo.value, (pytest.skip.Exception, bdb.BdbQuit))
+    ):
+        ihook.pytest_exception_interact(node=item, call=call, report=report)
+    return report
+
+
+def _runs_concurrently(item: pytest.Item) -> bool:
+    """Whether a test may share a batch with its neighbours."""
+    return (
+        isinstance(item, pytest.Function)
+        and not inspect.iscoroutinefunction(item.obj)
+        and item.get_closest_marker("parallel") is not None
+        and item.get_closest_marker("serial") is None
+    )
+
+
+@dataclass
+class _BodyOutcome:
+    """What a test body did while it ran in a batch."""
+    
+    error: Optional[BaseException] = None
+    duration: float = 0.0
+    records: List[logging.LogRecord] = field(default_factory=list)
+    stdout: StringIO = field(default_factory=StringIO)
+    stderr: StringIO = field(default_factory=StringIO)
+
+
+class _AttributingLogHandler(logging.Handler):
+    """Routes records to the buffer of the test that emitted them."""
+    
+    def __init__(self, outcomes: Dict[str, _BodyOutcome]):
+        super().__init__()
+        self.outcomes = outcomes
+        self.unattributed: List[logging.LogRecord] = []
+    
+    def emit(self, record: logging.LogRecord):
+        outcome = self.outcomes.get(current_test.get())
+        (outcome.records if outcome else self.unattributed).append(record)
+
+
+class _AttributingStream:
+    """File-like proxy writing to the current test's buffer."""
+    
+    def __init__(self, original, outcomes: Dict[str, _BodyOutcome], name: str):
+        self.original = original
+        self.outcomes = outcomes
+        self.name = name
+    
+    def write(self, text: str) -> int:
+        outcome = self.outcomes.get(current_test.get())
+        return (getattr(outcome, self.name) if outcome else self.original).write(text)
+    
+    def __getattr__(self, attribute):
+        return getattr(self.original, attribute)
+
+
+@contextmanager
+def _stacked(stack: dict, parked: Dict[pytest.Item, Optional[tuple]], items: List[pytest.Item]):
+    """Put parked tests back on the setup stack while their bodies run.
+    
+    A body may add finalizers to its own item (``request.addfinalizer``,
+    ``request.getfixturevalue``), which pytest only accepts for nodes on the
+    stack. Nothing is set up or torn down meanwhile, so several items may
+    sit there at once; the finalizer lists are shared with ``parked``.
+    """
+    for item in items:
+        if parked[item] is not None:
+            stack[item] = parked[item]
+    try:
+        yield
+    finally:
+        for item in items:
+            stack.pop(item, None)
+
+
+@contextmanager
+def _attributed_output(outcomes: Dict[str, _BodyOutcome]):
+    """Buffer root log records and std streams per test while bodies run."""
+    root = logging.getLogger()
+    handlers = root.handlers[:]
+    handler = _AttributingLogHandler(outcomes)
+    root.handlers = [handler]
+    stdout, stderr = sys.stdout, sys.stderr
+    sys.stdout = _AttributingStream(stdout, outcomes, "stdout")
+    sys.stderr = _AttributingStream(stderr, outcomes, "stderr")
+    try:
+        yield
+    finally:
+        sys.stdout, sys.stderr = stdout, stderr
+        root.handlers = handlers
+        for record in handler.unattributed:
+            root.callHandlers(record)
+
+
+class ConcurrentTestRunner:
+    """Replaces the default run loop to batch ``parallel`` tests."""
+    
+    def __init__(self, width: int):
+        self.width = width
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self._outcomes: Dict[str, _BodyOutcome] = {}
+    
+    @pytest.hookimpl(tryfirst=True)
+    def pytest_runtestloop(self, session: pytest.Session) -> bool:
+        if session.testsfailed and not session.config.option.continue_on_collection_errors:
+            raise session.Interrupted(
+                "%d error%s during collection"
+                % (session.testsfailed, "s" if session.testsfailed != 1 else "")
+            )
+        if session.config.option.collectonly:
+            return True
+        if not isinstance(getattr(getattr(session, "_setupstate", None), "stack", None), dict):
+            raise pytest.UsageError("--concurrent-tests needs pytest's session._setupstate.stack, which is missing")
+        
+        items = session.items
+        index = 0
+        while index < len(items):
+            batch = self._next_batch(items, index)
+            index += len(batch)
+            nextitem = items[index] if index < len(items) else None
+            if len(batch) == 1:
+                batch[0].ihook.pytest_runtest_protocol(item=batch[0], nextitem=nextitem)
+            else:
+                self._run_batch(session, batch, nextitem)
+            if session.shouldfail:
+                raise session.Failed(session.shouldfail)
+            if session.shouldstop:
+                raise session.Interrupted(session.shouldstop)
+        return True
+    
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_makereport(self, item, call):
+        outcome = yield
+        body = self._outcomes.pop(item.nodeid, None) if call.when == "call" else None
+        if body is not None:
+            # The replayed call is instant; report how long the body really ran
+            outcome.get_result().duration = body.duration
+    
+    def _next_batch(self, items: List[pytest.Item], start: int) -> List[pytest.Item]:
+        first = items[start]
+        batch = [first]
+        if not _runs_concurrently(first):
+            return batch
+        for item in items[start + 1:]:
+            if len(batch) == self.width or item.parent is not first.parent or not _runs_concurrently(item):
+                break
+            batch.append(item)
+        return batch
+    
+    def _run_batch(self, session: pytest.Session, batch: List[pytest.Item], nextitem: Optional[pytest.Item]):
+        """Set up every test, run the bodies together, then report and tear down each."""
+        self.logger.info("Running %s tests concurrently: %s", len(batch), [item.name for item in batch])
+        stack = session._setupstate.stack
+        parked = {}
+        runnable = []
+        
+        for item in batch:
+            item.ihook.pytest_runtest_logstart(nodeid=item.nodeid, location=item.location)
+            if not item._request:
+                item._initrequest()
+            report = _call_and_report(item, "setup")
+            # Park the test's own stack entry so the next test can be set up
+            # under the same collectors; it is restored for its body and teardown
+            parked[item] = stack.pop(item, None)
+            if report.passed and not item.config.getoption("setuponly", False):
+                runnable.append(item)
+        
+        with _stacked(stack, parked, runnable):
+            self._run_bodies(runnable)
+        
+        for position, item in enumerate(batch):
+            # Only this test is on the stack from its call phase to its teardown
+            if parked[item] is not None:
+                stack[item] = parked[item]
+            if item in runnable:
+                body = self._outcomes[item.nodeid]
+                item.runtest = partial(self._replay, body)
+                try:
+                    _call_and_report(item, "call")
+                finally:
+                    del item.runtest
+            
+            following = batch[position + 1] if position + 1 < len(batch) else nextitem
+            if session.shouldfail or session.shouldstop:
+                following = None
+            _call_and_report(item, "teardown", nextitem=following)
+            item._request = False
+            item.funcargs = None
+            item.ihook.pytest_runtest_logfinish(nodeid=item.nodeid, location=item.location)
+    
+    def _run_bodies(self, items: List[pytest.Function]):
+        outcomes = {item.nodeid: _BodyOutcome() for item in items}
+        self._outcomes.update(outcomes)
+        tasks = [partial(self._run_body, item, outcomes[item.nodeid]) for item in items]
+        playwright = next(
+            (item.funcargs["playwright"] for item in items if "playwright" in item.funcargs), None
+        )
+        
+        with _attributed_output(outcomes):
+            if playwright is None:
+                for task in tasks:
+                    task()
+            else:
+                run_interleaved(playwright, tasks)
+    
+    @staticmethod
+    def _run_body(item: pytest.Function, outcome: _BodyOutcome):
+        current_test.set(item.nodeid)
+        started = time.perf_counter()
+        try:
+            item.runtest()
+        except BaseException as error:
+            outcome.error = error
+        outcome.duration = time.perf_counter() - started
+    
+    @staticmethod
+    def _replay(outcome: _BodyOutcome):
+        """Stand-in for ``runtest`` that replays a finished body inside its call phase."""
+        root = logging.getLogger()
+        for record in outcome.records:
+            root.callHandlers(record)
+        sys.stdout.write(outcome.stdout.getvalue())
+        sys.stderr.write(outcome.stderr.getvalue())
+        if outcome.error is not None:
+            raise outcome.error
@@ -0,0 +1,86 @@
+"""Pytest plugin leasing browser contexts from a per-worker pool.
+
+``--context-pool-size=N`` keeps N pre-warmed contexts per worker and resets
+them between tests instead of creating and closing one per test. Tracing
+follows ``--tracing`` as usual. Video needs a fresh context per test, so
+pooled contexts do not record it.
+
+``--page-reuse=on`` also keeps each context's page open between tests
+(pooling at least one context). Page objects whose ``navigate_to_page``
+finds their URL already loaded reset it in place and skip the navigation
+when it checks out clean; pages of failed tests are never reused.
+"""
+import os
+import pytest
+from utils.context_pool import ContextPool
+
+
+def pytest_addoption(parser):
+    """Register context pool options."""
+    group = parser.getgroup("demoqa", "DemoQA application")
+    group.addoption(
+        "--context-pool-size",
+        action="store",
+        type=int,
+        default=int(os.getenv("CONTEXT_POOL_SIZE", "0")),
+        help="Reuse up to N pre-warmed browser contexts per worker (0 disables pooling).",
+    )
+    group.addoption(
+        "--context-max-uses",
+        action="store",
+        type=int,
+        default=25,
+        help="Recycle a pooled context after this many tests.",
+    )
+    group.addoption(
+        "--page-reuse",
+        action="store",
+        default=os.getenv("PAGE_REUSE", "off"),
+        choices=("on", "off"),
+        help="Keep pages loaded between tests and reset them in place where the page object can (implies pooling).",
+    )
+
+
+@pytest.fixture(scope="session")
+def context_pool(pytestconfig, browser, browser_context_args):
+    """Session-wide context pool, or None when pooling is disabled."""
+    size = pytestconfig.getoption("--context-pool-size")
+    keep_pages = pytestconfig.getoption("--page-reuse") == "on"
+    if keep_pages and size <= 0:
+        # One context per concurrently running test
+        size = max(pytestconfig.getoption("--concurrent-tests", 1), 1)
+    if size <= 0:
+        yield None
+        return
+    
+    pool = ContextPool(
+        browser,
+        {**browser_context_args, "accept_downloads": True},
+        size=size,
+        max_uses=pytestconfig.getoption("--context-max-uses"),
+        keep_pages=keep_pages,
+    )
+    yield pool
+    pool.close()
+
+
+@pytest.fixture(scope="function")
+def pooled_context(request, pytestconfig, context_pool, output_path):
+    """Lease a context for one test, tracing it like pytest-playwright would."""
+    context = context_pool.acquire()
+    tracing = pytestconfig.getoption("--tracing")
+    if tracing != "off":
+        context.tracing.start(
+            title=request.node.nodeid, screenshots=True, snapshots=True, sources=True
+        )
+    
+    yield context
+    
+    failed = request.node.rep_call.failed if hasattr(request.node, "rep_call") else True
+    if tracing != "off":
+        if tracing == "on" or failed:
+            os.makedirs(output_path, exist_ok=True)
+            context.tracing.stop(path=os.path.join(output_path, "trace.zip"))
+        else:
+            context.tracing.stop()
+    context_pool.release(context, keep_page=not failed)
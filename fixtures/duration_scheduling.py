@@ -0,0 +1,161 @@
+"""Pytest plugin balancing tests by their recorded durations.
+
+Every run folds each test's setup + call + teardown time into a history kept
+in the pytest cache, along with the page objects its module uses. The
+history drives:
+
+- the xdist scheduler (``-n``): tests sharing page objects are grouped into
+  work units, which workers take longest first, so slow waits and big
+  parametrized groups start early instead of ending up at the tail;
+- ``--shard i/n``: splits the run into n shards of about equal historical
+  duration for multi-machine CI, keeping the i-th (1-based).
+
+Tests without history count as the median known duration.
+"""
+from typing import Dict, Optional, Set, Tuple
+import os
+import pytest
+from pages.aio.base_page import BasePage as AsyncBasePage
+from pages.base_page import BasePage
+from utils.duration_history import DurationHistory, lpt_partition
+
+
+HISTORY_KEY = "duration_history/tests"
+
+AFFINITY_PROPERTY = "page_objects"
+
+shard_key = pytest.StashKey[Optional[Tuple[int, int]]]()
+shard_summary_key = pytest.StashKey[str]()
+
+
+def pytest_addoption(parser):
+    """Register scheduling options."""
+    group = parser.getgroup("demoqa", "DemoQA application")
+    group.addoption(
+        "--scheduler",
+        action="store",
+        default=os.getenv("SCHEDULER", "duration"),
+        choices=("duration", "default"),
+        help="How -n distributes tests: by recorded duration and page object, or xdist's default.",
+    )
+    group.addoption(
+        "--shard",
+        action="store",
+        default=os.getenv("SHARD"),
+        metavar="I/N",
+        help="Run only the I-th of N shards of about equal recorded duration.",
+    )
+
+
+def parse_shard(value: Optional[str]) -> Optional[Tuple[int, int]]:
+    """Parse ``i/n`` into a 1-based shard index and count."""
+    if not value:
+        return None
+    try:
+        index, count = (int(part) for part in value.split("/"))
+    except ValueError:
+        raise pytest.UsageError(f"--shard expects I/N, got {value!r}") from None
+    if not 1 <= index <= count:
+        raise pytest.UsageError(f"--shard index must be between 1 and {count}, got {index}")
+    return index, count
+
+
+def load_history(config: pytest.Config) -> DurationHistory:
+    """History stored by earlier runs; empty when the cache is disabled."""
+    cache = getattr(config, "cache", None)
+    return DurationHistory(cache.get(HISTORY_KEY, {}) if cache else {})
+
+
+def page_object_affinity(item: pytest.Item) -> Optional[str]:
+    """Names of the page objects imported by the test's module."""
+    module = getattr(item, "module", None)
+    if module is None:
+        return None
+    names = sorted(
+        value.__name__
+        for value in vars(module).values()
+        if isinstance(value, type)
+        and issubclass(value, (BasePage, AsyncBasePage))
+        and value not in (BasePage, AsyncBasePage)
+    )
+    return ",".join(names) or None
+
+
+def pytest_configure(config):
+    """Validate the shard and start recording durations on the controller."""
+    config.stash[shard_key] = parse_shard(config.getoption("--shard"))
+    if not hasattr(config, "workerinput"):
+        config.pluginmanager.register(DurationRecorder(config), "duration-recorder")
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_xdist_make_scheduler(config, log):
+    """Replace xdist's load scheduling with duration-aware scheduling."""
+    if config.getoption("--scheduler") != "duration" or config.getoption("dist") != "load":
+        return None
+    from utils.xdist_scheduler import DurationScheduling
+    return DurationScheduling(config, load_history(config), log)
+
+
+@pytest.hookimpl(trylast=True)
+def pytest_collection_modifyitems(session, config, items):
+    """Tag tests with their page objects and keep only this shard's tests."""
+    affinity: Dict[str, str] = {}
+    for item in items:
+        key = page_object_affinity(item)
+        if key:
+            affinity[item.nodeid] = key
+            item.user_properties.append((AFFINITY_PROPERTY, key))
+    
+    shard = config.stash[shard_key]
+    if not shard or not items:
+        return
+    index, count = shard
+    history = load_history(config)
+    units = history.plan_units([item.nodeid for item in items], bins=count, affinity=affinity)
+    partition = lpt_partition(units, count)
+    selected = {nodeid for unit in partition[index - 1] for nodeid in unit.nodeids}
+    
+    deselected = [item for item in items if item.nodeid not in selected]
+    items[:] = [item for item in items if item.nodeid in selected]
+    config.hook.pytest_deselected(items=deselected)
+    
+    loads = [sum(unit.duration for unit in shard_units) for shard_units in partition]
+    config.stash[shard_summary_key] = (
+        f"shard {index}/{count}: {len(items)} tests, ~{loads[index - 1]:.1f}s "
+        f"(all shards {min(loads):.1f}-{max(loads):.1f}s)"
+    )
+
+
+def pytest_report_collectionfinish(config, start_path, items):
+    """Show which shard runs and how balanced the shards are."""
+    summary = config.stash.get(shard_summary_key, None)
+    return [summary] if summary else []
+
+
+class DurationRecorder:
+    """Collects per-test durations, including from xdist workers, into the history."""
+    
+    def __init__(self, config: pytest.Config):
+        self.config = config
+        self.durations: Dict[str, float] = {}
+        self.affinity: Dict[str, str] = {}
+        self.skipped: Set[str] = set()
+    
+    def pytest_runtest_logreport(self, report):
+        self.durations[report.nodeid] = self.durations.get(report.nodeid, 0.0) + report.duration
+        properties = dict(report.user_properties)
+        if AFFINITY_PROPERTY in properties:
+            self.affinity[report.nodeid] = properties[AFFINITY_PROPERTY]
+        if report.skipped and report.when == "setup":
+            self.skipped.add(report.nodeid)
+    
+    def pytest_sessionfinish(self, session):
+        if not self.durations or getattr(self.config, "cache", None) is None:
+            return
+        # Fold into what is stored now, in case other runs saved meanwhile
+        history = load_history(self.config)
+        for nodeid, duration in self.durations.items():
+            if nodeid not in self.skipped:
+                history.record(nodeid, duration, self.affinity.get(nodeid))
+        self.config.cache.set(HISTORY_KEY, history.to_dict())
@@ -0,0 +1,77 @@
+"""Pytest plugin recording and replaying network traffic through a HAR archive.
+
+``--har-mode=record`` sends every request through the network and stores the
+responses; ``replay`` serves them back from the archive and lets unrecorded
+requests through; ``strict`` aborts unrecorded requests and fails the test.
+Page objects send ``page.request`` calls through the same router, as API
+requests bypass context routing.
+"""
+import os
+from pathlib import Path
+import pytest
+from config.base_config import get_config
+from utils.har_archive import HarArchive, HarRouter
+
+
+HAR_MODES = ("off", "record", "replay", "strict")
+
+
+def pytest_addoption(parser):
+    """Register HAR record/replay options."""
+    group = parser.getgroup("demoqa", "DemoQA application")
+    group.addoption(
+        "--har-mode",
+        action="store",
+        default=os.getenv("HAR_MODE", "off"),
+        choices=HAR_MODES,
+        help="Record network traffic to, or replay it from, the HAR archive.",
+    )
+    group.addoption(
+        "--har-dir",
+        action="store",
+        default=get_config().HAR_DIR,
+        help="Directory holding the HAR archive files.",
+    )
+
+
+def pytest_configure(config):
+    """Clear the previous recording before any worker starts recording."""
+    if config.getoption("--har-mode") == "record" and not hasattr(config, "workerinput"):
+        # Replay merges every file in the directory; files from a run with
+        # a different -n would otherwise be mixed in
+        HarArchive.clear_dir(Path(config.getoption("--har-dir")))
+
+
+@pytest.fixture(scope="session")
+def har_archive(pytestconfig):
+    """Session-wide archive; loaded for replay, saved after recording."""
+    mode = pytestconfig.getoption("--har-mode")
+    har_dir = Path(pytestconfig.getoption("--har-dir"))
+    archive = HarArchive()
+    
+    if mode in ("replay", "strict"):
+        archive.load_dir(har_dir)
+    
+    yield archive
+    
+    if mode == "record":
+        worker = os.getenv("PYTEST_XDIST_WORKER", "main")
+        archive.save(har_dir / f"{worker}.har")
+
+
+@pytest.fixture(scope="function")
+def har_router(pytestconfig, har_archive):
+    """Per-test router; fails the test in strict mode on unrecorded requests."""
+    mode = pytestconfig.getoption("--har-mode")
+    if mode == "off":
+        yield None
+        return
+    
+    router = HarRouter(har_archive, mode)
+    yield router
+    
+    if router.unrecorded:
+        pytest.fail(
+            "Requests missing from the HAR archive:\n  " + "\n  ".join(router.unrecorded),
+            pytrace=False,
+        )
@@ -0,0 +1,28 @@
+"""Pytest plugin providing a session-wide concurrent link scanner.
+
+The scanner keeps one API request context and a URL result cache for the
+whole run (per xdist worker), so links shared between pages are checked
+once.
+"""
+import pytest
+from utils.link_scanner import LinkScanner
+
+
+def pytest_addoption(parser):
+    """Register the link scanner option."""
+    group = parser.getgroup("demoqa", "DemoQA application")
+    group.addoption(
+        "--link-scan-concurrency",
+        action="store",
+        type=int,
+        default=8,
+        help="Maximum concurrent requests when scanning links and images.",
+    )
+
+
+@pytest.fixture(scope="session")
+def link_scanner(pytestconfig):
+    """Session link scanner; its event loop thread starts on first use."""
+    scanner = LinkScanner(max_concurrency=pytestconfig.getoption("--link-scan-concurrency"))
+    yield scanner
+    scanner.close()
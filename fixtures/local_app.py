@@ -0,0 +1,44 @@
+"""Pytest plugin selecting the application under test.
+
+By default the suite runs against the bundled DemoQA stand-in served from a
+local thread, so runs are offline and reproducible. ``--app-target=live``
+restores the previous behaviour of testing the real site.
+"""
+import os
+import pytest
+from config.base_config import LIVE_BASE_URL, get_config
+from stub_app import StubServer
+
+
+def pytest_addoption(parser):
+    """Register the application target option."""
+    group = parser.getgroup("demoqa", "DemoQA application")
+    group.addoption(
+        "--app-target",
+        action="store",
+        default=get_config().APP_TARGET,
+        choices=("local", "live"),
+        help="Run against the local DemoQA stand-in (default) or the live site.",
+    )
+
+
+@pytest.fixture(scope="session")
+def app_base_url(pytestconfig):
+    """Base URL of the application under test, exported as BASE_URL."""
+    previous = os.environ.get("BASE_URL")
+    
+    # HAR archives are keyed by absolute URL, so recording and replay need the live host
+    replaying = pytestconfig.getoption("--har-mode", "off") != "off"
+    
+    if replaying or pytestconfig.getoption("--app-target") == "live":
+        os.environ["BASE_URL"] = pytestconfig.getoption("base_url") or previous or LIVE_BASE_URL
+        yield os.environ["BASE_URL"]
+    else:
+        with StubServer() as server:
+            os.environ["BASE_URL"] = server.url
+            yield server.url
+    
+    if previous is None:
+        os.environ.pop("BASE_URL", None)
+    else:
+        os.environ["BASE_URL"] = previous
@@ -0,0 +1,87 @@
+"""Pytest plugin blocking requests the page objects do not need.
+
+Each test's context gets a ResourceBlocker. Page objects switch it to their
+own RESOURCE_POLICY when constructed. Blocked request and byte counters are
+attached to the test report as user properties and totalled at the end.
+"""
+import pytest
+from utils.resource_policy import ResourceBlocker
+
+
+SIZE_HINTS_KEY = "resource_policy/size_hints"
+
+
+def pytest_addoption(parser):
+    """Register the resource blocking option."""
+    group = parser.getgroup("demoqa", "DemoQA application")
+    group.addoption(
+        "--resource-policy",
+        action="store",
+        default="on",
+        choices=("on", "off"),
+        help="Block ads, analytics, fonts and unneeded images per page object.",
+    )
+
+
+def pytest_configure(config):
+    """Register the savings reporter."""
+    config.pluginmanager.register(ResourceSavingsReporter(), "resource-savings-reporter")
+
+
+class ResourceSavingsReporter:
+    """Totals the per-test blocking counters, including from xdist workers."""
+    
+    def __init__(self):
+        self.tests = 0
+        self.blocked_requests = 0
+        self.blocked_bytes = 0
+        self.blocked_unsized = 0
+    
+    def pytest_runtest_logreport(self, report):
+        if report.when != "teardown":
+            return
+        properties = dict(report.user_properties)
+        if "blocked_requests" in properties:
+            self.tests += 1
+            self.blocked_requests += properties["blocked_requests"]
+            self.blocked_bytes += properties["blocked_bytes"]
+            self.blocked_unsized += properties.get("blocked_unsized", 0)
+    
+    def pytest_terminal_summary(self, terminalreporter):
+        if not self.tests:
+            return
+        terminalreporter.write_sep("-", "resource blocking")
+        terminalreporter.write_line(
+            f"{self.blocked_requests} requests blocked across {self.tests} tests, "
+            f"~{self.blocked_bytes / 1024:.1f} KiB not downloaded"
+            f" ({self.blocked_unsized} of unknown size)"
+        )
+
+
+@pytest.fixture(scope="session")
+def resource_size_hints(pytestconfig):
+    """URL -> body size map persisted in the pytest cache between runs."""
+    size_hints = pytestconfig.cache.get(SIZE_HINTS_KEY, {})
+    yield size_hints
+    # Merge with whatever other workers stored meanwhile; unknown sizes are probed again next run
+    stored = pytestconfig.cache.get(SIZE_HINTS_KEY, {})
+    stored.update({url: size for url, size in size_hints.items() if size is not None})
+    pytestconfig.cache.set(SIZE_HINTS_KEY, stored)
+
+
+@pytest.fixture(scope="function")
+def resource_blocker(request, pytestconfig, resource_size_hints):
+    """Per-test blocker; reports its counters as user properties."""
+    if pytestconfig.getoption("--resource-policy") == "off":
+        yield None
+        return
+    
+    blocker = ResourceBlocker(size_hints=resource_size_hints)
+    yield blocker
+    
+    summary = blocker.summary()
+    request.node.user_properties.extend(summary.items())
+    blocker.logger.info(
+        "Blocked %s requests (~%s bytes, %s of unknown size)",
+        summary["blocked_requests"], summary["blocked_bytes"], summary["blocked_unsized"],
+    )
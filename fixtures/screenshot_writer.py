@@ -0,0 +1,54 @@
+"""Pytest plugin sizing the background screenshot writer.
+
+Failure screenshots and ``BasePage.take_screenshot`` capture bytes and hand
+them to ``utils.screenshot_writer``; this plugin sets its pool and queue
+sizes and makes sure every queued screenshot is on disk before the session
+ends.
+"""
+import os
+import pytest
+from utils.screenshot_writer import screenshot_writer
+
+
+def pytest_addoption(parser):
+    """Register the screenshot writer options."""
+    group = parser.getgroup("demoqa", "DemoQA application")
+    group.addoption(
+        "--screenshot-workers",
+        action="store",
+        type=int,
+        default=int(os.getenv("SCREENSHOT_WORKERS", "2")),
+        help="Threads writing screenshots in the background.",
+    )
+    group.addoption(
+        "--screenshot-queue",
+        action="store",
+        type=int,
+        default=int(os.getenv("SCREENSHOT_QUEUE", "16")),
+        help="Screenshots held in memory before taking another one waits for a write.",
+    )
+
+
+def pytest_configure(config):
+    """Size the writer's pool and queue."""
+    workers = config.getoption("--screenshot-workers")
+    queue = config.getoption("--screenshot-queue")
+    if workers < 1 or queue < 1:
+        raise pytest.UsageError("--screenshot-workers and --screenshot-queue must be at least 1")
+    screenshot_writer.configure(workers, queue)
+
+
+@pytest.hookimpl(trylast=True)
+def pytest_sessionfinish(session):
+    """Wait for queued screenshots before the run reports its artifacts."""
+    screenshot_writer.close()
+
+
+def pytest_terminal_summary(terminalreporter):
+    stats = screenshot_writer.stats
+    if not (stats.written or stats.duplicates or stats.failed):
+        return
+    terminalreporter.write_line(
+        f"screenshots: {stats.written} written ({stats.bytes_written / 1024:.0f} KiB), "
+        f"{stats.duplicates} duplicates skipped, {stats.failed} failed"
+    )
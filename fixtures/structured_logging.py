@@ -0,0 +1,92 @@
+"""Pytest plugin sending log records through a queue to JSON-lines files.
+
+The root logger gets a queue handler, so page objects only pay for putting
+a record on a queue; a listener thread per process writes
+``logs/<run>-<worker>.jsonl``, rotated by size and gzipped. Every xdist
+worker writes its own file, all sharing the controller's run name. Chatty
+DEBUG records (``BasePage.click`` and ``fill`` by default) are sampled.
+Live console output is left to pytest's ``log_cli``.
+"""
+from datetime import datetime
+from pathlib import Path
+import os
+import pytest
+from config.base_config import get_config
+from utils.structured_logging import DEFAULT_SAMPLING, LogPipeline, parse_sampling
+
+
+# workerinput entry carrying the controller's run name
+RUN_NAME_KEY = "structured_logging_run"
+
+run_name_key = pytest.StashKey[str]()
+pipeline_key = pytest.StashKey[LogPipeline]()
+
+
+def pytest_addoption(parser):
+    """Register the structured logging options."""
+    group = parser.getgroup("demoqa", "DemoQA application")
+    group.addoption(
+        "--log-sampling",
+        action="store",
+        default=os.getenv("LOG_SAMPLING", ",".join(f"{key}={every}" for key, every in DEFAULT_SAMPLING.items())),
+        help="Keep 1 in N DEBUG records per '<logger>.<function>' pattern, e.g. '*.click=10,ButtonsPage.*=2' "
+             "('' keeps everything).",
+    )
+    group.addoption(
+        "--log-max-bytes",
+        action="store",
+        type=int,
+        default=int(os.getenv("LOG_MAX_BYTES", str(10 * 1024 * 1024))),
+        help="Size at which a worker's JSON-lines log is rotated and gzipped.",
+    )
+    group.addoption(
+        "--log-backups",
+        action="store",
+        type=int,
+        default=int(os.getenv("LOG_BACKUPS", "5")),
+        help="Rotated log files kept per worker.",
+    )
+
+
+def pytest_configure(config):
+    """Start this process's log pipeline."""
+    try:
+        sampling = parse_sampling(config.getoption("--log-sampling"))
+    except ValueError as error:
+        raise pytest.UsageError(str(error))
+    
+    workerinput = getattr(config, "workerinput", None)
+    if workerinput is None:
+        run_name = f"test_run_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+        worker = "main"
+    else:
+        run_name = workerinput[RUN_NAME_KEY]
+        worker = workerinput["workerid"]
+    config.stash[run_name_key] = run_name
+    
+    settings = get_config()
+    pipeline = LogPipeline(
+        Path(settings.LOG_DIR),
+        run_name,
+        worker=worker,
+        level=settings.LOG_LEVEL,
+        sampling=sampling,
+        max_bytes=config.getoption("--log-max-bytes"),
+        backup_count=config.getoption("--log-backups"),
+    )
+    pipeline.start()
+    config.stash[pipeline_key] = pipeline
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_configure_node(node):
+    """Give every xdist worker the controller's run name."""
+    node.workerinput[RUN_NAME_KEY] = node.config.stash[run_name_key]
+
+
+@pytest.hookimpl(trylast=True)
+def pytest_unconfigure(config):
+    """Write out queued records and stop the listener."""
+    pipeline = config.stash.get(pipeline_key, None)
+    if pipeline is not None:
+        pipeline.stop()
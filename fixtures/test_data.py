@@ -0,0 +1,75 @@
+"""Pytest plugin providing reproducible, seeded test data.
+
+Every run has a data seed (``--data-seed``, random unless given and shown
+in the header). Each test's ``data_generator`` is seeded from the run seed
+and the test's node id, so a test gets the same data whichever xdist
+worker runs it and in whatever order. ``data_pool`` serves precomputed
+records from a columnar file that is built once and then opened lazily.
+"""
+from pathlib import Path
+import os
+import random
+import pytest
+from config.base_config import get_config
+from utils.data_generator import DataGenerator
+from utils.record_pool import RecordPool
+
+
+# workerinput entry carrying the controller's data seed
+SEED_KEY = "data_seed"
+
+# Records built into a missing pool; the pool's own seed keeps it identical everywhere
+POOL_SIZE = 10000
+POOL_SEED = 0
+
+seed_key = pytest.StashKey[int]()
+
+
+def pytest_addoption(parser):
+    """Register the test data options."""
+    group = parser.getgroup("demoqa", "DemoQA application")
+    group.addoption(
+        "--data-seed",
+        action="store",
+        type=int,
+        default=int(os.environ["DATA_SEED"]) if os.getenv("DATA_SEED") else None,
+        help="Seed for generated test data (random per run by default).",
+    )
+
+
+def pytest_configure(config):
+    """Fix the run's data seed; xdist workers take the controller's."""
+    workerinput = getattr(config, "workerinput", None)
+    if workerinput is not None:
+        seed = workerinput[SEED_KEY]
+    else:
+        seed = config.getoption("--data-seed")
+        if seed is None:
+            seed = random.randrange(2 ** 32)
+    config.stash[seed_key] = seed
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_configure_node(node):
+    """Give every xdist worker the controller's data seed."""
+    node.workerinput[SEED_KEY] = node.config.stash[seed_key]
+
+
+def pytest_report_header(config):
+    seed = config.stash[seed_key]
+    return f"test data seed: {seed} (reproduce with --data-seed={seed})"
+
+
+@pytest.fixture
+def data_generator(request) -> DataGenerator:
+    """Generator seeded from the run's data seed and this test's node id."""
+    return DataGenerator.for_test(request.node.nodeid, request.config.stash[seed_key])
+
+
+@pytest.fixture(scope="session")
+def data_pool() -> RecordPool:
+    """Precomputed user records, built on first use into TEST_DATA_DIR/pools."""
+    path = Path(get_config().TEST_DATA_DIR) / "pools" / "users.pool"
+    if not path.exists():
+        DataGenerator(seed=POOL_SEED).build_pool(path, POOL_SIZE)
+    return RecordPool(path)
@@ -0,0 +1,68 @@
+"""Pytest plugin reporting wall time lost to waits that expired.
+
+Every BasePage wait that runs out its timeout is recorded. Per-test totals
+are attached to the report as user properties, and the slowest offenders
+are listed in the terminal summary.
+"""
+from collections import defaultdict
+import pytest
+from utils.wait_report import wait_report
+
+
+def pytest_configure(config):
+    """Register the expired-wait reporter."""
+    config.pluginmanager.register(ExpiredWaitReporter(), "expired-wait-reporter")
+
+
+class ExpiredWaitReporter:
+    """Ranks tests and selectors by time spent in expired waits."""
+    
+    TOP_N = 10
+    
+    def __init__(self):
+        self.by_test = {}
+        self.by_selector = defaultdict(float)
+    
+    def pytest_runtest_logreport(self, report):
+        if report.when != "teardown":
+            return
+        properties = dict(report.user_properties)
+        if properties.get("expired_wait_ms"):
+            self.by_test[report.nodeid] = properties["expired_wait_ms"]
+            for selector, elapsed_ms in properties.get("expired_wait_selectors", {}).items():
+                self.by_selector[selector] += elapsed_ms
+    
+    def pytest_terminal_summary(self, terminalreporter):
+        if not self.by_test:
+            return
+        terminalreporter.write_sep("-", "expired waits")
+        total_ms = sum(self.by_test.values())
+        terminalreporter.write_line(
+            f"{total_ms / 1000:.1f}s spent in expired waits across {len(self.by_test)} tests"
+        )
+        ranked = sorted(self.by_test.items(), key=lambda item: item[1], reverse=True)
+        for nodeid, elapsed_ms in ranked[:self.TOP_N]:
+            terminalreporter.write_line(f"  {elapsed_ms:8.0f} ms  {nodeid}")
+        terminalreporter.write_line("by selector:")
+        ranked = sorted(self.by_selector.items(), key=lambda item: item[1], reverse=True)
+        for selector, elapsed_ms in ranked[:self.TOP_N]:
+            terminalreporter.write_line(f"  {elapsed_ms:8.0f} ms  {selector}")
+
+
+@pytest.fixture(autouse=True)
+def expired_wait_report(request):
+    """Collect this test's expired waits into its user properties."""
+    wait_report.drain(request.node.nodeid)
+    yield
+    expired = wait_report.drain(request.node.nodeid)
+    if not expired:
+        return
+    
+    selectors = defaultdict(float)
+    for wait in expired:
+        selectors[f"{wait.page_object}.{wait.method}({wait.selector})"] += wait.elapsed_ms
+    request.node.user_properties.extend([
+        ("expired_waits", len(expired)),
+        ("expired_wait_ms", round(sum(wait.elapsed_ms for wait in expired), 1)),
+        ("expired_wait_selectors", dict(selectors)),
+    ])
@@ -0,0 +1,355 @@
+"""Async base page object mirroring pages.base_page on playwright.async_api."""
+from playwright.async_api import Error as PlaywrightError, Page, expect, Locator, TimeoutError as PlaywrightTimeoutError
+from concurrent.futures import Future
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+from config.base_config import get_config
+from pages.base_page import (
+    BasePage as SyncBasePage,
+    ElementState,
+    FILL_MODES,
+    Query,
+)
+from utils.resource_policy import ResourceBlocker
+from utils.action_batch import ActionBatch, BatchResult
+from utils.action_timings import timed_action
+from utils.page_runtime import CALL_ELEMENT_HELPER_SCRIPT, CALL_HELPER_SCRIPT, RUNTIME_SCRIPT
+from utils.screenshot_writer import capture_options, extension, screenshot_writer
+from utils.wait_report import wait_report
+import logging
+import time
+
+
+def shares_locators(sync_page_class: type):
+    """Class decorator copying a sync page object's UPPER_CASE attributes.
+    
+    Keeps the URL, locators and other constants defined once, on the sync
+    page object, while the async twin only implements the methods.
+    """
+    def decorate(async_page_class: type) -> type:
+        for name, value in vars(sync_page_class).items():
+            if name.isupper() and name not in vars(async_page_class):
+                setattr(async_page_class, name, value)
+        return async_page_class
+    return decorate
+
+
+@shares_locators(SyncBasePage)
+class BasePage:
+    """Async base page object containing common functionality."""
+    
+    def __init__(self, page: Page, base_url: Optional[str] = None):
+        self.page = page
+        self.base_url = base_url or get_config().BASE_URL
+        self.logger = logging.getLogger(self.__class__.__name__)
+        
+        blocker = ResourceBlocker.for_page(page)
+        if blocker:
+            blocker.use_policy(self.RESOURCE_POLICY)
+    
+    @timed_action("path")
+    async def navigate(self, path: str = ""):
+        """Navigate to a specific path."""
+        url = f"{self.base_url}{path}" if path else self.base_url
+        self.logger.info("Navigating to: %s", url)
+        await self.page.goto(url, wait_until="domcontentloaded")
+    
+    async def navigate_to_page(self):
+        """Open PAGE_URL, reusing the page already showing it when it resets cleanly."""
+        if not await self.reuse_loaded_page():
+            await self.navigate(self.PAGE_URL)
+    
+    async def reuse_loaded_page(self) -> bool:
+        """Reset the page in place if it already shows PAGE_URL (see the sync page)."""
+        if not self.is_loaded():
+            return False
+        try:
+            clean = await self.reset_page_state() and await self.is_page_clean()
+        except PlaywrightError as error:
+            self.logger.debug("Page reset failed: %s", error)
+            clean = False
+        if clean:
+            self.logger.info("Reusing loaded page: %s", self.page.url)
+        return clean
+    
+    def is_loaded(self) -> bool:
+        """Whether the page is already showing this page object's PAGE_URL."""
+        return SyncBasePage.is_loaded(self)
+    
+    async def reset_page_state(self) -> bool:
+        """Undo in place what a test did to the page; False if this page cannot."""
+        return False
+    
+    async def is_page_clean(self) -> bool:
+        """Whether the page looks exactly as after a fresh load."""
+        return False
+    
+    @timed_action(None)
+    async def wait_for_page_load(self, timeout: int = 30000):
+        """Wait for page to be fully loaded."""
+        await self.page.wait_for_load_state("networkidle", timeout=timeout)
+    
+    @timed_action()
+    async def click(self, selector: str, **kwargs):
+        """Click on element with optional parameters."""
+        self.logger.debug("Clicking element: %s", selector)
+        await self.page.click(selector, **kwargs)
+    
+    @timed_action()
+    async def fill(self, selector: str, text: str, **kwargs):
+        """Fill input field."""
+        self.logger.debug("Filling %s with: %s", selector, text)
+        await self.page.fill(selector, text, **kwargs)
+    
+    @timed_action(None)
+    async def fill_fields(self, values: Dict[str, str], mode: Optional[str] = None):
+        """Fill several fields at once (see the sync BasePage.fill_fields)."""
+        mode = mode or get_config().FILL_MODE
+        if mode not in FILL_MODES:
+            raise ValueError(f"Unknown fill mode: {mode}")
+        self.logger.debug("Filling %s fields (%s): %s", len(values), mode, list(values))
+        
+        if mode == "fast":
+            missing = await self.mutate([("setValue", selector, text) for selector, text in values.items()])
+            if missing:
+                raise ValueError(f"Fields not found: {missing}")
+        elif mode == "type":
+            for selector, text in values.items():
+                locator = self.page.locator(selector)
+                await locator.clear()
+                await locator.press_sequentially(text)
+        else:
+            for selector, text in values.items():
+                await self.fill(selector, text)
+    
+    @timed_action()
+    async def clear_and_fill(self, selector: str, text: str):
+        """Clear field and fill with text."""
+        await self.page.locator(selector).clear()
+        await self.fill(selector, text)
+    
+    @timed_action()
+    async def get_text(self, selector: str) -> str:
+        """Get text content of element."""
+        return await self.page.locator(selector).text_content() or ""
+    
+    @timed_action()
+    async def get_all_text(self, selector: str) -> List[str]:
+        """Get text content from all matching elements."""
+        return await self.page.locator(selector).all_text_contents()
+    
+    @timed_action()
+    async def get_attribute(self, selector: str, attribute: str) -> Optional[str]:
+        """Get attribute value from element."""
+        return await self.page.locator(selector).get_attribute(attribute)
+    
+    @timed_action()
+    async def get_element_state(self, selector: str) -> ElementState:
+        """Read the first matching element's state without waiting."""
+        return ElementState(**await self._element_helper(selector, "stateOf"))
+    
+    @timed_action(None)
+    async def get_element_states(self, selectors: Sequence[str]) -> List[ElementState]:
+        """Read the state of several elements in one round-trip (CSS selectors only)."""
+        return [ElementState(**state) for state in await self._helper("states", list(selectors))]
+    
+    @timed_action()
+    async def read_properties(self, selector: str, properties: Sequence[str], all: bool = False) -> Any:
+        """Read properties of the first match, or of every match (see the sync page)."""
+        return await self._element_helper(selector, "readOf", list(properties), all)
+    
+    @timed_action(None)
+    async def read_many(self, queries: Dict[str, Query]) -> Dict[str, Any]:
+        """Run several ``Query`` reads in one round-trip (CSS selectors only)."""
+        return await self._helper("query", {
+            key: {"selector": query.selector, "properties": list(query.properties), "all": query.all}
+            for key, query in queries.items()
+        })
+    
+    @timed_action(None)
+    async def mutate(self, operations: Sequence[Tuple]) -> List[str]:
+        """Apply ``(mutation, selector, *args)`` operations in one round-trip; returns selectors not found."""
+        return await self._helper("mutate", [list(operation) for operation in operations])
+    
+    def batch(self, timeout: int = 5000) -> ActionBatch:
+        """Start a batch of actions and reads; ``await batch.run()`` executes it in one round-trip."""
+        return ActionBatch(self.run_batch, timeout=timeout)
+    
+    @timed_action(None)
+    async def run_batch(self, batch: ActionBatch) -> BatchResult:
+        """Execute a batch's steps in the page; raises BatchError naming the step that failed."""
+        started = time.perf_counter()
+        outcome = await self._helper("batch", batch.payload(), batch.timeout)
+        result = batch.result(outcome, (time.perf_counter() - started) * 1000)
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(
+                "Ran %s batched steps in %.0f ms: %s", len(batch), result.elapsed_ms,
+                ", ".join(f"{timing.step} {timing.duration_ms:.0f} ms" for timing in result.steps)
+            )
+        return result
+    
+    async def _helper(self, name: str, *args) -> Any:
+        """Call a bulk helper of the in-page runtime, installing it if this document lacks it."""
+        result = await self.page.evaluate(CALL_HELPER_SCRIPT, [name, list(args)])
+        if result is None:
+            await self.page.evaluate(RUNTIME_SCRIPT)
+            result = await self.page.evaluate(CALL_HELPER_SCRIPT, [name, list(args)])
+        return result["value"]
+    
+    async def _element_helper(self, selector: str, name: str, *args) -> Any:
+        """Call an element helper of the in-page runtime on a selector's matches."""
+        locator = self.page.locator(selector)
+        result = await locator.evaluate_all(CALL_ELEMENT_HELPER_SCRIPT, [name, list(args)])
+        if result is None:
+            await self.page.evaluate(RUNTIME_SCRIPT)
+            result = await locator.evaluate_all(CALL_ELEMENT_HELPER_SCRIPT, [name, list(args)])
+        return result["value"]
+    
+    @timed_action()
+    async def is_visible(self, selector: str) -> bool:
+        """Check if element is visible right now, without waiting (see wait_until_visible)."""
+        return (await self.get_element_state(selector)).visible
+    
+    @timed_action()
+    async def is_enabled(self, selector: str) -> bool:
+        """Check if element is enabled."""
+        return await self.page.locator(selector).is_enabled()
+    
+    @timed_action()
+    async def is_checked(self, selector: str) -> bool:
+        """Check if checkbox/radio is checked."""
+        return await self.page.locator(selector).is_checked()
+    
+    @timed_action()
+    async def wait_until_visible(self, selector: str, timeout: int = 5000) -> bool:
+        """Wait for element to become visible; False if the timeout expires."""
+        return await self._wait_until(selector, "visible", timeout)
+    
+    @timed_action()
+    async def wait_until_hidden(self, selector: str, timeout: int = 5000) -> bool:
+        """Wait for element to become hidden; False if the timeout expires."""
+        return await self._wait_until(selector, "hidden", timeout)
+    
+    @timed_action()
+    async def wait_until_enabled(self, selector: str, timeout: int = 5000) -> bool:
+        """Wait for element to become enabled; False if the timeout expires."""
+        try:
+            with self._track_wait("wait_until_enabled", selector, timeout):
+                await expect(self.page.locator(selector).first).to_be_enabled(timeout=timeout)
+            return True
+        except AssertionError:
+            return False
+    
+    async def _wait_until(self, selector: str, state: str, timeout: int) -> bool:
+        try:
+            with self._track_wait(f"wait_until_{state}", selector, timeout):
+                await self.page.locator(selector).first.wait_for(state=state, timeout=timeout)
+            return True
+        except PlaywrightTimeoutError:
+            return False
+    
+    @contextmanager
+    def _track_wait(self, method: str, selector: str, timeout: int):
+        """Record the wall time of a wait whose timeout expires."""
+        started = time.perf_counter()
+        try:
+            yield
+        except (PlaywrightTimeoutError, AssertionError):
+            elapsed_ms = (time.perf_counter() - started) * 1000
+            wait_report.record(self.__class__.__name__, method, selector, timeout, elapsed_ms)
+            raise
+    
+    @timed_action()
+    async def wait_for_selector(self, selector: str, timeout: int = 30000):
+        """Wait for selector to appear."""
+        with self._track_wait("wait_for_selector", selector, timeout):
+            await self.page.wait_for_selector(selector, timeout=timeout)
+    
+    @timed_action()
+    async def wait_for_element_visible(self, selector: str, timeout: int = 30000):
+        """Wait for element to be visible."""
+        with self._track_wait("wait_for_element_visible", selector, timeout):
+            await self.page.locator(selector).wait_for(state="visible", timeout=timeout)
+    
+    @timed_action()
+    async def wait_for_element_hidden(self, selector: str, timeout: int = 30000):
+        """Wait for element to be hidden."""
+        with self._track_wait("wait_for_element_hidden", selector, timeout):
+            await self.page.locator(selector).wait_for(state="hidden", timeout=timeout)
+    
+    @timed_action()
+    async def scroll_to_element(self, selector: str):
+        """Scroll element into view."""
+        await self.page.locator(selector).scroll_into_view_if_needed()
+    
+    def get_locator(self, selector: str) -> Locator:
+        """Get Playwright locator object."""
+        return self.page.locator(selector)
+    
+    @timed_action(None)
+    async def take_screenshot(
+        self,
+        filename: str,
+        full_page: Optional[bool] = None,
+        image_type: Optional[str] = None,
+        quality: Optional[int] = None,
+    ) -> "Future[Path]":
+        """Take screenshot of current page; the file is written in the background.
+        
+        Defaults come from the SCREENSHOT_* settings. The suffix of
+        ``filename`` is replaced to match the image format. Returns a future
+        resolving to the written path (or an identical earlier screenshot).
+        """
+        options = capture_options(get_config(), full_page, image_type, quality)
+        data = await self.page.screenshot(**options)
+        return screenshot_writer.submit(data, Path(filename).with_suffix(extension(options)))
+    
+    @timed_action(None)
+    async def get_page_title(self) -> str:
+        """Get page title."""
+        return await self.page.title()
+    
+    def get_current_url(self) -> str:
+        """Get current page URL."""
+        return self.page.url
+    
+    @timed_action()
+    async def hover(self, selector: str):
+        """Hover over element."""
+        await self.page.locator(selector).hover()
+    
+    @timed_action()
+    async def double_click(self, selector: str):
+        """Double click on element."""
+        await self.page.locator(selector).dblclick()
+    
+    @timed_action()
+    async def right_click(self, selector: str):
+        """Right click on element."""
+        await self.page.locator(selector).click(button="right")
+    
+    @timed_action()
+    async def select_option(self, selector: str, value: str):
+        """Select option from dropdown."""
+        await self.page.locator(selector).select_option(value)
+    
+    @timed_action()
+    async def upload_file(self, selector: str, file_path: str):
+        """Upload file to input element."""
+        await self.page.locator(selector).set_input_files(file_path)
+    
+    @timed_action("key")
+    async def press_key(self, key: str):
+        """Press keyboard key."""
+        await self.page.keyboard.press(key)
+    
+    @timed_action(None)
+    async def execute_script(self, script: str, arg=None):
+        """Execute JavaScript, optionally passing it an argument."""
+        return await self.page.evaluate(script, arg)
+    
+    @timed_action()
+    async def remove_element(self, selector: str):
+        """Remove the first element matching a selector."""
+        await self._element_helper(selector, "mutateOf", "remove", [], False)
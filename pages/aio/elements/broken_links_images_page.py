@@ -0,0 +1,96 @@
+"""Async page object for Broken Links - Images page."""
+from pages.aio.base_page import BasePage, shares_locators
+from pages.elements.broken_links_images_page import BrokenLinksImagesPage as SyncBrokenLinksImagesPage
+from playwright.async_api import Page
+from utils.har_archive import HarRouter
+from utils.link_scanner import COLLECT_TARGETS_SCRIPT, LinkScanner, ScanReport
+import asyncio
+import time
+
+
+@shares_locators(SyncBrokenLinksImagesPage)
+class BrokenLinksImagesPage(BasePage):
+    """Async page object for DemoQA Broken Links - Images page."""
+    
+    def __init__(self, page: Page):
+        super().__init__(page)
+    
+    async def navigate_to_page(self):
+        """Navigate to Broken Links - Images page."""
+        await self.navigate(self.PAGE_URL)
+    
+    async def is_valid_image_displayed(self) -> bool:
+        """Check if valid image is displayed."""
+        return await self.is_visible(self.VALID_IMAGE)
+    
+    async def is_broken_image_displayed(self) -> bool:
+        """Check if broken image element exists (will have broken src)."""
+        return await self.is_visible(self.BROKEN_IMAGE)
+    
+    async def get_valid_image_src(self) -> str:
+        """Get valid image source."""
+        return await self.get_attribute(self.VALID_IMAGE, "src") or ""
+    
+    async def get_broken_image_src(self) -> str:
+        """Get broken image source."""
+        return await self.get_attribute(self.BROKEN_IMAGE, "src") or ""
+    
+    async def get_image_natural_width(self, selector: str) -> int:
+        """Get natural width of image (0 if broken or missing)."""
+        image = await self.read_properties(selector, ["naturalWidth"])
+        return (image or {}).get("naturalWidth") or 0
+    
+    async def is_image_broken(self, selector: str) -> bool:
+        """Check if image is broken by checking natural width."""
+        return await self.get_image_natural_width(selector) == 0
+    
+    async def click_valid_link(self):
+        """Click valid link."""
+        self.logger.info("Clicking valid link")
+        await self.click(self.VALID_LINK)
+    
+    async def click_broken_link(self):
+        """Click broken link."""
+        self.logger.info("Clicking broken link")
+        await self.click(self.BROKEN_LINK)
+    
+    async def get_valid_link_href(self) -> str:
+        """Get valid link href."""
+        return await self.get_attribute(self.VALID_LINK, "href") or ""
+    
+    async def get_broken_link_href(self) -> str:
+        """Get broken link href."""
+        return await self.get_attribute(self.BROKEN_LINK, "href") or ""
+    
+    async def check_link_status(self, url: str) -> int:
+        """Check HTTP status code of a URL."""
+        self.logger.info("Checking status of URL: %s", url)
+        router = HarRouter.for_page(self.page)
+        response = await router.fetch_async(self.page.request, url) if router else await self.page.request.get(url)
+        return response.status
+    
+    async def scan_links(self, scanner: LinkScanner) -> ScanReport:
+        """Check every link and image on the page concurrently.
+        
+        The scanner blocks while it checks, so it runs in a worker thread to
+        keep this event loop free for other pages.
+        """
+        started = time.perf_counter()
+        targets = await self.page.evaluate(
+            COLLECT_TARGETS_SCRIPT, {"links": self.ALL_LINKS, "images": self.ALL_IMAGES}
+        )
+        return await asyncio.to_thread(scanner.report, self.page.url, targets, started)
+    
+    async def is_valid_link_working(self) -> bool:
+        """Check if valid link returns 200 status."""
+        href = await self.get_valid_link_href()
+        if href:
+            return await self.check_link_status(href) == 200
+        return False
+    
+    async def is_broken_link_broken(self) -> bool:
+        """Check if broken link returns error status (not 200)."""
+        href = await self.get_broken_link_href()
+        if href:
+            return await self.check_link_status(href) != 200
+        return False
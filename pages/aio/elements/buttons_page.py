@@ -0,0 +1,76 @@
+"""Async page object for Buttons page."""
+from pages.aio.base_page import BasePage, shares_locators
+from pages.elements.buttons_page import ButtonsPage as SyncButtonsPage
+from playwright.async_api import Page
+from typing import Dict
+
+
+@shares_locators(SyncButtonsPage)
+class ButtonsPage(BasePage):
+    """Async page object for DemoQA Buttons page."""
+    
+    def __init__(self, page: Page):
+        super().__init__(page)
+    
+    async def navigate_to_page(self):
+        """Navigate to Buttons page."""
+        await self.navigate(self.PAGE_URL)
+    
+    async def click_all_buttons(self) -> Dict[str, str]:
+        """Double, right and dynamic click in one round-trip; returns the three messages."""
+        self.logger.info("Clicking all buttons in one batch")
+        return (await SyncButtonsPage._queue_all_clicks(self.batch()).run()).reads
+    
+    async def double_click_button(self):
+        """Perform double click on double click button."""
+        self.logger.info("Double clicking on button")
+        await self.double_click(self.DOUBLE_CLICK_BUTTON)
+    
+    async def right_click_button(self):
+        """Perform right click on right click button."""
+        self.logger.info("Right clicking on button")
+        await self.right_click(self.RIGHT_CLICK_BUTTON)
+    
+    async def click_dynamic_button(self):
+        """Click on dynamic click me button."""
+        self.logger.info("Clicking on dynamic button")
+        await self.click(self.DYNAMIC_CLICK_BUTTON)
+    
+    async def get_double_click_message(self) -> str:
+        """Get double click message text, or "" if it is not shown right now."""
+        state = await self.get_element_state(self.DOUBLE_CLICK_MESSAGE)
+        return state.text if state.visible else ""
+    
+    async def get_right_click_message(self) -> str:
+        """Get right click message text, or "" if it is not shown right now."""
+        state = await self.get_element_state(self.RIGHT_CLICK_MESSAGE)
+        return state.text if state.visible else ""
+    
+    async def get_dynamic_click_message(self) -> str:
+        """Get dynamic click message text, or "" if it is not shown right now."""
+        state = await self.get_element_state(self.DYNAMIC_CLICK_MESSAGE)
+        return state.text if state.visible else ""
+    
+    async def is_double_click_message_displayed(self) -> bool:
+        """Check if double click message is displayed right now."""
+        return await self.is_visible(self.DOUBLE_CLICK_MESSAGE)
+    
+    async def wait_until_double_click_message_displayed(self, timeout: int = 2000) -> bool:
+        """Wait for the double click message to appear; False if the timeout expires."""
+        return await self.wait_until_visible(self.DOUBLE_CLICK_MESSAGE, timeout=timeout)
+    
+    async def is_right_click_message_displayed(self) -> bool:
+        """Check if right click message is displayed right now."""
+        return await self.is_visible(self.RIGHT_CLICK_MESSAGE)
+    
+    async def wait_until_right_click_message_displayed(self, timeout: int = 2000) -> bool:
+        """Wait for the right click message to appear; False if the timeout expires."""
+        return await self.wait_until_visible(self.RIGHT_CLICK_MESSAGE, timeout=timeout)
+    
+    async def is_dynamic_click_message_displayed(self) -> bool:
+        """Check if dynamic click message is displayed right now."""
+        return await self.is_visible(self.DYNAMIC_CLICK_MESSAGE)
+    
+    async def wait_until_dynamic_click_message_displayed(self, timeout: int = 2000) -> bool:
+        """Wait for the dynamic click message to appear; False if the timeout expires."""
+        return await self.wait_until_visible(self.DYNAMIC_CLICK_MESSAGE, timeout=timeout)
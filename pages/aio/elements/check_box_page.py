@@ -0,0 +1,55 @@
+"""Async page object for Check Box page."""
+from pages.aio.base_page import BasePage, shares_locators
+from pages.elements.check_box_page import CheckBoxPage as SyncCheckBoxPage
+from playwright.async_api import Page
+from typing import List
+
+
+@shares_locators(SyncCheckBoxPage)
+class CheckBoxPage(BasePage):
+    """Async page object for DemoQA Check Box page."""
+    
+    def __init__(self, page: Page):
+        super().__init__(page)
+    
+    async def navigate_to_page(self):
+        """Navigate to Check Box page."""
+        await self.navigate(self.PAGE_URL)
+    
+    async def click_expand_all(self):
+        """Click Expand All button."""
+        self.logger.info("Clicking Expand All button")
+        await self.click(self.EXPAND_ALL_BUTTON)
+    
+    async def click_collapse_all(self):
+        """Click Collapse All button."""
+        self.logger.info("Clicking Collapse All button")
+        await self.click(self.COLLAPSE_ALL_BUTTON)
+    
+    async def click_home_checkbox(self):
+        """Click Home checkbox."""
+        self.logger.info("Clicking Home checkbox")
+        await self.click(self.HOME_CHECKBOX)
+    
+    async def click_checkbox_by_label(self, label: str):
+        """Click checkbox by its label text."""
+        self.logger.info("Clicking checkbox: %s", label)
+        checkbox_selector = f"label[for='tree-node-{label.lower()}'] .rct-checkbox"
+        await self.click(checkbox_selector)
+    
+    async def get_selected_items(self) -> List[str]:
+        """Get list of selected checkbox items."""
+        if not await self.is_visible(self.RESULT_TEXT):
+            return []
+        return await self.get_all_text(self.RESULT_TEXT)
+    
+    async def is_checkbox_checked(self, checkbox_label: str) -> bool:
+        """Check if a specific checkbox is checked."""
+        checkbox_selector = f"label[for='tree-node-{checkbox_label.lower()}'] input"
+        return await self.is_checked(checkbox_selector)
+    
+    async def get_result_text(self) -> str:
+        """Get the result text displayed."""
+        if not await self.is_visible(self.RESULT_TEXT):
+            return ""
+        return await self.get_text("#result")
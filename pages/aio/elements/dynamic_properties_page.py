@@ -0,0 +1,90 @@
+"""Async page object for Dynamic Properties page."""
+from pages.aio.base_page import BasePage, shares_locators
+from pages.elements.dynamic_properties_page import DynamicPropertiesPage as SyncDynamicPropertiesPage
+from playwright.async_api import Page, expect
+from config.base_config import get_config
+
+
+@shares_locators(SyncDynamicPropertiesPage)
+class DynamicPropertiesPage(BasePage):
+    """Async page object for DemoQA Dynamic Properties page."""
+    
+    def __init__(self, page: Page, virtual_clock: bool = None):
+        super().__init__(page)
+        self.virtual_clock = get_config().VIRTUAL_CLOCK if virtual_clock is None else virtual_clock
+        self._clock_installed = False
+        self._timers_elapsed = False
+    
+    async def navigate_to_page(self):
+        """Navigate to Dynamic Properties page."""
+        if self.virtual_clock:
+            await self.install_virtual_clock()
+        await self.navigate(self.PAGE_URL)
+        self._timers_elapsed = False
+    
+    async def install_virtual_clock(self):
+        """Replace the page's timers with Playwright's controllable clock.
+        
+        Must run before navigation so the page's setTimeout calls are captured.
+        """
+        if self._clock_installed:
+            return
+        self.logger.info("Installing virtual clock")
+        await self.page.clock.install()
+        self._clock_installed = True
+    
+    async def fast_forward_timers(self):
+        """Fire the page's 5-second timers now when the virtual clock is on."""
+        if self.virtual_clock and not self._timers_elapsed:
+            await self.page.clock.run_for(self.TIMER_DELAY_MS)
+            self._timers_elapsed = True
+    
+    async def is_random_id_text_visible(self) -> bool:
+        """Check if random ID text is visible."""
+        return await self.is_visible(self.RANDOM_ID_TEXT)
+    
+    async def get_random_id_text(self) -> str:
+        """Get random ID text content."""
+        return await self.get_text(self.RANDOM_ID_TEXT)
+    
+    async def is_enable_after_button_enabled(self, timeout: int = 5000) -> bool:
+        """Check if 'Enable After 5 Seconds' button is enabled."""
+        await self.fast_forward_timers()
+        return await self.wait_until_enabled(self.ENABLE_AFTER_BUTTON, timeout=timeout)
+    
+    async def click_enable_after_button(self):
+        """Click 'Enable After 5 Seconds' button."""
+        self.logger.info("Clicking Enable After button")
+        await self.fast_forward_timers()
+        await expect(self.page.locator(self.ENABLE_AFTER_BUTTON)).to_be_enabled(timeout=6000)
+        await self.click(self.ENABLE_AFTER_BUTTON)
+    
+    async def get_color_change_button_color(self) -> str:
+        """Get the color of the color change button."""
+        return await self.get_attribute(self.COLOR_CHANGE_BUTTON, "class") or ""
+    
+    async def wait_for_color_change(self, timeout: int = 5000):
+        """Wait for color change button to change color."""
+        await self.fast_forward_timers()
+        await self.wait_for_selector(f"{self.COLOR_CHANGE_BUTTON}.text-danger", timeout=timeout)
+    
+    async def is_color_changed(self) -> bool:
+        """Check if color has changed (contains text-danger class)."""
+        return "text-danger" in await self.get_color_change_button_color()
+    
+    async def is_visible_after_button_visible(self, timeout: int = 5000) -> bool:
+        """Wait up to timeout for the 'Visible After 5 Seconds' button; False if it stays hidden."""
+        await self.fast_forward_timers()
+        return await self.wait_until_visible(self.VISIBLE_AFTER_BUTTON, timeout=timeout)
+    
+    async def wait_for_visible_after_button(self, timeout: int = 6000):
+        """Wait for 'Visible After 5 Seconds' button to appear."""
+        self.logger.info("Waiting for Visible After button")
+        await self.fast_forward_timers()
+        await self.wait_for_element_visible(self.VISIBLE_AFTER_BUTTON, timeout=timeout)
+    
+    async def click_visible_after_button(self):
+        """Click 'Visible After 5 Seconds' button."""
+        self.logger.info("Clicking Visible After button")
+        await self.wait_for_visible_after_button()
+        await self.click(self.VISIBLE_AFTER_BUTTON)
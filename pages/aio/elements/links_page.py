@@ -0,0 +1,74 @@
+"""Async page object for Links page."""
+from pages.aio.base_page import BasePage, shares_locators
+from pages.elements.links_page import LinksPage as SyncLinksPage
+from playwright.async_api import Page
+
+
+@shares_locators(SyncLinksPage)
+class LinksPage(BasePage):
+    """Async page object for DemoQA Links page."""
+    
+    def __init__(self, page: Page):
+        super().__init__(page)
+    
+    async def navigate_to_page(self):
+        """Navigate to Links page."""
+        await self.navigate(self.PAGE_URL)
+    
+    async def click_home_link(self):
+        """Click Home link (opens new tab)."""
+        self.logger.info("Clicking Home link")
+        await self.click(self.HOME_LINK)
+    
+    async def click_dynamic_home_link(self):
+        """Click dynamic Home link (opens new tab)."""
+        self.logger.info("Clicking Dynamic Home link")
+        await self.click(self.DYNAMIC_HOME_LINK)
+    
+    async def click_created_link(self):
+        """Click Created link (API call)."""
+        self.logger.info("Clicking Created link")
+        await self.click(self.CREATED_LINK)
+    
+    async def click_no_content_link(self):
+        """Click No Content link (API call)."""
+        self.logger.info("Clicking No Content link")
+        await self.click(self.NO_CONTENT_LINK)
+    
+    async def click_moved_link(self):
+        """Click Moved link (API call)."""
+        self.logger.info("Clicking Moved link")
+        await self.click(self.MOVED_LINK)
+    
+    async def click_bad_request_link(self):
+        """Click Bad Request link (API call)."""
+        self.logger.info("Clicking Bad Request link")
+        await self.click(self.BAD_REQUEST_LINK)
+    
+    async def click_unauthorized_link(self):
+        """Click Unauthorized link (API call)."""
+        self.logger.info("Clicking Unauthorized link")
+        await self.click(self.UNAUTHORIZED_LINK)
+    
+    async def click_forbidden_link(self):
+        """Click Forbidden link (API call)."""
+        self.logger.info("Clicking Forbidden link")
+        await self.click(self.FORBIDDEN_LINK)
+    
+    async def click_not_found_link(self):
+        """Click Not Found link (API call)."""
+        self.logger.info("Clicking Not Found link")
+        await self.click(self.NOT_FOUND_LINK)
+    
+    async def get_response_message(self) -> str:
+        """Get API response message."""
+        await self.wait_for_element_visible(self.LINK_RESPONSE, timeout=5000)
+        return await self.get_text(self.LINK_RESPONSE)
+    
+    async def is_response_displayed(self) -> bool:
+        """Check if response message is displayed, waiting up to 5 s for it."""
+        return await self.wait_until_visible(self.LINK_RESPONSE, timeout=5000)
+    
+    async def get_link_href(self, selector: str) -> str:
+        """Get href attribute of a link."""
+        return await self.get_attribute(selector, "href") or ""
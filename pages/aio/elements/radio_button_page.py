@@ -0,0 +1,56 @@
+"""Async page object for Radio Button page."""
+from pages.aio.base_page import BasePage, shares_locators
+from pages.elements.radio_button_page import RadioButtonPage as SyncRadioButtonPage
+from playwright.async_api import Page
+
+
+@shares_locators(SyncRadioButtonPage)
+class RadioButtonPage(BasePage):
+    """Async page object for DemoQA Radio Button page."""
+    
+    def __init__(self, page: Page):
+        super().__init__(page)
+    
+    async def navigate_to_page(self):
+        """Navigate to Radio Button page."""
+        await self.navigate(self.PAGE_URL)
+    
+    async def select_yes(self):
+        """Select Yes radio button."""
+        self.logger.info("Selecting Yes radio button")
+        await self.click(self.YES_RADIO)
+    
+    async def select_impressive(self):
+        """Select Impressive radio button."""
+        self.logger.info("Selecting Impressive radio button")
+        await self.click(self.IMPRESSIVE_RADIO)
+    
+    async def select_no(self):
+        """Select No radio button."""
+        self.logger.info("Attempting to select No radio button")
+        # Note: This button is disabled in the actual application
+        if await self.is_enabled(self.NO_RADIO_INPUT):
+            await self.click(self.NO_RADIO)
+        else:
+            self.logger.warning("No radio button is disabled")
+    
+    async def is_yes_selected(self) -> bool:
+        """Check if Yes radio is selected."""
+        return await self.is_checked(self.YES_RADIO_INPUT)
+    
+    async def is_impressive_selected(self) -> bool:
+        """Check if Impressive radio is selected."""
+        return await self.is_checked(self.IMPRESSIVE_RADIO_INPUT)
+    
+    async def is_no_enabled(self) -> bool:
+        """Check if No radio button is enabled."""
+        return await self.is_enabled(self.NO_RADIO_INPUT)
+    
+    async def get_result_text(self) -> str:
+        """Get the result text displayed, or "" if none is shown right now."""
+        state = await self.get_element_state(self.SUCCESS_TEXT)
+        return state.text if state.visible else ""
+    
+    async def is_result_displayed(self) -> bool:
+        """Check if result is displayed."""
+        return await self.is_visible(self.RESULT_TEXT)
@@ -0,0 +1,109 @@
+"""Async page object for Text Box page."""
+from pages.aio.base_page import BasePage, shares_locators
+from pages.elements.text_box_page import TextBoxPage as SyncTextBoxPage
+from playwright.async_api import Page
+from typing import Optional
+
+
+@shares_locators(SyncTextBoxPage)
+class TextBoxPage(BasePage):
+    """Async page object for DemoQA Text Box page."""
+    
+    def __init__(self, page: Page):
+        super().__init__(page)
+    
+    async def navigate_to_page(self):
+        """Navigate to Text Box page."""
+        await super().navigate_to_page()
+        await self.scroll_to_element(self.FULL_NAME_INPUT)
+    
+    async def reset_page_state(self) -> bool:
+        """Empty the fields and submit the empty form, which clears the output and the email error."""
+        return not await self.mutate(SyncTextBoxPage._reset_operations())
+    
+    async def is_page_clean(self) -> bool:
+        """Whether the form is empty, without an email error or output lines."""
+        return SyncTextBoxPage._is_clean(await self.read_many(SyncTextBoxPage._clean_queries()))
+    
+    async def fill_full_name(self, name: str):
+        """Fill full name field."""
+        self.logger.info("Filling full name: %s", name)
+        await self.fill(self.FULL_NAME_INPUT, name)
+    
+    async def fill_email(self, email: str):
+        """Fill email field."""
+        self.logger.info("Filling email: %s", email)
+        await self.fill(self.EMAIL_INPUT, email)
+    
+    async def fill_current_address(self, address: str):
+        """Fill current address field."""
+        self.logger.info("Filling current address: %s", address)
+        await self.fill(self.CURRENT_ADDRESS_TEXTAREA, address)
+    
+    async def fill_permanent_address(self, address: str):
+        """Fill permanent address field."""
+        self.logger.info("Filling permanent address: %s", address)
+        await self.fill(self.PERMANENT_ADDRESS_TEXTAREA, address)
+    
+    async def click_submit(self):
+        """Click submit button."""
+        self.logger.info("Clicking submit button")
+        await self.scroll_to_element(self.SUBMIT_BUTTON)
+        await self.click(self.SUBMIT_BUTTON)
+    
+    async def submit_form(self, full_name: str, email: str, current_address: str, permanent_address: str,
+                          fill_mode: Optional[str] = None):
+        """Fill and submit the complete form."""
+        self.logger.info("Filling text box form for: %s", full_name)
+        await self.fill_fields({
+            self.FULL_NAME_INPUT: full_name,
+            self.EMAIL_INPUT: email,
+            self.CURRENT_ADDRESS_TEXTAREA: current_address,
+            self.PERMANENT_ADDRESS_TEXTAREA: permanent_address
+        }, mode=fill_mode)
+        await self.click_submit()
+    
+    async def submit_form_and_read(self, full_name: str, email: str, current_address: str,
+                                   permanent_address: str) -> dict:
+        """Fill, submit and read the output in one round-trip (see the sync page)."""
+        self.logger.info("Submitting text box form in one batch for: %s", full_name)
+        batch = SyncTextBoxPage._queue_submit(self.batch(), full_name, email, current_address, permanent_address)
+        return SyncTextBoxPage._output_data((await batch.run()).reads)
+    
+    async def is_output_displayed(self) -> bool:
+        """Check if the output shows at least one submitted value."""
+        return await self.is_visible(self.OUTPUT_LINES)
+    
+    async def get_output_name(self) -> str:
+        """Get output name text."""
+        return (await self.get_text(self.OUTPUT_NAME)).replace("Name:", "").strip()
+    
+    async def get_output_email(self) -> str:
+        """Get output email text."""
+        return (await self.get_text(self.OUTPUT_EMAIL)).replace("Email:", "").strip()
+    
+    async def get_output_current_address(self) -> str:
+        """Get output current address text."""
+        text = await self.get_text(self.OUTPUT_CURRENT_ADDRESS)
+        return text.replace("Current Address :", "").strip()
+    
+    async def get_output_permanent_address(self) -> str:
+        """Get output permanent address text."""
+        text = await self.get_text(self.OUTPUT_PERMANENT_ADDRESS)
+        return text.replace("Permananet Address :", "").strip()
+    
+    async def get_all_output_data(self) -> dict:
+        """Get all output data as dictionary."""
+        return {
+            "name": await self.get_output_name(),
+            "email": await self.get_output_email(),
+            "current_address": await self.get_output_current_address(),
+            "permanent_address": await self.get_output_permanent_address()
+        }
+    
+    async def clear_all_fields(self):
+        """Clear all input fields."""
+        await self.page.locator(self.FULL_NAME_INPUT).clear()
+        await self.page.locator(self.EMAIL_INPUT).clear()
+        await self.page.locator(self.CURRENT_ADDRESS_TEXTAREA).clear()
+        await self.page.locator(self.PERMANENT_ADDRESS_TEXTAREA).clear()
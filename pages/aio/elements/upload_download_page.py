@@ -0,0 +1,65 @@
+"""Async page object for Upload and Download page."""
+from pages.aio.base_page import BasePage, shares_locators
+from pages.elements.upload_download_page import UploadDownloadPage as SyncUploadDownloadPage
+from playwright.async_api import Page
+import os
+
+
+@shares_locators(SyncUploadDownloadPage)
+class UploadDownloadPage(BasePage):
+    """Async page object for DemoQA Upload and Download page."""
+    
+    def __init__(self, page: Page):
+        super().__init__(page)
+    
+    async def navigate_to_page(self):
+        """Navigate to Upload and Download page."""
+        await self.navigate(self.PAGE_URL)
+    
+    async def click_download_button(self):
+        """Click download button."""
+        self.logger.info("Clicking download button")
+        await self.click(self.DOWNLOAD_BUTTON)
+    
+    async def download_file(self, download_path: str = None) -> str:
+        """Download file and return the path."""
+        self.logger.info("Starting file download")
+        
+        async with self.page.expect_download() as download_info:
+            await self.click_download_button()
+        
+        download = await download_info.value
+        
+        if download_path:
+            file_path = os.path.join(download_path, download.suggested_filename)
+            await download.save_as(file_path)
+        else:
+            file_path = str(await download.path())
+        self.logger.info("File downloaded to: %s", file_path)
+        return file_path
+    
+    async def upload_file(self, file_path: str):
+        """Upload a file."""
+        self.logger.info("Uploading file: %s", file_path)
+        
+        if not os.path.exists(file_path):
+            raise FileNotFoundError(f"File not found: {file_path}")
+        
+        await super().upload_file(self.UPLOAD_FILE_INPUT, file_path)
+    
+    async def get_uploaded_file_path(self) -> str:
+        """Get the uploaded file path text."""
+        await self.wait_for_element_visible(self.UPLOADED_FILE_PATH, timeout=5000)
+        return await self.get_text(self.UPLOADED_FILE_PATH)
+    
+    async def get_uploaded_file_name(self) -> str:
+        """Get just the file name from uploaded file path."""
+        full_path = await self.get_uploaded_file_path()
+        # Extract filename from "C:\fakepath\filename.ext"
+        if full_path:
+            return full_path.split("\\")[-1]
+        return ""
+    
+    async def is_upload_successful(self) -> bool:
+        """Check if file upload was successful, waiting up to 5 s for the result."""
+        return await self.wait_until_visible(self.UPLOADED_FILE_PATH, timeout=5000)
@@ -0,0 +1,206 @@
+"""Async page object for Web Tables page."""
+from pages.aio.base_page import BasePage, shares_locators
+from pages.elements.web_tables_page import (
+    WebTablesPage as SyncWebTablesPage,
+    TableRow,
+    SeedReport,
+    EXTRACT_TABLE_SCRIPT,
+    COUNT_ROWS_SCRIPT,
+    COUNT_ALL_ROWS_SCRIPT,
+    SEED_RECORDS_SCRIPT,
+    RESET_TABLE_SCRIPT,
+    TABLE_CONTROLS_SCRIPT,
+)
+from playwright.async_api import Page
+from typing import List, Dict, Optional, Sequence, Union
+import time
+
+
+@shares_locators(SyncWebTablesPage)
+class WebTablesPage(BasePage):
+    """Async page object for DemoQA Web Tables page."""
+    
+    def __init__(self, page: Page):
+        super().__init__(page)
+    
+    async def navigate_to_page(self):
+        """Navigate to Web Tables page."""
+        await super().navigate_to_page()
+    
+    async def reset_page_state(self) -> bool:
+        """Delete added rows and undo search, paging and an open form (see the sync page)."""
+        return await self.page.evaluate(RESET_TABLE_SCRIPT, SyncWebTablesPage._reset_arguments())
+    
+    async def is_page_clean(self) -> bool:
+        """Whether the table shows exactly the default rows with default controls."""
+        controls = await self.page.evaluate(TABLE_CONTROLS_SCRIPT, SyncWebTablesPage._control_selectors())
+        return SyncWebTablesPage._is_default_state(controls, await self.get_table_rows())
+    
+    async def click_add_button(self):
+        """Click Add button to open registration form."""
+        self.logger.info("Clicking Add button")
+        await self.click(self.ADD_BUTTON)
+        await self.wait_for_element_visible(self.REGISTRATION_FORM)
+    
+    async def fill_registration_form(self, first_name: str, last_name: str, email: str,
+                                     age: str, salary: str, department: str, fill_mode: Optional[str] = None):
+        """Fill the registration form with provided data."""
+        self.logger.info("Filling registration form")
+        await self.fill_fields({
+            self.FIRST_NAME_INPUT: first_name,
+            self.LAST_NAME_INPUT: last_name,
+            self.EMAIL_INPUT: email,
+            self.AGE_INPUT: age,
+            self.SALARY_INPUT: salary,
+            self.DEPARTMENT_INPUT: department
+        }, mode=fill_mode)
+    
+    async def click_submit(self):
+        """Click submit button in form."""
+        self.logger.info("Clicking submit button")
+        await self.click(self.SUBMIT_BUTTON)
+    
+    async def add_new_record(self, first_name: str, last_name: str, email: str,
+                             age: str, salary: str, department: str, fill_mode: Optional[str] = None):
+        """Add a new record to the table."""
+        await self.click_add_button()
+        await self.fill_registration_form(first_name, last_name, email, age, salary, department, fill_mode)
+        await self.click_submit()
+    
+    async def add_records(self, records: Sequence[Union[Dict[str, str], TableRow]],
+                          batch_size: int = 100, timeout: int = 5000) -> SeedReport:
+        """Seed many records through the registration modal (see the sync add_records)."""
+        payload = [
+            [[selector, str(record[name])] for name, selector in self.FORM_FIELDS.items()]
+            for record in (
+                row.to_dict() if isinstance(row, TableRow) else row for row in records
+            )
+        ]
+        selectors = {
+            "add": self.ADD_BUTTON,
+            "submit": self.SUBMIT_BUTTON,
+            "form": self.REGISTRATION_FORM,
+            "close": self.CLOSE_BUTTON
+        }
+        
+        rows_before = await self.get_total_row_count()
+        added = 0
+        started = time.perf_counter()
+        for start in range(0, len(payload), batch_size):
+            result = await self.page.evaluate(SEED_RECORDS_SCRIPT, {
+                "records": payload[start:start + batch_size],
+                "selectors": selectors,
+                "timeout": timeout
+            })
+            added += result["added"]
+            if result["failed"] is not None:
+                raise ValueError(
+                    f"Record {start + result['failed']} not added: {result['reason']}"
+                )
+        elapsed = time.perf_counter() - started
+        
+        report = SeedReport(
+            requested=len(payload),
+            added=added,
+            rows_before=rows_before,
+            rows_after=await self.get_total_row_count(),
+            elapsed_s=elapsed
+        )
+        self.logger.info(
+            "Seeded %s records in %.2fs (%.0f records/s, %.1f ms/record)",
+            report.added, report.elapsed_s, report.records_per_second, report.ms_per_record,
+        )
+        if report.rows_after != rows_before + added:
+            raise RuntimeError(
+                f"Expected {rows_before + added} rows after seeding, found {report.rows_after}"
+            )
+        return report
+    
+    async def search(self, search_term: str):
+        """Search in the table."""
+        self.logger.info("Searching for: %s", search_term)
+        await self.fill(self.SEARCH_BOX, search_term)
+    
+    async def clear_search(self):
+        """Clear search box."""
+        await self.page.locator(self.SEARCH_BOX).clear()
+    
+    async def get_table_rows(self) -> List[TableRow]:
+        """Get all non-empty table rows as typed records in one round-trip."""
+        result = await self.page.locator(self.TABLE_ROWS).evaluate_all(
+            EXTRACT_TABLE_SCRIPT,
+            {"headers": self.TABLE_HEADERS, "cells": self.TABLE_CELLS}
+        )
+        column_index = SyncWebTablesPage._map_columns(result["columns"])
+        
+        return [
+            TableRow(**{
+                name: values[index] if index < len(values) else ""
+                for name, index in column_index.items()
+            })
+            for values in result["rows"]
+        ]
+    
+    async def get_table_data(self) -> List[Dict[str, str]]:
+        """Get all data from the table as list of dictionaries."""
+        return [row.to_dict() for row in await self.get_table_rows()]
+    
+    async def get_row_count(self) -> int:
+        """Get count of rows in table."""
+        return await self.page.locator(self.TABLE_ROWS).evaluate_all(
+            COUNT_ROWS_SCRIPT, self.TABLE_CELLS
+        )
+    
+    async def get_total_row_count(self, timeout: int = 5000) -> int:
+        """Get count of rows across all pages in one round-trip (see the sync page)."""
+        return await self.page.evaluate(COUNT_ALL_ROWS_SCRIPT, SyncWebTablesPage._count_arguments(timeout))
+    
+    async def click_edit_for_row(self, row_index: int):
+        """Click edit button for specific row (0-based index)."""
+        self.logger.info("Clicking edit for row %s", row_index)
+        edit_buttons = await self.page.locator(self.EDIT_BUTTON).all()
+        if row_index < len(edit_buttons):
+            await edit_buttons[row_index].click()
+            await self.wait_for_element_visible(self.REGISTRATION_FORM)
+    
+    async def click_delete_for_row(self, row_index: int):
+        """Click delete button for specific row (0-based index)."""
+        self.logger.info("Clicking delete for row %s", row_index)
+        delete_buttons = await self.page.locator(self.DELETE_BUTTON).all()
+        if row_index < len(delete_buttons):
+            await delete_buttons[row_index].click()
+    
+    async def edit_record(self, row_index: int, first_name: str = None, last_name: str = None,
+                          email: str = None, age: str = None, salary: str = None, department: str = None):
+        """Edit an existing record."""
+        await self.click_edit_for_row(row_index)
+        
+        updates = {
+            self.FIRST_NAME_INPUT: first_name,
+            self.LAST_NAME_INPUT: last_name,
+            self.EMAIL_INPUT: email,
+            self.AGE_INPUT: age,
+            self.SALARY_INPUT: salary,
+            self.DEPARTMENT_INPUT: department
+        }
+        for selector, value in updates.items():
+            if value:
+                await self.clear_and_fill(selector, value)
+        
+        await self.click_submit()
+    
+    async def delete_record(self, row_index: int):
+        """Delete a record from the table."""
+        await self.click_delete_for_row(row_index)
+    
+    async def select_rows_per_page(self, rows: str):
+        """Select number of rows per page."""
+        await self.select_option(self.ROWS_SELECT, rows)
+    
+    async def click_next_page(self):
+        """Click next page button."""
+        await self.click(self.NEXT_BUTTON)
+    
+    async def click_previous_page(self):
+        """Click previous page button."""
+        await self.click(self.PREVIOUS_BUTTON)
@@ -1,81 +1,336 @@
 """Base page object with common methods for all pages."""
-from playwright.sync_api import Page, expect, Locator
-from typing import Optional, List
+from playwright.sync_api import Error as PlaywrightError, Page, expect, Locator, TimeoutError as PlaywrightTimeoutError
+from concurrent.futures import Future
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+from urllib.parse import urlsplit
+from config.base_config import get_config
+from utils.resource_policy import ResourceBlocker, ResourcePolicy
+from utils.action_batch import ActionBatch, BatchResult
+from utils.action_timings import timed_action
+from utils.page_runtime import CALL_ELEMENT_HELPER_SCRIPT, CALL_HELPER_SCRIPT, RUNTIME_SCRIPT
+from utils.screenshot_writer import capture_options, extension, screenshot_writer
+from utils.wait_report import wait_report
 import logging
+import time
+
+
+FILL_MODES = ("fast", "fill", "type")
+
+
+@dataclass(frozen=True)
+class ElementState:
+    """Snapshot of an element's state in the current DOM."""
+    
+    attached: bool
+    visible: bool
+    enabled: bool
+    checked: bool
+    text: str
+
+
+@dataclass(frozen=True)
+class Query:
+    """One entry of a ``read_many`` call.
+    
+    ``properties`` are DOM properties, or attributes when prefixed with
+    ``@``. ``all`` reads every match instead of the first.
+    """
+    
+    selector: str
+    properties: Tuple[str, ...] = ("textContent",)
+    all: bool = False
 
 
 class BasePage:
     """Base page object containing common functionality."""
     
-    def __init__(self, page: Page, base_url: str = "https://demoqa.com"):
+    # Requests this page can do without; combined with the global deny-list
+    RESOURCE_POLICY = ResourcePolicy(block_types=frozenset({"image"}))
+    
+    # Path opened by navigate_to_page
+    PAGE_URL: Optional[str] = None
+    
+    def __init__(self, page: Page, base_url: Optional[str] = None):
         self.page = page
-        self.base_url = base_url
+        self.base_url = base_url or get_config().BASE_URL
         self.logger = logging.getLogger(self.__class__.__name__)
+        
+        blocker = ResourceBlocker.for_page(page)
+        if blocker:
+            blocker.use_policy(self.RESOURCE_POLICY)
     
+    @timed_action("path")
     def navigate(self, path: str = ""):
         """Navigate to a specific path."""
         url = f"{self.base_url}{path}" if path else self.base_url
-        self.logger.info(f"Navigating to: {url}")
+        self.logger.info("Navigating to: %s", url)
         self.page.goto(url, wait_until="domcontentloaded")
     
+    def navigate_to_page(self):
+        """Open PAGE_URL, reusing the page already showing it when it resets cleanly."""
+        if not self.reuse_loaded_page():
+            self.navigate(self.PAGE_URL)
+    
+    def reuse_loaded_page(self) -> bool:
+        """Reset the page in place if it already shows PAGE_URL.
+        
+        Returns True when the reset page passes ``is_page_clean``; the
+        caller then skips the navigation. Any other outcome means the page
+        has to be loaded again.
+        """
+        if not self.is_loaded():
+            return False
+        try:
+            clean = self.reset_page_state() and self.is_page_clean()
+        except PlaywrightError as error:
+            self.logger.debug("Page reset failed: %s", error)
+            clean = False
+        if clean:
+            self.logger.info("Reusing loaded page: %s", self.page.url)
+        return clean
+    
+    def is_loaded(self) -> bool:
+        """Whether the page is already showing this page object's PAGE_URL."""
+        if self.PAGE_URL is None:
+            return False
+        current = urlsplit(self.page.url)
+        expected = urlsplit(f"{self.base_url}{self.PAGE_URL}")
+        return (current.scheme, current.netloc, current.path.rstrip("/")) == (
+            expected.scheme, expected.netloc, expected.path.rstrip("/")
+        )
+    
+    def reset_page_state(self) -> bool:
+        """Undo in place what a test did to the page; False if this page cannot.
+        
+        Page objects whose state can be reset cheaper than a reload override
+        this together with ``is_page_clean``.
+        """
+        return False
+    
+    def is_page_clean(self) -> bool:
+        """Whether the page looks exactly as after a fresh load."""
+        return False
+    
+    @timed_action(None)
     def wait_for_page_load(self, timeout: int = 30000):
         """Wait for page to be fully loaded."""
         self.page.wait_for_load_state("networkidle", timeout=timeout)
     
+    @timed_action()
     def click(self, selector: str, **kwargs):
         """Click on element with optional parameters."""
-        self.logger.debug(f"Clicking element: {selector}")
+        self.logger.debug("Clicking element: %s", selector)
         self.page.click(selector, **kwargs)
     
+    @timed_action()
     def fill(self, selector: str, text: str, **kwargs):
         """Fill input field."""
-        self.logger.debug(f"Filling {selector} with: {text}")
+        self.logger.debug("Filling %s with: %s", selector, text)
         self.page.fill(selector, text, **kwargs)
     
+    @timed_action(None)
+    def fill_fields(self, values: Dict[str, str], mode: Optional[str] = None):
+        """Fill several fields at once.
+        
+        Modes: ``fill`` calls page.fill per field with Playwright's
+        actionability checks, ``fast`` sets every value in a single in-page
+        evaluation without them, and ``type`` sends real keystrokes for tests
+        that need keyboard fidelity. Defaults to config FILL_MODE (``fill``);
+        pass ``fast`` only where the form itself is not under test, e.g. for
+        data-driven setup. Fast mode only accepts CSS selectors.
+        """
+        mode = mode or get_config().FILL_MODE
+        if mode not in FILL_MODES:
+            raise ValueError(f"Unknown fill mode: {mode}")
+        self.logger.debug("Filling %s fields (%s): %s", len(values), mode, list(values))
+        
+        if mode == "fast":
+            missing = self.mutate([("setValue", selector, text) for selector, text in values.items()])
+            if missing:
+                raise ValueError(f"Fields not found: {missing}")
+        elif mode == "type":
+            for selector, text in values.items():
+                locator = self.page.locator(selector)
+                locator.clear()
+                locator.press_sequentially(text)
+        else:
+            for selector, text in values.items():
+                self.fill(selector, text)
+    
+    @timed_action()
     def clear_and_fill(self, selector: str, text: str):
         """Clear field and fill with text."""
         self.page.locator(selector).clear()
         self.fill(selector, text)
     
+    @timed_action()
     def get_text(self, selector: str) -> str:
         """Get text content of element."""
         return self.page.locator(selector).text_content() or ""
     
+    @timed_action()
     def get_all_text(self, selector: str) -> List[str]:
         """Get text content from all matching elements."""
         return self.page.locator(selector).all_text_contents()
     
+    @timed_action()
     def get_attribute(self, selector: str, attribute: str) -> Optional[str]:
         """Get attribute value from element."""
         return self.page.locator(selector).get_attribute(attribute)
     
-    def is_visible(self, selector: str, timeout: int = 5000) -> bool:
-        """Check if element is visible."""
-        try:
-            return self.page.locator(selector).is_visible(timeout=timeout)
-        except Exception:
-            return False
+    @timed_action()
+    def get_element_state(self, selector: str) -> ElementState:
+        """Read the first matching element's state without waiting."""
+        return ElementState(**self._element_helper(selector, "stateOf"))
+    
+    @timed_action(None)
+    def get_element_states(self, selectors: Sequence[str]) -> List[ElementState]:
+        """Read the state of several elements in one round-trip (CSS selectors only)."""
+        return [ElementState(**state) for state in self._helper("states", list(selectors))]
+    
+    @timed_action()
+    def read_properties(self, selector: str, properties: Sequence[str], all: bool = False) -> Any:
+        """Read properties (``@name`` for attributes) of the first match, or of every match with ``all``.
+        
+        Returns a dict per element, or None if nothing matches and ``all`` is not set.
+        """
+        return self._element_helper(selector, "readOf", list(properties), all)
+    
+    @timed_action(None)
+    def read_many(self, queries: Dict[str, Query]) -> Dict[str, Any]:
+        """Run several ``Query`` reads in one round-trip (CSS selectors only)."""
+        return self._helper("query", {
+            key: {"selector": query.selector, "properties": list(query.properties), "all": query.all}
+            for key, query in queries.items()
+        })
+    
+    @timed_action(None)
+    def mutate(self, operations: Sequence[Tuple]) -> List[str]:
+        """Apply ``(mutation, selector, *args)`` operations in order in one round-trip.
+        
+        Mutations: remove, setValue, setAttribute, removeAttribute, click and
+        scrollIntoView, each on the first match of a CSS selector. Returns
+        the selectors that matched nothing; their operations are skipped.
+        """
+        return self._helper("mutate", [list(operation) for operation in operations])
+    
+    def batch(self, timeout: int = 5000) -> ActionBatch:
+        """Start a batch of actions and reads that ``run()`` executes in one round-trip.
+        
+        Actions wait up to ``timeout`` ms for a visible element. See
+        utils.action_batch for the available steps.
+        """
+        return ActionBatch(self.run_batch, timeout=timeout)
+    
+    @timed_action(None)
+    def run_batch(self, batch: ActionBatch) -> BatchResult:
+        """Execute a batch's steps in the page; raises BatchError naming the step that failed."""
+        started = time.perf_counter()
+        outcome = self._helper("batch", batch.payload(), batch.timeout)
+        result = batch.result(outcome, (time.perf_counter() - started) * 1000)
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(
+                "Ran %s batched steps in %.0f ms: %s", len(batch), result.elapsed_ms,
+                ", ".join(f"{timing.step} {timing.duration_ms:.0f} ms" for timing in result.steps)
+            )
+        return result
+    
+    def _helper(self, name: str, *args) -> Any:
+        """Call a bulk helper of the in-page runtime, installing it if this document lacks it."""
+        result = self.page.evaluate(CALL_HELPER_SCRIPT, [name, list(args)])
+        if result is None:
+            self.page.evaluate(RUNTIME_SCRIPT)
+            result = self.page.evaluate(CALL_HELPER_SCRIPT, [name, list(args)])
+        return result["value"]
+    
+    def _element_helper(self, selector: str, name: str, *args) -> Any:
+        """Call an element helper of the in-page runtime on a selector's matches."""
+        locator = self.page.locator(selector)
+        result = locator.evaluate_all(CALL_ELEMENT_HELPER_SCRIPT, [name, list(args)])
+        if result is None:
+            self.page.evaluate(RUNTIME_SCRIPT)
+            result = locator.evaluate_all(CALL_ELEMENT_HELPER_SCRIPT, [name, list(args)])
+        return result["value"]
+    
+    @timed_action()
+    def is_visible(self, selector: str) -> bool:
+        """Check if element is visible right now, without waiting.
+        
+        Use ``wait_until_visible`` for an element that is still appearing.
+        """
+        return self.get_element_state(selector).visible
     
+    @timed_action()
     def is_enabled(self, selector: str) -> bool:
         """Check if element is enabled."""
         return self.page.locator(selector).is_enabled()
     
+    @timed_action()
     def is_checked(self, selector: str) -> bool:
         """Check if checkbox/radio is checked."""
         return self.page.locator(selector).is_checked()
     
+    @timed_action()
+    def wait_until_visible(self, selector: str, timeout: int = 5000) -> bool:
+        """Wait for element to become visible; False if the timeout expires."""
+        return self._wait_until(selector, "visible", timeout)
+    
+    @timed_action()
+    def wait_until_hidden(self, selector: str, timeout: int = 5000) -> bool:
+        """Wait for element to become hidden; False if the timeout expires."""
+        return self._wait_until(selector, "hidden", timeout)
+    
+    @timed_action()
+    def wait_until_enabled(self, selector: str, timeout: int = 5000) -> bool:
+        """Wait for element to become enabled; False if the timeout expires."""
+        try:
+            with self._track_wait("wait_until_enabled", selector, timeout):
+                expect(self.page.locator(selector).first).to_be_enabled(timeout=timeout)
+            return True
+        except AssertionError:
+            return False
+    
+    def _wait_until(self, selector: str, state: str, timeout: int) -> bool:
+        try:
+            with self._track_wait(f"wait_until_{state}", selector, timeout):
+                self.page.locator(selector).first.wait_for(state=state, timeout=timeout)
+            return True
+        except PlaywrightTimeoutError:
+            return False
+    
+    @contextmanager
+    def _track_wait(self, method: str, selector: str, timeout: int):
+        """Record the wall time of a wait whose timeout expires."""
+        started = time.perf_counter()
+        try:
+            yield
+        except (PlaywrightTimeoutError, AssertionError):
+            elapsed_ms = (time.perf_counter() - started) * 1000
+            wait_report.record(self.__class__.__name__, method, selector, timeout, elapsed_ms)
+            raise
+    
+    @timed_action()
     def wait_for_selector(self, selector: str, timeout: int = 30000):
         """Wait for selector to appear."""
-        self.page.wait_for_selector(selector, timeout=timeout)
+        with self._track_wait("wait_for_selector", selector, timeout):
+            self.page.wait_for_selector(selector, timeout=timeout)
     
+    @timed_action()
     def wait_for_element_visible(self, selector: str, timeout: int = 30000):
         """Wait for element to be visible."""
-        self.page.locator(selector).wait_for(state="visible", timeout=timeout)
+        with self._track_wait("wait_for_element_visible", selector, timeout):
+            self.page.locator(selector).wait_for(state="visible", timeout=timeout)
     
+    @timed_action()
     def wait_for_element_hidden(self, selector: str, timeout: int = 30000):
         """Wait for element to be hidden."""
-        self.page.locator(selector).wait_for(state="hidden", timeout=timeout)
+        with self._track_wait("wait_for_element_hidden", selector, timeout):
+            self.page.locator(selector).wait_for(state="hidden", timeout=timeout)
     
+    @timed_action()
     def scroll_to_element(self, selector: str):
         """Scroll element into view."""
         self.page.locator(selector).scroll_into_view_if_needed()
@@ -84,11 +339,25 @@ class BasePage:
         """Get Playwright locator object."""
         return self.page.locator(selector)
     
-    def take_screenshot(self, filename: str):
-        """Take screenshot of current page."""
-        self.page.screenshot(path=filename, full_page=True)
-        self.logger.info(f"Screenshot saved: {filename}")
+    @timed_action(None)
+    def take_screenshot(
+        self,
+        filename: str,
+        full_page: Optional[bool] = None,
+        image_type: Optional[str] = None,
+        quality: Optional[int] = None,
+    ) -> "Future[Path]":
+        """Take screenshot of current page; the file is written in the background.
+        
+        Defaults come from the SCREENSHOT_* settings. The suffix of
+        ``filename`` is replaced to match the image format. Returns a future
+        resolving to the written path (or an identical earlier screenshot).
+        """
+        options = capture_options(get_config(), full_page, image_type, quality)
+        data = self.page.screenshot(**options)
+        return screenshot_writer.submit(data, Path(filename).with_suffix(extension(options)))
     
+    @timed_action(None)
     def get_page_title(self) -> str:
         """Get page title."""
         return self.page.title()
@@ -97,34 +366,42 @@ class BasePage:
         """Get current page URL."""
         return self.page.url
     
+    @timed_action()
     def hover(self, selector: str):
         """Hover over element."""
         self.page.locator(selector).hover()
     
+    @timed_action()
     def double_click(self, selector: str):
         """Double click on element."""
         self.page.locator(selector).dblclick()
     
+    @timed_action()
     def right_click(self, selector: str):
         """Right click on element."""
         self.page.locator(selector).click(button="right")
     
+    @timed_action()
     def select_option(self, selector: str, value: str):
         """Select option from dropdown."""
         self.page.locator(selector).select_option(value)
     
+    @timed_action()
     def upload_file(self, selector: str, file_path: str):
         """Upload file to input element."""
         self.page.locator(selector).set_input_files(file_path)
     
+    @timed_action("key")
     def press_key(self, key: str):
         """Press keyboard key."""
         self.page.keyboard.press(key)
     
+    @timed_action(None)
     def execute_script(self, script: str):
         """Execute JavaScript."""
         return self.page.evaluate(script)
     
+    @timed_action()
     def remove_element(self, selector: str):
-        """Remove element using JavaScript."""
-        self.page.evaluate(f'document.querySelector("{selector}").remove()')
+        """Remove the first element matching a selector."""
+        self._element_helper(selector, "mutateOf", "remove", [], False)
@@ -1,6 +1,10 @@
 """Page object for Broken Links - Images page."""
 from pages.base_page import BasePage
 from playwright.sync_api import Page, Response
+from typing import Optional
+from utils.har_archive import HarRouter
+from utils.link_scanner import LinkScanner, ScanReport
+from utils.resource_policy import ResourcePolicy
 
 
 class BrokenLinksImagesPage(BasePage):
@@ -9,11 +13,16 @@ class BrokenLinksImagesPage(BasePage):
     # Page URL
     PAGE_URL = "/broken"
     
+    # Image assertions need the images to actually load
+    RESOURCE_POLICY = ResourcePolicy(allow_types=frozenset({"image"}))
+    
     # Locators
     VALID_IMAGE = "img[src='/images/Toolsqa.jpg']"
     BROKEN_IMAGE = "img[src='/images/Toolsqa_1.jpg']"
     VALID_LINK = "a:has-text('Click Here for Valid Link')"
     BROKEN_LINK = "a:has-text('Click Here for Broken Link')"
+    ALL_LINKS = "a[href]"
+    ALL_IMAGES = "img[src]"
     
     def __init__(self, page: Page):
         super().__init__(page)
@@ -39,11 +48,9 @@ class BrokenLinksImagesPage(BasePage):
         return self.get_attribute(self.BROKEN_IMAGE, "src") or ""
     
     def get_image_natural_width(self, selector: str) -> int:
-        """Get natural width of image (0 if broken)."""
-        script = f"""
-            document.querySelector('{selector}').naturalWidth
-        """
-        return self.execute_script(script)
+        """Get natural width of image (0 if broken or missing)."""
+        image = self.read_properties(selector, ["naturalWidth"])
+        return (image or {}).get("naturalWidth") or 0
     
     def is_image_broken(self, selector: str) -> bool:
         """Check if image is broken by checking natural width."""
@@ -73,12 +80,24 @@ class BrokenLinksImagesPage(BasePage):
     
     def check_link_status(self, url: str) -> int:
         """Check HTTP status code of a URL."""
-        self.logger.info(f"Checking status of URL: {url}")
+        self.logger.info("Checking status of URL: %s", url)
         
-        # Use page.request to check the URL status
-        response = self.page.request.get(url)
+        # page.request bypasses context routes, so go through the HAR router explicitly
+        router = HarRouter.for_page(self.page)
+        response = router.fetch(self.page.request, url) if router else self.page.request.get(url)
         return response.status
     
+    def scan_links(self, scanner: Optional[LinkScanner] = None) -> ScanReport:
+        """Check every link and image on the page concurrently.
+        
+        Pass the session's scanner to share its connection pool and result
+        cache; otherwise a temporary scanner is started for this call.
+        """
+        if scanner is None:
+            with LinkScanner() as scanner:
+                return scanner.scan(self.page, self.ALL_LINKS, self.ALL_IMAGES)
+        return scanner.scan(self.page, self.ALL_LINKS, self.ALL_IMAGES)
+    
     def is_valid_link_working(self) -> bool:
         """Check if valid link returns 200 status."""
         href = self.get_valid_link_href()
@@ -1,6 +1,8 @@
 """Page object for Buttons page."""
 from pages.base_page import BasePage
 from playwright.sync_api import Page
+from typing import Dict
+from utils.action_batch import ActionBatch
 
 
 class ButtonsPage(BasePage):
@@ -13,6 +15,9 @@ class ButtonsPage(BasePage):
     DOUBLE_CLICK_BUTTON = "#doubleClickBtn"
     RIGHT_CLICK_BUTTON = "#rightClickBtn"
     DYNAMIC_CLICK_BUTTON = "button:has-text('Click Me')"
+    # CSS form of the dynamic button for batches; its id changes on every load
+    BUTTON = "button"
+    DYNAMIC_CLICK_TEXT = "Click Me"
     
     # Message locators
     DOUBLE_CLICK_MESSAGE = "#doubleClickMessage"
@@ -41,32 +46,62 @@ class ButtonsPage(BasePage):
         self.logger.info("Clicking on dynamic button")
         self.click(self.DYNAMIC_CLICK_BUTTON)
     
+    @classmethod
+    def _queue_all_clicks(cls, batch: ActionBatch) -> ActionBatch:
+        return (batch
+                .double_click(cls.DOUBLE_CLICK_BUTTON)
+                .right_click(cls.RIGHT_CLICK_BUTTON)
+                .click(cls.BUTTON, text=cls.DYNAMIC_CLICK_TEXT)
+                .wait_visible(cls.DOUBLE_CLICK_MESSAGE)
+                .wait_visible(cls.RIGHT_CLICK_MESSAGE)
+                .wait_visible(cls.DYNAMIC_CLICK_MESSAGE)
+                .read_text(cls.DOUBLE_CLICK_MESSAGE, key="double_click")
+                .read_text(cls.RIGHT_CLICK_MESSAGE, key="right_click")
+                .read_text(cls.DYNAMIC_CLICK_MESSAGE, key="dynamic_click"))
+    
+    def click_all_buttons(self) -> Dict[str, str]:
+        """Double, right and dynamic click in one round-trip; returns the three messages.
+        
+        Raises BatchError naming the step if a click or its message fails.
+        """
+        self.logger.info("Clicking all buttons in one batch")
+        return self._queue_all_clicks(self.batch()).run().reads
+    
     def get_double_click_message(self) -> str:
-        """Get double click message text."""
-        if not self.is_visible(self.DOUBLE_CLICK_MESSAGE, timeout=2000):
-            return ""
-        return self.get_text(self.DOUBLE_CLICK_MESSAGE)
+        """Get double click message text, or "" if it is not shown right now."""
+        state = self.get_element_state(self.DOUBLE_CLICK_MESSAGE)
+        return state.text if state.visible else ""
     
     def get_right_click_message(self) -> str:
-        """Get right click message text."""
-        if not self.is_visible(self.RIGHT_CLICK_MESSAGE, timeout=2000):
-            return ""
-        return self.get_text(self.RIGHT_CLICK_MESSAGE)
+        """Get right click message text, or "" if it is not shown right now."""
+        state = self.get_element_state(self.RIGHT_CLICK_MESSAGE)
+        return state.text if state.visible else ""
     
     def get_dynamic_click_message(self) -> str:
-        """Get dynamic click message text."""
-        if not self.is_visible(self.DYNAMIC_CLICK_MESSAGE, timeout=2000):
-            return ""
-        return self.get_text(self.DYNAMIC_CLICK_MESSAGE)
+        """Get dynamic click message text, or "" if it is not shown right now."""
+        state = self.get_element_state(self.DYNAMIC_CLICK_MESSAGE)
+        return state.text if state.visible else ""
     
     def is_double_click_message_displayed(self) -> bool:
-        """Check if double click message is displayed."""
-        return self.is_visible(self.DOUBLE_CLICK_MESSAGE, timeout=2000)
+        """Check if double click message is displayed right now."""
+        return self.is_visible(self.DOUBLE_CLICK_MESSAGE)
+    
+    def wait_until_double_click_message_displayed(self, timeout: int = 2000) -> bool:
+        """Wait for the double click message to appear; False if the timeout expires."""
+        return self.wait_until_visible(self.DOUBLE_CLICK_MESSAGE, timeout=timeout)
     
     def is_right_click_message_displayed(self) -> bool:
-        """Check if right click message is displayed."""
-        return self.is_visible(self.RIGHT_CLICK_MESSAGE, timeout=2000)
+        """Check if right click message is displayed right now."""
+        return self.is_visible(self.RIGHT_CLICK_MESSAGE)
+    
+    def wait_until_right_click_message_displayed(self, timeout: int = 2000) -> bool:
+        """Wait for the right click message to appear; False if the timeout expires."""
+        return self.wait_until_visible(self.RIGHT_CLICK_MESSAGE, timeout=timeout)
     
     def is_dynamic_click_message_displayed(self) -> bool:
-        """Check if dynamic click message is displayed."""
-        return self.is_visible(self.DYNAMIC_CLICK_MESSAGE, timeout=2000)
+        """Check if dynamic click message is displayed right now."""
+        return self.is_visible(self.DYNAMIC_CLICK_MESSAGE)
+    
+    def wait_until_dynamic_click_message_displayed(self, timeout: int = 2000) -> bool:
+        """Wait for the dynamic click message to appear; False if the timeout expires."""
+        return self.wait_until_visible(self.DYNAMIC_CLICK_MESSAGE, timeout=timeout)
@@ -48,19 +48,19 @@ class CheckBoxPage(BasePage):
     
     def click_checkbox_by_label(self, label: str):
         """Click checkbox by its label text."""
-        self.logger.info(f"Clicking checkbox: {label}")
+        self.logger.info("Clicking checkbox: %s", label)
         checkbox_selector = f"label[for='tree-node-{label.lower()}'] .rct-checkbox"
         self.click(checkbox_selector)
     
     def expand_node(self, node: str):
         """Expand a tree node."""
-        self.logger.info(f"Expanding node: {node}")
+        self.logger.info("Expanding node: %s", node)
         # This would need more specific implementation based on the tree structure
         pass
     
     def get_selected_items(self) -> List[str]:
         """Get list of selected checkbox items."""
-        if not self.is_visible(self.RESULT_TEXT, timeout=2000):
+        if not self.is_visible(self.RESULT_TEXT):
             return []
         
         results = self.get_all_text(self.RESULT_TEXT)
@@ -73,6 +73,6 @@ class CheckBoxPage(BasePage):
     
     def get_result_text(self) -> str:
         """Get the result text displayed."""
-        if not self.is_visible(self.RESULT_TEXT, timeout=2000):
+        if not self.is_visible(self.RESULT_TEXT):
             return ""
         return self.get_text("#result")
@@ -1,6 +1,8 @@
 """Page object for Dynamic Properties page."""
 from pages.base_page import BasePage
-from playwright.sync_api import Page
+from playwright.sync_api import Page, expect
+from config.base_config import get_config
+from utils.context_pool import mark_context_dirty
 
 
 class DynamicPropertiesPage(BasePage):
@@ -15,12 +17,40 @@ class DynamicPropertiesPage(BasePage):
     COLOR_CHANGE_BUTTON = "#colorChange"
     VISIBLE_AFTER_BUTTON = "#visibleAfter"
     
-    def __init__(self, page: Page):
+    # Delay of the page's enable/visible/color-change timers
+    TIMER_DELAY_MS = 5000
+    
+    def __init__(self, page: Page, virtual_clock: bool = None):
         super().__init__(page)
+        self.virtual_clock = get_config().VIRTUAL_CLOCK if virtual_clock is None else virtual_clock
+        self._clock_installed = False
+        self._timers_elapsed = False
     
     def navigate_to_page(self):
         """Navigate to Dynamic Properties page."""
+        if self.virtual_clock:
+            self.install_virtual_clock()
         self.navigate(self.PAGE_URL)
+        self._timers_elapsed = False
+    
+    def install_virtual_clock(self):
+        """Replace the page's timers with Playwright's controllable clock.
+        
+        Must run before navigation so the page's setTimeout calls are captured.
+        """
+        if self._clock_installed:
+            return
+        self.logger.info("Installing virtual clock")
+        self.page.clock.install()
+        # The fake clock stays installed on the context, so it cannot be pooled
+        mark_context_dirty(self.page.context)
+        self._clock_installed = True
+    
+    def fast_forward_timers(self):
+        """Fire the page's 5-second timers now when the virtual clock is on."""
+        if self.virtual_clock and not self._timers_elapsed:
+            self.page.clock.run_for(self.TIMER_DELAY_MS)
+            self._timers_elapsed = True
     
     def is_random_id_text_visible(self) -> bool:
         """Check if random ID text is visible."""
@@ -32,20 +62,15 @@ class DynamicPropertiesPage(BasePage):
     
     def is_enable_after_button_enabled(self, timeout: int = 5000) -> bool:
         """Check if 'Enable After 5 Seconds' button is enabled."""
-        try:
-            self.page.locator(self.ENABLE_AFTER_BUTTON).wait_for(
-                state="enabled", 
-                timeout=timeout
-            )
-            return True
-        except Exception:
-            return False
+        self.fast_forward_timers()
+        return self.wait_until_enabled(self.ENABLE_AFTER_BUTTON, timeout=timeout)
     
     def click_enable_after_button(self):
         """Click 'Enable After 5 Seconds' button."""
         self.logger.info("Clicking Enable After button")
         # Wait for it to be enabled first
-        self.page.locator(self.ENABLE_AFTER_BUTTON).wait_for(state="enabled", timeout=6000)
+        self.fast_forward_timers()
+        expect(self.page.locator(self.ENABLE_AFTER_BUTTON)).to_be_enabled(timeout=6000)
         self.click(self.ENABLE_AFTER_BUTTON)
     
     def get_color_change_button_color(self) -> str:
@@ -55,10 +80,8 @@ class DynamicPropertiesPage(BasePage):
     def wait_for_color_change(self, timeout: int = 5000):
         """Wait for color change button to change color."""
         # The button changes to class containing 'text-danger'
-        self.page.locator(f"{self.COLOR_CHANGE_BUTTON}.text-danger").wait_for(
-            state="attached",
-            timeout=timeout
-        )
+        self.fast_forward_timers()
+        self.wait_for_selector(f"{self.COLOR_CHANGE_BUTTON}.text-danger", timeout=timeout)
     
     def is_color_changed(self) -> bool:
         """Check if color has changed (contains text-danger class)."""
@@ -66,12 +89,14 @@ class DynamicPropertiesPage(BasePage):
         return "text-danger" in color_class
     
     def is_visible_after_button_visible(self, timeout: int = 5000) -> bool:
-        """Check if 'Visible After 5 Seconds' button is visible."""
-        return self.is_visible(self.VISIBLE_AFTER_BUTTON, timeout=timeout)
+        """Wait up to timeout for the 'Visible After 5 Seconds' button; False if it stays hidden."""
+        self.fast_forward_timers()
+        return self.wait_until_visible(self.VISIBLE_AFTER_BUTTON, timeout=timeout)
     
     def wait_for_visible_after_button(self, timeout: int = 6000):
         """Wait for 'Visible After 5 Seconds' button to appear."""
         self.logger.info("Waiting for Visible After button")
+        self.fast_forward_timers()
         self.wait_for_element_visible(self.VISIBLE_AFTER_BUTTON, timeout=timeout)
     
     def click_visible_after_button(self):
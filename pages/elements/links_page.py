@@ -83,8 +83,8 @@ class LinksPage(BasePage):
         return self.get_text(self.LINK_RESPONSE)
     
     def is_response_displayed(self) -> bool:
-        """Check if response message is displayed."""
-        return self.is_visible(self.LINK_RESPONSE, timeout=5000)
+        """Check if response message is displayed, waiting up to 5 s for it."""
+        return self.wait_until_visible(self.LINK_RESPONSE, timeout=5000)
     
     def get_link_href(self, selector: str) -> str:
         """Get href attribute of a link."""
@@ -62,10 +62,9 @@ class RadioButtonPage(BasePage):
         return self.is_enabled(self.NO_RADIO_INPUT)
     
     def get_result_text(self) -> str:
-        """Get the result text displayed."""
-        if not self.is_visible(self.SUCCESS_TEXT, timeout=2000):
-            return ""
-        return self.get_text(self.SUCCESS_TEXT)
+        """Get the result text displayed, or "" if none is shown right now."""
+        state = self.get_element_state(self.SUCCESS_TEXT)
+        return state.text if state.visible else ""
     
     def is_result_displayed(self) -> bool:
         """Check if result is displayed."""
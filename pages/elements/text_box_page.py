@@ -1,6 +1,8 @@
 """Page object for Text Box page."""
-from pages.base_page import BasePage
+from pages.base_page import BasePage, Query
+from utils.action_batch import ActionBatch
 from playwright.sync_api import Page
+from typing import Dict, List, Optional, Tuple
 
 
 class TextBoxPage(BasePage):
@@ -22,33 +24,74 @@ class TextBoxPage(BasePage):
     OUTPUT_EMAIL = "#email"
     OUTPUT_CURRENT_ADDRESS = "p#currentAddress"
     OUTPUT_PERMANENT_ADDRESS = "p#permanentAddress"
+    OUTPUT_LINES = "#output p"
+    
+    FORM_FIELDS = (FULL_NAME_INPUT, EMAIL_INPUT, CURRENT_ADDRESS_TEXTAREA, PERMANENT_ADDRESS_TEXTAREA)
+    
+    # get_all_output_data key -> (output line, label before the value)
+    OUTPUT_FIELDS = {
+        "name": (OUTPUT_NAME, "Name:"),
+        "email": (OUTPUT_EMAIL, "Email:"),
+        "current_address": (OUTPUT_CURRENT_ADDRESS, "Current Address :"),
+        "permanent_address": (OUTPUT_PERMANENT_ADDRESS, "Permananet Address :")
+    }
     
     def __init__(self, page: Page):
         super().__init__(page)
     
     def navigate_to_page(self):
         """Navigate to Text Box page."""
-        self.navigate(self.PAGE_URL)
+        super().navigate_to_page()
         self.scroll_to_element(self.FULL_NAME_INPUT)
     
+    @classmethod
+    def _reset_operations(cls) -> List[Tuple]:
+        return [("setValue", selector, "") for selector in cls.FORM_FIELDS] + [("click", cls.SUBMIT_BUTTON)]
+    
+    @classmethod
+    def _clean_queries(cls) -> Dict[str, Query]:
+        return {
+            "fields": Query(", ".join(cls.FORM_FIELDS), ("value",), all=True),
+            "email": Query(cls.EMAIL_INPUT, ("className",)),
+            "lines": Query(cls.OUTPUT_LINES, ("id",), all=True)
+        }
+    
+    @classmethod
+    def _is_clean(cls, values: Dict) -> bool:
+        return (
+            len(values["fields"]) == len(cls.FORM_FIELDS)
+            and all(field["value"] == "" for field in values["fields"])
+            and values["email"] is not None
+            and "field-error" not in values["email"]["className"].split()
+            and not values["lines"]
+        )
+    
+    def reset_page_state(self) -> bool:
+        """Empty the fields and submit the empty form, which clears the output and the email error."""
+        return not self.mutate(self._reset_operations())
+    
+    def is_page_clean(self) -> bool:
+        """Whether the form is empty, without an email error or output lines."""
+        return self._is_clean(self.read_many(self._clean_queries()))
+    
     def fill_full_name(self, name: str):
         """Fill full name field."""
-        self.logger.info(f"Filling full name: {name}")
+        self.logger.info("Filling full name: %s", name)
         self.fill(self.FULL_NAME_INPUT, name)
     
     def fill_email(self, email: str):
         """Fill email field."""
-        self.logger.info(f"Filling email: {email}")
+        self.logger.info("Filling email: %s", email)
         self.fill(self.EMAIL_INPUT, email)
     
     def fill_current_address(self, address: str):
         """Fill current address field."""
-        self.logger.info(f"Filling current address: {address}")
+        self.logger.info("Filling current address: %s", address)
         self.fill(self.CURRENT_ADDRESS_TEXTAREA, address)
     
     def fill_permanent_address(self, address: str):
         """Fill permanent address field."""
-        self.logger.info(f"Filling permanent address: {address}")
+        self.logger.info("Filling permanent address: %s", address)
         self.fill(self.PERMANENT_ADDRESS_TEXTAREA, address)
     
     def click_submit(self):
@@ -57,17 +100,52 @@ class TextBoxPage(BasePage):
         self.scroll_to_element(self.SUBMIT_BUTTON)
         self.click(self.SUBMIT_BUTTON)
     
-    def submit_form(self, full_name: str, email: str, current_address: str, permanent_address: str):
+    def submit_form(self, full_name: str, email: str, current_address: str, permanent_address: str,
+                    fill_mode: Optional[str] = None):
         """Fill and submit the complete form."""
-        self.fill_full_name(full_name)
-        self.fill_email(email)
-        self.fill_current_address(current_address)
-        self.fill_permanent_address(permanent_address)
+        self.logger.info("Filling text box form for: %s", full_name)
+        self.fill_fields({
+            self.FULL_NAME_INPUT: full_name,
+            self.EMAIL_INPUT: email,
+            self.CURRENT_ADDRESS_TEXTAREA: current_address,
+            self.PERMANENT_ADDRESS_TEXTAREA: permanent_address
+        }, mode=fill_mode)
         self.click_submit()
     
+    @classmethod
+    def _queue_submit(cls, batch: ActionBatch, full_name: str, email: str, current_address: str,
+                      permanent_address: str) -> ActionBatch:
+        batch.fill_fields({
+            cls.FULL_NAME_INPUT: full_name,
+            cls.EMAIL_INPUT: email,
+            cls.CURRENT_ADDRESS_TEXTAREA: current_address,
+            cls.PERMANENT_ADDRESS_TEXTAREA: permanent_address
+        }).click(cls.SUBMIT_BUTTON).wait_visible(cls.OUTPUT_LINES)
+        # Lines for empty values are not rendered, so read without waiting
+        for key, (selector, _) in cls.OUTPUT_FIELDS.items():
+            batch.read_state(selector, key=key)
+        return batch
+    
+    @classmethod
+    def _output_data(cls, reads: dict) -> dict:
+        return {
+            key: reads[key]["text"].replace(label, "").strip()
+            for key, (_, label) in cls.OUTPUT_FIELDS.items()
+        }
+    
+    def submit_form_and_read(self, full_name: str, email: str, current_address: str,
+                             permanent_address: str) -> dict:
+        """Fill, submit and read the output in one round-trip; returns what get_all_output_data would.
+        
+        Raises BatchError if no output appears, e.g. for an invalid email.
+        """
+        self.logger.info("Submitting text box form in one batch for: %s", full_name)
+        batch = self._queue_submit(self.batch(), full_name, email, current_address, permanent_address)
+        return self._output_data(batch.run().reads)
+    
     def is_output_displayed(self) -> bool:
-        """Check if output container is displayed."""
-        return self.is_visible(self.OUTPUT_CONTAINER)
+        """Check if the output shows at least one submitted value."""
+        return self.is_visible(self.OUTPUT_LINES)
     
     def get_output_name(self) -> str:
         """Get output name text."""
@@ -41,17 +41,17 @@ class UploadDownloadPage(BasePage):
         if download_path:
             file_path = os.path.join(download_path, download.suggested_filename)
             download.save_as(file_path)
-            self.logger.info(f"File downloaded to: {file_path}")
+            self.logger.info("File downloaded to: %s", file_path)
             return file_path
         else:
             # Use default download path
             file_path = download.path()
-            self.logger.info(f"File downloaded to: {file_path}")
+            self.logger.info("File downloaded to: %s", file_path)
             return file_path
     
     def upload_file(self, file_path: str):
         """Upload a file."""
-        self.logger.info(f"Uploading file: {file_path}")
+        self.logger.info("Uploading file: %s", file_path)
         
         if not os.path.exists(file_path):
             raise FileNotFoundError(f"File not found: {file_path}")
@@ -72,5 +72,5 @@ class UploadDownloadPage(BasePage):
         return ""
     
     def is_upload_successful(self) -> bool:
-        """Check if file upload was successful."""
-        return self.is_visible(self.UPLOADED_FILE_PATH, timeout=5000)
+        """Check if file upload was successful, waiting up to 5 s for the result."""
+        return self.wait_until_visible(self.UPLOADED_FILE_PATH, timeout=5000)
@@ -1,7 +1,244 @@
 """Page object for Web Tables page."""
 from pages.base_page import BasePage
 from playwright.sync_api import Page
-from typing import List, Dict
+from dataclasses import dataclass, asdict, fields
+from typing import List, Dict, Optional, Sequence, Union
+import time
+
+
+# Reads header labels and every non-empty row in a single in-browser pass.
+EXTRACT_TABLE_SCRIPT = """
+(rows, selectors) => {
+    const columns = Array.from(
+        document.querySelectorAll(selectors.headers),
+        header => header.textContent.trim()
+    );
+    const data = [];
+    for (const row of rows) {
+        const values = Array.from(
+            row.querySelectorAll(selectors.cells),
+            cell => cell.textContent.trim()
+        );
+        if (values.length > 0 && values[0]) {
+            data.push(values);
+        }
+    }
+    return {columns, rows: data};
+}
+"""
+
+# Counts non-empty rows without serializing any cell text.
+COUNT_ROWS_SCRIPT = """
+(rows, cellSelector) => rows.filter(row => {
+    const cell = row.querySelector(cellSelector);
+    return cell !== null && cell.textContent.trim() !== "";
+}).length
+"""
+
+# Drives the registration modal for a batch of records without leaving the
+# page: open, set values through the native setter, submit, wait for close.
+SEED_RECORDS_SCRIPT = """
+async ({records, selectors, timeout}) => {
+    const isShown = element => element !== null && element.getClientRects().length > 0;
+    const waitFor = async predicate => {
+        const deadline = performance.now() + timeout;
+        await Promise.resolve();
+        while (!predicate()) {
+            if (performance.now() > deadline) return false;
+            await new Promise(resolve => requestAnimationFrame(resolve));
+        }
+        return true;
+    };
+    const setValue = (element, value) => {
+        const descriptor = Object.getOwnPropertyDescriptor(Object.getPrototypeOf(element), "value");
+        if (descriptor && descriptor.set) {
+            descriptor.set.call(element, value);
+        } else {
+            element.value = value;
+        }
+        element.dispatchEvent(new Event("input", {bubbles: true}));
+        element.dispatchEvent(new Event("change", {bubbles: true}));
+    };
+    
+    let added = 0;
+    for (const [index, fields] of records.entries()) {
+        document.querySelector(selectors.add).click();
+        const firstField = fields[0][0];
+        if (!await waitFor(() => isShown(document.querySelector(firstField)))) {
+            return {added, failed: index, reason: "registration form did not open"};
+        }
+        for (const [selector, value] of fields) {
+            const element = document.querySelector(selector);
+            if (!element) {
+                return {added, failed: index, reason: `field not found: ${selector}`};
+            }
+            setValue(element, value);
+        }
+        document.querySelector(selectors.submit).click();
+        if (!await waitFor(() => !isShown(document.querySelector(selectors.form)))) {
+            const close = document.querySelector(selectors.close);
+            if (close) close.click();
+            return {added, failed: index, reason: "form rejected the record"};
+        }
+        added++;
+    }
+    return {added, failed: null, reason: null};
+}
+"""
+
+# Counts non-empty rows on every page by stepping through the pagination,
+# then returns to the page that was showing. Each click re-renders on a later
+# frame, so every step waits for the page number to change before counting.
+COUNT_ALL_ROWS_SCRIPT = """
+async ({rows, cells, previous, next, pageJump, timeout}) => {
+    const frame = () => new Promise(resolve => requestAnimationFrame(resolve));
+    const pageNumber = () => document.querySelector(pageJump)?.value ?? null;
+    const enabled = selector => {
+        const button = document.querySelector(selector);
+        return button !== null && !button.disabled;
+    };
+    const turn = async selector => {
+        const before = pageNumber();
+        document.querySelector(selector).click();
+        const deadline = performance.now() + timeout;
+        do {
+            await frame();
+        } while (pageNumber() === before && performance.now() < deadline);
+        if (pageNumber() === before) {
+            throw new Error(`Table page did not change within ${timeout} ms of clicking ${selector}`);
+        }
+    };
+    const countPage = () => Array.from(document.querySelectorAll(rows)).filter(row => {
+        const cell = row.querySelector(cells);
+        return cell !== null && cell.textContent.trim() !== "";
+    }).length;
+    
+    let offset = 0;
+    while (enabled(previous)) {
+        await turn(previous);
+        offset++;
+    }
+    let total = countPage();
+    let position = 0;
+    while (enabled(next)) {
+        await turn(next);
+        position++;
+        total += countPage();
+    }
+    for (; position > offset; position--) {
+        await turn(previous);
+    }
+    return total;
+}
+"""
+
+# Puts a used table back to its defaults without reloading: closes the modal,
+# clears the search, shows every row, deletes those not among the defaults
+# and restores the page size. Returns false if it gives up.
+RESET_TABLE_SCRIPT = """
+async ({defaults, selectors, pageSize, maxDeletes}) => {
+    const frame = () => new Promise(resolve => requestAnimationFrame(resolve));
+    const isShown = element => element !== null && element.getClientRects().length > 0;
+    const setValue = (element, value) => {
+        const descriptor = Object.getOwnPropertyDescriptor(Object.getPrototypeOf(element), "value");
+        if (descriptor && descriptor.set) {
+            descriptor.set.call(element, value);
+        } else {
+            element.value = value;
+        }
+        element.dispatchEvent(new Event("input", {bubbles: true}));
+        element.dispatchEvent(new Event("change", {bubbles: true}));
+    };
+    const rowText = row => Array.from(
+        row.querySelectorAll(selectors.cells),
+        cell => cell.textContent.trim()
+    ).slice(0, defaults[0].length).join("\t");
+    
+    if (isShown(document.querySelector(selectors.form))) {
+        document.querySelector(selectors.close).click();
+        await frame();
+    }
+    const search = document.querySelector(selectors.search);
+    const rowsSelect = document.querySelector(selectors.rowsSelect);
+    if (!search || !rowsSelect) return false;
+    if (search.value !== "") {
+        setValue(search, "");
+        await frame();
+    }
+    setValue(rowsSelect, rowsSelect.options[rowsSelect.options.length - 1].value);
+    await frame();
+    
+    const keep = new Set(defaults.map(values => values.join("\t")));
+    for (let deleted = 0; ; deleted++) {
+        const extra = Array.from(document.querySelectorAll(selectors.rows)).find(row => {
+            const text = rowText(row);
+            return text.replace(/\t/g, "") !== "" && !keep.has(text);
+        });
+        if (!extra) break;
+        const button = extra.querySelector(selectors.delete);
+        if (!button || deleted >= maxDeletes) return false;
+        button.click();
+        await frame();
+    }
+    
+    setValue(rowsSelect, pageSize);
+    await frame();
+    return true;
+}
+"""
+
+# State a fresh Web Tables page starts in, apart from its rows
+TABLE_CONTROLS_SCRIPT = """
+selectors => ({
+    search: document.querySelector(selectors.search)?.value ?? null,
+    formShown: (document.querySelector(selectors.form)?.getClientRects().length ?? 0) > 0,
+    rowsPerPage: document.querySelector(selectors.rowsSelect)?.value ?? null,
+    page: document.querySelector(selectors.pageJump)?.value ?? null
+})
+"""
+
+
+@dataclass(frozen=True)
+class SeedReport:
+    """Outcome of a bulk ``add_records`` call."""
+    
+    requested: int
+    added: int
+    rows_before: int
+    rows_after: int
+    elapsed_s: float
+    
+    @property
+    def records_per_second(self) -> float:
+        return self.added / self.elapsed_s if self.elapsed_s else 0.0
+    
+    @property
+    def ms_per_record(self) -> float:
+        return self.elapsed_s * 1000 / self.added if self.added else 0.0
+
+
+@dataclass(frozen=True)
+class TableRow:
+    """Typed record for a single Web Tables row."""
+    
+    first_name: str
+    last_name: str
+    age: str
+    email: str
+    salary: str
+    department: str
+    
+    def to_dict(self) -> Dict[str, str]:
+        """Return the row as a plain dictionary."""
+        return asdict(self)
+
+
+# Rows a freshly loaded Web Tables page shows
+DEFAULT_RECORDS = (
+    TableRow("Cierra", "Vega", "39", "cierra@example.com", "10000", "Insurance"),
+    TableRow("Alden", "Cantrell", "45", "alden@example.com", "12000", "Compliance"),
+    TableRow("Kierra", "Gentry", "29", "kierra@example.com", "2000", "Legal"),
+)
 
 
 class WebTablesPage(BasePage):
@@ -35,16 +272,98 @@ class WebTablesPage(BasePage):
     DELETE_BUTTON = "span[title='Delete']"
     
     # Pagination
-    PREVIOUS_BUTTON = "button:has-text('Previous')"
-    NEXT_BUTTON = "button:has-text('Next')"
+    PREVIOUS_BUTTON = ".-previous button"
+    NEXT_BUTTON = ".-next button"
     ROWS_SELECT = "select[aria-label='rows per page']"
+    PAGE_JUMP_INPUT = ".-pageJump input"
+    DEFAULT_ROWS_PER_PAGE = "10"
+    
+    # Giving up on a reset beats deleting hundreds of seeded rows one by one
+    RESET_MAX_DELETES = 50
+    
+    # Header label -> TableRow field
+    HEADER_FIELDS = {
+        "First Name": "first_name",
+        "Last Name": "last_name",
+        "Age": "age",
+        "Email": "email",
+        "Salary": "salary",
+        "Department": "department"
+    }
+    
+    # TableRow field -> registration form input
+    FORM_FIELDS = {
+        "first_name": FIRST_NAME_INPUT,
+        "last_name": LAST_NAME_INPUT,
+        "email": EMAIL_INPUT,
+        "age": AGE_INPUT,
+        "salary": SALARY_INPUT,
+        "department": DEPARTMENT_INPUT
+    }
     
     def __init__(self, page: Page):
         super().__init__(page)
     
     def navigate_to_page(self):
         """Navigate to Web Tables page."""
-        self.navigate(self.PAGE_URL)
+        super().navigate_to_page()
+    
+    @classmethod
+    def _reset_arguments(cls) -> Dict:
+        return {
+            "defaults": [
+                [getattr(row, name) for name in cls.HEADER_FIELDS.values()] for row in DEFAULT_RECORDS
+            ],
+            "selectors": cls._control_selectors(),
+            "pageSize": cls.DEFAULT_ROWS_PER_PAGE,
+            "maxDeletes": cls.RESET_MAX_DELETES
+        }
+    
+    @classmethod
+    def _count_arguments(cls, timeout: int) -> Dict:
+        return {
+            "rows": cls.TABLE_ROWS,
+            "cells": cls.TABLE_CELLS,
+            "previous": cls.PREVIOUS_BUTTON,
+            "next": cls.NEXT_BUTTON,
+            "pageJump": cls.PAGE_JUMP_INPUT,
+            "timeout": timeout
+        }
+    
+    @classmethod
+    def _control_selectors(cls) -> Dict[str, str]:
+        return {
+            "form": cls.REGISTRATION_FORM,
+            "close": cls.CLOSE_BUTTON,
+            "search": cls.SEARCH_BOX,
+            "rowsSelect": cls.ROWS_SELECT,
+            "pageJump": cls.PAGE_JUMP_INPUT,
+            "rows": cls.TABLE_ROWS,
+            "cells": cls.TABLE_CELLS,
+            "delete": cls.DELETE_BUTTON
+        }
+    
+    @classmethod
+    def _is_default_state(cls, controls: Dict, rows: List[TableRow]) -> bool:
+        return controls == {
+            "search": "",
+            "formShown": False,
+            "rowsPerPage": cls.DEFAULT_ROWS_PER_PAGE,
+            "page": "1"
+        } and rows == list(DEFAULT_RECORDS)
+    
+    def reset_page_state(self) -> bool:
+        """Delete added rows and undo search, paging and an open form in one script.
+        
+        Edited or deleted default rows cannot be restored in place; the
+        clean check then fails and the page is reloaded.
+        """
+        return self.page.evaluate(RESET_TABLE_SCRIPT, self._reset_arguments())
+    
+    def is_page_clean(self) -> bool:
+        """Whether the table shows exactly the default rows with default controls."""
+        controls = self.page.evaluate(TABLE_CONTROLS_SCRIPT, self._control_selectors())
+        return self._is_default_state(controls, self.get_table_rows())
     
     def click_add_button(self):
         """Click Add button to open registration form."""
@@ -53,15 +372,17 @@ class WebTablesPage(BasePage):
         self.wait_for_element_visible(self.REGISTRATION_FORM)
     
     def fill_registration_form(self, first_name: str, last_name: str, email: str, 
-                              age: str, salary: str, department: str):
+                              age: str, salary: str, department: str, fill_mode: Optional[str] = None):
         """Fill the registration form with provided data."""
         self.logger.info("Filling registration form")
-        self.fill(self.FIRST_NAME_INPUT, first_name)
-        self.fill(self.LAST_NAME_INPUT, last_name)
-        self.fill(self.EMAIL_INPUT, email)
-        self.fill(self.AGE_INPUT, age)
-        self.fill(self.SALARY_INPUT, salary)
-        self.fill(self.DEPARTMENT_INPUT, department)
+        self.fill_fields({
+            self.FIRST_NAME_INPUT: first_name,
+            self.LAST_NAME_INPUT: last_name,
+            self.EMAIL_INPUT: email,
+            self.AGE_INPUT: age,
+            self.SALARY_INPUT: salary,
+            self.DEPARTMENT_INPUT: department
+        }, mode=fill_mode)
     
     def click_submit(self):
         """Click submit button in form."""
@@ -69,23 +390,119 @@ class WebTablesPage(BasePage):
         self.click(self.SUBMIT_BUTTON)
     
     def add_new_record(self, first_name: str, last_name: str, email: str, 
-                       age: str, salary: str, department: str):
+                       age: str, salary: str, department: str, fill_mode: Optional[str] = None):
         """Add a new record to the table."""
         self.click_add_button()
-        self.fill_registration_form(first_name, last_name, email, age, salary, department)
+        self.fill_registration_form(first_name, last_name, email, age, salary, department, fill_mode)
         self.click_submit()
     
+    def add_records(self, records: Sequence[Union[Dict[str, str], TableRow]],
+                    batch_size: int = 100, timeout: int = 5000) -> SeedReport:
+        """Seed many records through the registration modal in a few round-trips.
+        
+        Each batch of ``batch_size`` records is entered by one in-page script
+        that opens the modal, sets the six fields, submits and waits for the
+        modal to close, so the form's own validation and handlers still run.
+        The total row count across all pages is checked before and after.
+        
+        Raises:
+            ValueError: If the form rejects a record.
+            RuntimeError: If the table does not grow by the number of records added.
+        """
+        payload = [
+            [[selector, str(record[name])] for name, selector in self.FORM_FIELDS.items()]
+            for record in (
+                row.to_dict() if isinstance(row, TableRow) else row for row in records
+            )
+        ]
+        selectors = {
+            "add": self.ADD_BUTTON,
+            "submit": self.SUBMIT_BUTTON,
+            "form": self.REGISTRATION_FORM,
+            "close": self.CLOSE_BUTTON
+        }
+        
+        rows_before = self.get_total_row_count()
+        added = 0
+        started = time.perf_counter()
+        for start in range(0, len(payload), batch_size):
+            result = self.page.evaluate(SEED_RECORDS_SCRIPT, {
+                "records": payload[start:start + batch_size],
+                "selectors": selectors,
+                "timeout": timeout
+            })
+            added += result["added"]
+            if result["failed"] is not None:
+                raise ValueError(
+                    f"Record {start + result['failed']} not added: {result['reason']}"
+                )
+        elapsed = time.perf_counter() - started
+        
+        report = SeedReport(
+            requested=len(payload),
+            added=added,
+            rows_before=rows_before,
+            rows_after=self.get_total_row_count(),
+            elapsed_s=elapsed
+        )
+        self.logger.info(
+            "Seeded %s records in %.2fs (%.0f records/s, %.1f ms/record)",
+            report.added, report.elapsed_s, report.records_per_second, report.ms_per_record,
+        )
+        if report.rows_after != rows_before + added:
+            raise RuntimeError(
+                f"Expected {rows_before + added} rows after seeding, found {report.rows_after}"
+            )
+        return report
+    
     def search(self, search_term: str):
         """Search in the table."""
-        self.logger.info(f"Searching for: {search_term}")
+        self.logger.info("Searching for: %s", search_term)
         self.fill(self.SEARCH_BOX, search_term)
     
     def clear_search(self):
         """Clear search box."""
         self.page.locator(self.SEARCH_BOX).clear()
     
-    def get_table_data(self) -> List[Dict[str, str]]:
-        """Get all data from the table as list of dictionaries."""
+    def get_table_rows(self) -> List[TableRow]:
+        """Get all non-empty table rows as typed records in one round-trip."""
+        result = self.page.locator(self.TABLE_ROWS).evaluate_all(
+            EXTRACT_TABLE_SCRIPT,
+            {"headers": self.TABLE_HEADERS, "cells": self.TABLE_CELLS}
+        )
+        column_index = self._map_columns(result["columns"])
+        
+        return [
+            TableRow(**{
+                name: values[index] if index < len(values) else ""
+                for name, index in column_index.items()
+            })
+            for values in result["rows"]
+        ]
+    
+    @classmethod
+    def _map_columns(cls, columns: List[str]) -> Dict[str, int]:
+        """Map TableRow fields to cell positions using the header labels."""
+        column_index = {}
+        for index, label in enumerate(columns):
+            name = cls.HEADER_FIELDS.get(label)
+            if name:
+                column_index[name] = index
+        
+        # Fall back to DemoQA's default column order if headers are missing
+        for position, row_field in enumerate(fields(TableRow)):
+            column_index.setdefault(row_field.name, position)
+        return column_index
+    
+    def get_table_data(self, bulk: bool = True) -> List[Dict[str, str]]:
+        """Get all data from the table as list of dictionaries.
+        
+        With ``bulk=False`` every cell is read through its own locator call,
+        which is slower but mirrors what a user would see cell by cell.
+        """
+        if bulk:
+            return [row.to_dict() for row in self.get_table_rows()]
+        
         rows = []
         row_elements = self.page.locator(self.TABLE_ROWS).all()
         
@@ -106,12 +523,20 @@ class WebTablesPage(BasePage):
     
     def get_row_count(self) -> int:
         """Get count of rows in table."""
-        data = self.get_table_data()
-        return len(data)
+        return self.page.locator(self.TABLE_ROWS).evaluate_all(
+            COUNT_ROWS_SCRIPT, self.TABLE_CELLS
+        )
+    
+    def get_total_row_count(self, timeout: int = 5000) -> int:
+        """Get count of rows across all pages in one round-trip.
+        
+        Waits up to ``timeout`` ms for each page turn to render.
+        """
+        return self.page.evaluate(COUNT_ALL_ROWS_SCRIPT, self._count_arguments(timeout))
     
     def click_edit_for_row(self, row_index: int):
         """Click edit button for specific row (0-based index)."""
-        self.logger.info(f"Clicking edit for row {row_index}")
+        self.logger.info("Clicking edit for row %s", row_index)
         edit_buttons = self.page.locator(self.EDIT_BUTTON).all()
         if row_index < len(edit_buttons):
             edit_buttons[row_index].click()
@@ -119,7 +544,7 @@ class WebTablesPage(BasePage):
     
     def click_delete_for_row(self, row_index: int):
         """Click delete button for specific row (0-based index)."""
-        self.logger.info(f"Clicking delete for row {row_index}")
+        self.logger.info("Clicking delete for row %s", row_index)
         delete_buttons = self.page.locator(self.DELETE_BUTTON).all()
         if row_index < len(delete_buttons):
             delete_buttons[row_index].click()
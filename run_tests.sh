@@ -67,6 +67,28 @@ run_parallel_tests() {
     pytest -n "$workers" -v
 }
 
+# Function to run one shard of the suite, split by recorded durations
+run_shard_tests() {
+    local shard=$1
+    local workers=${2:-auto}
+    print_info "Running shard $shard with $workers workers..."
+    pytest --shard="$shard" -n "$workers" -v
+}
+
+# Function to run tests in parallel on shared browser servers
+run_shared_tests() {
+    local workers=${1:-auto}
+    local servers=${2:-1}
+    print_info "Running tests with $workers workers sharing $servers browser server(s)..."
+    pytest -n "$workers" --browser-server=shared --browser-servers="$servers" -v
+}
+
+# Function to run tests lean and re-run failures with artifacts
+run_lean_tests() {
+    print_info "Running tests lean; failures re-run with tracing, video and screenshots..."
+    pytest --artifact-mode=rerun -v
+}
+
 # Function to run tests with specific browser
 run_browser_tests() {
     local browser=$1
@@ -116,6 +138,9 @@ Commands:
     smoke              Run smoke tests only
     element <name>     Run tests for specific element (e.g., text_box, buttons)
     parallel [n]       Run tests in parallel (default: auto detect cores)
+    shard <i/n> [n]    Run the i-th of n duration-balanced shards, in parallel
+    shared [n] [s]     Run in parallel on s shared browser servers (default: 1)
+    lean               Run without artifacts, re-run failures with artifacts
     browser <name>     Run tests with specific browser (chromium, firefox, webkit)
     headed             Run tests in headed mode with slow motion
     html               Generate HTML report
@@ -128,6 +153,9 @@ Examples:
     ./run_tests.sh smoke
     ./run_tests.sh element text_box
     ./run_tests.sh parallel 4
+    ./run_tests.sh shard 2/3
+    ./run_tests.sh shared 8 2
+    ./run_tests.sh lean
     ./run_tests.sh browser firefox
     ./run_tests.sh headed
     ./run_tests.sh html
@@ -167,6 +195,22 @@ main() {
             check_venv
             run_parallel_tests "${2:-auto}"
             ;;
+        shard)
+            check_venv
+            if [[ -z "$2" ]]; then
+                print_error "Please specify the shard (e.g., 1/3)"
+                exit 1
+            fi
+            run_shard_tests "$2" "${3:-auto}"
+            ;;
+        shared)
+            check_venv
+            run_shared_tests "${2:-auto}" "${3:-1}"
+            ;;
+        lean)
+            check_venv
+            run_lean_tests
+            ;;
         browser)
             check_venv
             if [[ -z "$2" ]]; then
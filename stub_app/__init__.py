@@ -0,0 +1,4 @@
+"""Local stand-in for the DemoQA pages exercised by the test suite."""
+from stub_app.server import StubServer
+
+__all__ = ["StubServer"]
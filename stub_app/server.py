@@ -0,0 +1,204 @@
+"""Threaded HTTP server serving the local DemoQA stand-in app."""
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+from urllib.parse import urlsplit
+import hashlib
+import logging
+import struct
+import threading
+import zlib
+
+
+SITE_DIR = Path(__file__).parent / "site"
+
+# Path -> (page template, page title)
+PAGES: Dict[str, Tuple[str, str]] = {
+    "/": ("home.html", "DEMOQA"),
+    "/text-box": ("text_box.html", "Text Box"),
+    "/checkbox": ("check_box.html", "Check Box"),
+    "/radio-button": ("radio_button.html", "Radio Button"),
+    "/webtables": ("web_tables.html", "Web Tables"),
+    "/buttons": ("buttons.html", "Buttons"),
+    "/links": ("links.html", "Links"),
+    "/broken": ("broken.html", "Broken Links - Images"),
+    "/upload-download": ("upload_download.html", "Upload and Download"),
+    "/dynamic-properties": ("dynamic_properties.html", "Dynamic Properties"),
+}
+
+# Status endpoints called by the links page
+STATUS_ROUTES: Dict[str, int] = {
+    "/created": 201,
+    "/no-content": 204,
+    "/moved": 301,
+    "/bad-request": 400,
+    "/unauthorized": 401,
+    "/forbidden": 403,
+    "/invalid-url": 404,
+}
+
+STATUS_CODES_PREFIX = "/status_codes/"
+VALID_IMAGE_PATH = "/images/Toolsqa.jpg"
+SAMPLE_FILE_PATH = "/sampleFile.jpeg"
+
+
+def _solid_png(width: int, height: int, rgb: Tuple[int, int, int]) -> bytes:
+    """Build a solid-colour PNG without any imaging dependency."""
+    def chunk(kind: bytes, data: bytes) -> bytes:
+        body = kind + data
+        return struct.pack(">I", len(data)) + body + struct.pack(">I", zlib.crc32(body))
+    
+    row = b"\x00" + bytes(rgb) * width
+    header = struct.pack(">IIBBBBB", width, height, 8, 2, 0, 0, 0)
+    return (
+        b"\x89PNG\r\n\x1a\n"
+        + chunk(b"IHDR", header)
+        + chunk(b"IDAT", zlib.compress(row * height))
+        + chunk(b"IEND", b"")
+    )
+
+
+IMAGE_BYTES = _solid_png(64, 32, (38, 115, 186))
+
+# Static assets may be cached but must be revalidated, like the live site's
+STATIC_CACHE_CONTROL = "no-cache"
+IMAGE_ETAG = '"%s"' % hashlib.sha256(IMAGE_BYTES).hexdigest()[:16]
+
+
+class StubRequestHandler(BaseHTTPRequestHandler):
+    """Request handler routing DemoQA paths to the bundled pages."""
+    
+    server_version = "DemoQAStub/1.0"
+    protocol_version = "HTTP/1.1"
+    
+    def do_GET(self):
+        """Serve pages, status endpoints and static assets."""
+        self._dispatch(send_body=True)
+    
+    def do_HEAD(self):
+        """Serve headers only for the same routes as GET."""
+        self._dispatch(send_body=False)
+    
+    def _dispatch(self, send_body: bool):
+        path = urlsplit(self.path).path.rstrip("/") or "/"
+        
+        if path in PAGES:
+            template, title = PAGES[path]
+            self._send(HTTPStatus.OK, self.server.render(template, title),
+                       "text/html; charset=utf-8", send_body)
+        elif path in STATUS_ROUTES:
+            self._send(STATUS_ROUTES[path], b"", "text/plain", send_body)
+        elif path.startswith(STATUS_CODES_PREFIX):
+            code = path[len(STATUS_CODES_PREFIX):]
+            status = int(code) if code.isdigit() and 100 <= int(code) < 600 else 404
+            body = f"This page returned a {status} status code.".encode()
+            self._send(status, body, "text/plain", send_body)
+        elif path == VALID_IMAGE_PATH:
+            self._send_static(IMAGE_BYTES, IMAGE_ETAG, "image/png", send_body)
+        elif path == SAMPLE_FILE_PATH:
+            self._send(HTTPStatus.OK, IMAGE_BYTES, "image/jpeg", send_body,
+                       {"Content-Disposition": 'attachment; filename="sampleFile.jpeg"'})
+        else:
+            self._send(HTTPStatus.NOT_FOUND, b"Not Found", "text/plain", send_body)
+    
+    def _send_static(self, body: bytes, etag: str, content_type: str, send_body: bool):
+        """Serve a cacheable asset, answering a matching If-None-Match with 304."""
+        headers = {"Cache-Control": STATIC_CACHE_CONTROL, "ETag": etag}
+        if self.headers.get("If-None-Match") == etag:
+            self._send(HTTPStatus.NOT_MODIFIED, b"", content_type, send_body, headers)
+        else:
+            self._send(HTTPStatus.OK, body, content_type, send_body, headers)
+    
+    def _send(self, status: int, body: bytes, content_type: str, send_body: bool,
+              headers: Optional[Dict[str, str]] = None):
+        headers = {"Cache-Control": "no-store", **(headers or {})}
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        if status in (HTTPStatus.NO_CONTENT, HTTPStatus.NOT_MODIFIED):
+            self.end_headers()
+            return
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        if send_body:
+            self.wfile.write(body)
+    
+    def log_message(self, format: str, *args):
+        """Route access logs through logging instead of stderr."""
+        self.server.logger.debug(format, *args)
+
+
+class _StubHTTPServer(ThreadingHTTPServer):
+    """ThreadingHTTPServer holding the rendered page cache."""
+    
+    daemon_threads = True
+    
+    def __init__(self, address: Tuple[str, int]):
+        super().__init__(address, StubRequestHandler)
+        self.logger = logging.getLogger("StubServer")
+        self._layout = (SITE_DIR / "layout.html").read_text(encoding="utf-8")
+        self._pages: Dict[str, bytes] = {}
+        self._lock = threading.Lock()
+    
+    def render(self, template: str, title: str) -> bytes:
+        """Render a page into the shared layout, caching the result."""
+        with self._lock:
+            if template not in self._pages:
+                content = (SITE_DIR / template).read_text(encoding="utf-8")
+                html = self._layout.replace("{{ title }}", title).replace("{{ content }}", content)
+                self._pages[template] = html.encode("utf-8")
+            return self._pages[template]
+
+
+class StubServer:
+    """Local DemoQA stand-in running on a background thread.
+    
+    Usage:
+        with StubServer() as server:
+            page.goto(f"{server.url}/text-box")
+    """
+    
+    def __init__(self, host: str = "127.0.0.1", port: int = 0):
+        self.host = host
+        self.port = port
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self._httpd: Optional[_StubHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+    
+    @property
+    def url(self) -> str:
+        """Base URL of the running server."""
+        if self._httpd is None:
+            raise RuntimeError("StubServer is not running")
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+    
+    def start(self) -> "StubServer":
+        """Start serving on a daemon thread."""
+        if self._httpd is not None:
+            return self
+        self._httpd = _StubHTTPServer((self.host, self.port))
+        self._thread = threading.Thread(
+            target=self._httpd.serve_forever, name="demoqa-stub", daemon=True
+        )
+        self._thread.start()
+        self.logger.info("DemoQA stand-in serving at %s", self.url)
+        return self
+    
+    def stop(self):
+        """Stop the server and wait for the serving thread to exit."""
+        if self._httpd is None:
+            return
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        self._thread.join()
+        self._httpd = None
+        self._thread = None
+    
+    def __enter__(self) -> "StubServer":
+        return self.start()
+    
+    def __exit__(self, *exc_info):
+        self.stop()
@@ -1,37 +1,37 @@
 """Root conftest file with shared fixtures."""
 import pytest
-import logging
 import os
 from pathlib import Path
 from datetime import datetime
 from playwright.sync_api import Page, BrowserContext
 from config.base_config import get_config
-
-
-# Configure logging
-def setup_logging():
-    """Setup logging configuration."""
-    log_dir = Path("logs")
-    log_dir.mkdir(exist_ok=True)
-    
-    log_file = log_dir / f"test_run_{datetime.now().strftime('%Y%m%d_%H%M%S')}.log"
-    
-    logging.basicConfig(
-        level=logging.INFO,
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        handlers=[
-            logging.FileHandler(log_file),
-            logging.StreamHandler()
-        ]
-    )
-
-
-setup_logging()
+from utils.page_runtime import install_runtime
+from utils.screenshot_writer import capture_options, extension, screenshot_writer
+
+
+pytest_plugins = [
+    "fixtures.local_app",
+    "fixtures.har_replay",
+    "fixtures.resource_blocking",
+    "fixtures.context_pool",
+    "fixtures.wait_report",
+    "fixtures.link_scanner",
+    "fixtures.async_pages",
+    "fixtures.concurrent_tests",
+    "fixtures.duration_scheduling",
+    "fixtures.action_timings",
+    "fixtures.artifact_reruns",
+    "fixtures.screenshot_writer",
+    "fixtures.structured_logging",
+    "fixtures.test_data",
+    "fixtures.browser_server",
+    "fixtures.asset_cache",
+]
 
 
 @pytest.fixture(scope="session")
-def config():
-    """Get test configuration."""
+def config(app_base_url):
+    """Get test configuration pointed at the application under test."""
     return get_config()
 
 
@@ -49,31 +49,61 @@ def browser_context_args(config):
 
 
 @pytest.fixture(scope="function")
-def context(new_context, config):
-    """Create a new browser context for each test via pytest-playwright wrapper."""
+def context(request, config, context_pool, asset_cache_router, har_router, resource_blocker):
+    """Provide a browser context per test, leased from the pool when enabled."""
     # Create downloads directory
     download_dir = Path(config.DOWNLOAD_DIR)
     download_dir.mkdir(parents=True, exist_ok=True)
     
-    # Use pytest-playwright's new_context fixture so trace/video/screenshot
-    # recording hooks are attached to this context.
-    context = new_context(accept_downloads=True)
+    if context_pool:
+        context = request.getfixturevalue("pooled_context")
+    else:
+        # Use pytest-playwright's new_context fixture so trace/video/screenshot
+        # recording hooks are attached to this context.
+        context_args = {"accept_downloads": True}
+        # Our browser_context_args replaces pytest-playwright's, which is
+        # where it would have set up video recording
+        if request.config.getoption("--video") in ("on", "retain-on-failure"):
+            context_args["record_video_dir"] = request.getfixturevalue("_pw_artifacts_folder").name
+        context = request.getfixturevalue("new_context")(**context_args)
+    install_runtime(context)
+    
+    # Routes run last-registered first: blocked requests never reach the HAR
+    # layer, and only requests the HAR archive does not serve reach the cache
+    if asset_cache_router:
+        asset_cache_router.attach(context)
+    if har_router:
+        har_router.attach(context)
+    if resource_blocker:
+        resource_blocker.attach(context)
     
     yield context
-    context.close()
+    
+    if context_pool:
+        # The pool resets and reuses the context once pooled_context tears down
+        if resource_blocker:
+            resource_blocker.detach(context)
+        if har_router:
+            har_router.detach(context)
+        if asset_cache_router:
+            asset_cache_router.detach(context)
+    else:
+        context.close()
 
 
 @pytest.fixture(scope="function")
-def page(context: BrowserContext) -> Page:
-    """Create a new page for each test."""
-    page = context.new_page()
+def page(context: BrowserContext, context_pool) -> Page:
+    """Create a new page for each test, or reuse the pooled context's kept page."""
+    keep_page = context_pool is not None and context_pool.keep_pages
+    page = context_pool.main_page(context) if keep_page else context.new_page()
     
     # Set default timeout
     page.set_default_timeout(30000)
     page.set_default_navigation_timeout(30000)
     
     yield page
-    page.close()
+    if not keep_page:
+        page.close()
 
 
 @pytest.fixture(scope="function")
@@ -82,18 +112,14 @@ def screenshot_on_failure(request, page: Page, config):
     yield
     
     if request.node.rep_call.failed if hasattr(request.node, 'rep_call') else False:
-        # Create screenshots directory
-        screenshot_dir = Path(config.SCREENSHOT_DIR)
-        screenshot_dir.mkdir(parents=True, exist_ok=True)
-        
         # Generate screenshot filename
+        options = capture_options(config)
         test_name = request.node.name
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        screenshot_file = screenshot_dir / f"{test_name}_{timestamp}.png"
+        screenshot_file = Path(config.SCREENSHOT_DIR) / f"{test_name}_{timestamp}{extension(options)}"
         
-        # Take screenshot
-        page.screenshot(path=str(screenshot_file), full_page=True)
-        logging.info(f"Screenshot saved: {screenshot_file}")
+        # Capture now; the file is written in the background
+        screenshot_writer.submit(page.screenshot(**options), screenshot_file)
 
 
 @pytest.hookimpl(tryfirst=True, hookwrapper=True)
@@ -0,0 +1,50 @@
+"""Test cases driving several pages concurrently with the async page objects."""
+import asyncio
+import pytest
+from pages.aio.elements.buttons_page import ButtonsPage
+from pages.aio.elements.text_box_page import TextBoxPage
+from pages.elements.text_box_page import TextBoxPage as SyncTextBoxPage
+from utils.data_generator import TEXT_BOX_FIELDS
+
+
+@pytest.mark.elements
+class TestAsyncPages:
+    """Test cases for the async page object layer."""
+    
+    def test_async_pages_share_sync_locators(self):
+        """Test async page objects reuse the sync page objects' locators."""
+        assert TextBoxPage.PAGE_URL == SyncTextBoxPage.PAGE_URL
+        assert TextBoxPage.FULL_NAME_INPUT == SyncTextBoxPage.FULL_NAME_INPUT
+        assert TextBoxPage.RESOURCE_POLICY == SyncTextBoxPage.RESOURCE_POLICY
+    
+    @pytest.mark.text_box
+    async def test_text_box_forms_concurrently(self, async_page_factory, data_generator):
+        """Test submitting the text box form on several pages at once."""
+        pages = [TextBoxPage(await async_page_factory()) for _ in range(4)]
+        forms = data_generator.generate_records(len(pages), TEXT_BOX_FIELDS)
+        
+        await asyncio.gather(*(page.navigate_to_page() for page in pages))
+        await asyncio.gather(*(page.submit_form(**form) for page, form in zip(pages, forms)))
+        outputs = await asyncio.gather(*(page.get_all_output_data() for page in pages))
+        
+        for output, form in zip(outputs, forms):
+            assert output["name"] == form["full_name"]
+            assert output["email"] == form["email"]
+    
+    @pytest.mark.buttons
+    async def test_buttons_concurrently(self, async_page_factory):
+        """Test each button type on its own page at the same time."""
+        pages = [ButtonsPage(await async_page_factory()) for _ in range(3)]
+        await asyncio.gather(*(page.navigate_to_page() for page in pages))
+        
+        double, right, dynamic = pages
+        await asyncio.gather(
+            double.double_click_button(),
+            right.right_click_button(),
+            dynamic.click_dynamic_button(),
+        )
+        
+        assert await double.wait_until_double_click_message_displayed()
+        assert await right.wait_until_right_click_message_displayed()
+        assert await dynamic.wait_until_dynamic_click_message_displayed()
+        assert "right click" in await right.get_right_click_message()
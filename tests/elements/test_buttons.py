@@ -6,6 +6,7 @@ from pages.elements.buttons_page import ButtonsPage
 
 @pytest.mark.elements
 @pytest.mark.buttons
+@pytest.mark.parallel
 class TestButtons:
     """Test cases for Buttons functionality."""
     
@@ -20,7 +21,7 @@ class TestButtons:
         """Test double click button functionality."""
         self.buttons_page.double_click_button()
         
-        assert self.buttons_page.is_double_click_message_displayed()
+        assert self.buttons_page.wait_until_double_click_message_displayed()
         message = self.buttons_page.get_double_click_message()
         assert "You have done a double click" in message
     
@@ -29,7 +30,7 @@ class TestButtons:
         """Test right click button functionality."""
         self.buttons_page.right_click_button()
         
-        assert self.buttons_page.is_right_click_message_displayed()
+        assert self.buttons_page.wait_until_right_click_message_displayed()
         message = self.buttons_page.get_right_click_message()
         assert "You have done a right click" in message
     
@@ -38,7 +39,7 @@ class TestButtons:
         """Test dynamic click button functionality."""
         self.buttons_page.click_dynamic_button()
         
-        assert self.buttons_page.is_dynamic_click_message_displayed()
+        assert self.buttons_page.wait_until_dynamic_click_message_displayed()
         message = self.buttons_page.get_dynamic_click_message()
         assert "You have done a dynamic click" in message
     
@@ -46,43 +47,62 @@ class TestButtons:
         """Test clicking all buttons in sequence."""
         # Double click
         self.buttons_page.double_click_button()
-        assert self.buttons_page.is_double_click_message_displayed()
+        assert self.buttons_page.wait_until_double_click_message_displayed()
         
         # Right click
         self.buttons_page.right_click_button()
-        assert self.buttons_page.is_right_click_message_displayed()
+        assert self.buttons_page.wait_until_right_click_message_displayed()
         
         # Dynamic click
         self.buttons_page.click_dynamic_button()
-        assert self.buttons_page.is_dynamic_click_message_displayed()
+        assert self.buttons_page.wait_until_dynamic_click_message_displayed()
         
         # Verify all messages are still displayed
         assert "double click" in self.buttons_page.get_double_click_message()
         assert "right click" in self.buttons_page.get_right_click_message()
         assert "dynamic click" in self.buttons_page.get_dynamic_click_message()
     
+    def test_all_buttons_in_one_batch(self):
+        """Test clicking all buttons and reading the messages in one batch."""
+        messages = self.buttons_page.click_all_buttons()
+        
+        assert "double click" in messages["double_click"]
+        assert "right click" in messages["right_click"]
+        assert "dynamic click" in messages["dynamic_click"]
+        assert self.buttons_page.is_dynamic_click_message_displayed()
+    
     def test_multiple_double_clicks(self):
         """Test multiple double clicks on the same button."""
         # First double click
         self.buttons_page.double_click_button()
-        assert self.buttons_page.is_double_click_message_displayed()
+        assert self.buttons_page.wait_until_double_click_message_displayed()
         
         # Second double click (verify message persists or updates)
         self.buttons_page.double_click_button()
-        assert self.buttons_page.is_double_click_message_displayed()
+        assert self.buttons_page.wait_until_double_click_message_displayed()
     
     def test_multiple_right_clicks(self):
         """Test multiple right clicks on the same button."""
         self.buttons_page.right_click_button()
-        assert self.buttons_page.is_right_click_message_displayed()
+        assert self.buttons_page.wait_until_right_click_message_displayed()
         
         self.buttons_page.right_click_button()
-        assert self.buttons_page.is_right_click_message_displayed()
+        assert self.buttons_page.wait_until_right_click_message_displayed()
     
     def test_multiple_dynamic_clicks(self):
         """Test multiple clicks on dynamic button."""
         self.buttons_page.click_dynamic_button()
-        assert self.buttons_page.is_dynamic_click_message_displayed()
+        assert self.buttons_page.wait_until_dynamic_click_message_displayed()
         
         self.buttons_page.click_dynamic_button()
-        assert self.buttons_page.is_dynamic_click_message_displayed()
+        assert self.buttons_page.wait_until_dynamic_click_message_displayed()
+    
+    def test_messages_hidden_before_clicking(self):
+        """Test no message is shown before any button is clicked."""
+        assert not self.buttons_page.is_double_click_message_displayed()
+        assert not self.buttons_page.is_right_click_message_displayed()
+        assert not self.buttons_page.is_dynamic_click_message_displayed()
+        
+        assert self.buttons_page.get_double_click_message() == ""
+        assert self.buttons_page.get_right_click_message() == ""
+        assert self.buttons_page.get_dynamic_click_message() == ""
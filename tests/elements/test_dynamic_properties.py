@@ -0,0 +1,47 @@
+"""Test cases for Dynamic Properties page."""
+import pytest
+from playwright.sync_api import Page
+from pages.elements.dynamic_properties_page import DynamicPropertiesPage
+
+
+@pytest.mark.elements
+@pytest.mark.dynamic_properties
+class TestDynamicProperties:
+    """Test cases for Dynamic Properties functionality.
+    
+    The page's 5-second timers are fast-forwarded with a virtual clock, so
+    these tests exercise the real transitions without waiting for them.
+    """
+    
+    @pytest.fixture(autouse=True)
+    def setup(self, page: Page):
+        """Setup for each test."""
+        self.dynamic_page = DynamicPropertiesPage(page, virtual_clock=True)
+        self.dynamic_page.navigate_to_page()
+    
+    @pytest.mark.smoke
+    def test_random_id_text_visible(self):
+        """Test random ID text is displayed."""
+        assert self.dynamic_page.is_random_id_text_visible()
+        assert self.dynamic_page.get_random_id_text() == "This text has random Id"
+    
+    def test_enable_after_button_initially_disabled(self):
+        """Test 'Enable After' button starts disabled before the timer fires."""
+        assert not self.dynamic_page.is_enabled(self.dynamic_page.ENABLE_AFTER_BUTTON)
+    
+    def test_enable_after_button_becomes_enabled(self):
+        """Test 'Enable After' button is enabled after the timer fires."""
+        assert self.dynamic_page.is_enable_after_button_enabled(timeout=1000)
+        self.dynamic_page.click_enable_after_button()
+    
+    def test_color_change(self):
+        """Test color change button turns red after the timer fires."""
+        assert not self.dynamic_page.is_color_changed()
+        
+        self.dynamic_page.wait_for_color_change(timeout=1000)
+        assert self.dynamic_page.is_color_changed()
+    
+    def test_visible_after_button_appears(self):
+        """Test 'Visible After' button appears after the timer fires."""
+        self.dynamic_page.wait_for_visible_after_button(timeout=1000)
+        self.dynamic_page.click_visible_after_button()
@@ -110,6 +110,25 @@ class TestTextBox:
         assert output_data["name"] == full_name
         assert output_data["email"] == email
     
+    def test_submit_form_in_one_batch(self):
+        """Test the batched submit returns the same output as the step-by-step getters."""
+        form = {
+            "full_name": "Dana Lee",
+            "email": "dana.lee@example.com",
+            "current_address": "7 Elm St",
+            "permanent_address": "8 Pine Rd"
+        }
+        
+        output_data = self.text_box_page.submit_form_and_read(**form)
+        
+        assert output_data == {
+            "name": form["full_name"],
+            "email": form["email"],
+            "current_address": form["current_address"],
+            "permanent_address": form["permanent_address"]
+        }
+        assert output_data == self.text_box_page.get_all_output_data()
+    
     def test_email_field_validation(self):
         """Test email field with invalid email format."""
         # Note: DemoQA may or may not have client-side validation
@@ -204,3 +204,28 @@ class TestWebTables:
         
         # All results should show more records than filtered
         assert len(all_results) >= len(filtered_results)
+    
+    def test_bulk_table_data_matches_cell_reads(self):
+        """Test bulk table extraction returns the same data as per-cell reads."""
+        bulk_data = self.web_tables_page.get_table_data()
+        cell_data = self.web_tables_page.get_table_data(bulk=False)
+        
+        assert bulk_data == cell_data
+        assert self.web_tables_page.get_row_count() == len(cell_data)
+        
+        rows = self.web_tables_page.get_table_rows()
+        assert [row.to_dict() for row in rows] == bulk_data
+    
+    def test_add_records_seeds_every_page(self, data_generator):
+        """Test bulk seeding adds every record across paginated results."""
+        records = data_generator.generate_multiple_records(25)
+        
+        report = self.web_tables_page.add_records(records, batch_size=10)
+        
+        assert report.added == 25
+        assert report.rows_after == report.rows_before + 25
+        assert report.records_per_second > 0
+        
+        self.web_tables_page.search(records[-1]["email"])
+        table_data = self.web_tables_page.get_table_data()
+        assert table_data[0]["email"] == records[-1]["email"]
@@ -0,0 +1,87 @@
+"""Test cases for the columnar record pool."""
+import os
+import pytest
+from utils.data_generator import TABLE_FIELDS, DataGenerator
+from utils.record_pool import RecordPool, write_pool
+
+
+COLUMNS = {
+    "name": ["Ada", "Grace", "Ada", "Zoë"],
+    "department": ["QA", "QA", "IT", "QA"],
+}
+
+
+@pytest.mark.parallel
+class TestRecordPool:
+    """Test cases for writing, reading and generating record pools."""
+    
+    @pytest.fixture(autouse=True)
+    def setup(self, tmp_path):
+        """Setup for each test."""
+        self.path = tmp_path / "pools" / "users.pool"
+    
+    def test_round_trip(self):
+        """Test records read back in order, whole or by field and range."""
+        write_pool(self.path, COLUMNS)
+        pool = RecordPool(self.path)
+        
+        assert len(pool) == 4
+        assert pool.fields == ["name", "department"]
+        assert list(pool) == [dict(zip(COLUMNS, row)) for row in zip(*COLUMNS.values())]
+        assert pool[-1] == {"name": "Zoë", "department": "QA"}
+        assert pool.record(2, fields=["department"]) == {"department": "IT"}
+        assert pool.records(1, 3, fields=["name"]) == [{"name": "Grace"}, {"name": "Ada"}]
+        with pytest.raises(IndexError):
+            pool.record(4)
+    
+    def test_round_trip_with_wide_indices(self):
+        """Test a column with more distinct values than 16-bit indices hold."""
+        values = [f"user{index}" for index in range(70000)]
+        write_pool(self.path, {"name": values})
+        
+        assert RecordPool(self.path).column("name") == values
+    
+    def test_invalid_input_is_rejected(self, tmp_path):
+        """Test uneven columns, NUL characters and foreign files raise ValueError."""
+        with pytest.raises(ValueError):
+            write_pool(self.path, {"name": ["Ada"], "department": []})
+        with pytest.raises(ValueError):
+            write_pool(self.path, {"name": ["A\x00da"]})
+        
+        other = tmp_path / "other.pool"
+        other.write_bytes(b"not a pool at all")
+        with pytest.raises(ValueError):
+            RecordPool(other)
+    
+    def test_failed_write_keeps_the_previous_pool(self, monkeypatch):
+        """Test a write that fails before the rename leaves the existing pool readable."""
+        write_pool(self.path, COLUMNS)
+        assert [path.name for path in self.path.parent.iterdir()] == ["users.pool"]
+        
+        def fail(source, target):
+            raise OSError("disk full")
+        
+        monkeypatch.setattr(os, "replace", fail)
+        with pytest.raises(OSError):
+            write_pool(self.path, {"name": ["Linus"]})
+        
+        assert RecordPool(self.path).column("name") == COLUMNS["name"]
+        assert [path.name for path in self.path.parent.iterdir()] == ["users.pool"]
+    
+    def test_seeded_generators_are_deterministic(self):
+        """Test the same run seed and test give the same data, and another test does not."""
+        first = DataGenerator.for_test("tests/test_a.py::test_one", run_seed=42)
+        second = DataGenerator.for_test("tests/test_a.py::test_one", run_seed=42)
+        other = DataGenerator.for_test("tests/test_a.py::test_two", run_seed=42)
+        
+        assert first.generate_user_data() == second.generate_user_data()
+        assert first.generate_records(20, TABLE_FIELDS) == second.generate_records(20, TABLE_FIELDS)
+        assert other.generate_records(20, TABLE_FIELDS) != first.generate_records(20, TABLE_FIELDS)
+    
+    def test_seeded_pools_are_identical(self, tmp_path):
+        """Test pools built from the same seed are byte-for-byte identical."""
+        DataGenerator.for_test("build", run_seed=7).build_pool(tmp_path / "first.pool", 100)
+        DataGenerator.for_test("build", run_seed=7).build_pool(tmp_path / "second.pool", 100)
+        
+        assert (tmp_path / "first.pool").read_bytes() == (tmp_path / "second.pool").read_bytes()
+        assert len(RecordPool(tmp_path / "first.pool")) == 100
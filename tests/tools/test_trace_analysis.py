@@ -0,0 +1,115 @@
+"""Test cases for the trace analysis."""
+import json
+import zipfile
+import pytest
+from utils.trace_analysis import RunAnalysis, TraceBreakdown, TraceCall, analyze_trace, covered, merge_intervals
+
+
+def event_lines(events):
+    """JSON lines, as trace files store events."""
+    return "".join(json.dumps(event) + "\n" for event in events)
+
+
+def call_events(call_id, api_name, method, start, end, params=None, performing=None):
+    """before/log/after events of one API call."""
+    events = [{"type": "before", "callId": call_id, "apiName": api_name, "method": method,
+               "params": params or {}, "startTime": start}]
+    if performing is not None:
+        events.append({"type": "log", "callId": call_id, "time": performing, "message": "  performing click action"})
+    events.append({"type": "after", "callId": call_id, "endTime": end})
+    return events
+
+
+def write_trace(path, events, requests):
+    """Write a trace zip with the given calls and (start, duration) requests."""
+    with zipfile.ZipFile(path, "w") as archive:
+        # Snapshots are skipped before parsing, so even a malformed one is harmless
+        archive.writestr("trace.trace", '{"type":"frame-snapshot", not json\n' + event_lines(events))
+        archive.writestr("trace.network", event_lines(
+            {"type": "resource-snapshot", "snapshot": {"_monotonicTime": start, "time": duration}}
+            for start, duration in requests
+        ))
+    return path
+
+
+def breakdown(name, wall_ms, calls=()):
+    """A breakdown with the given wall time and calls."""
+    result = TraceBreakdown(name, wall_ms=wall_ms)
+    result.calls.extend(calls)
+    return result
+
+
+@pytest.mark.parallel
+class TestTraceAnalysis:
+    """Test cases for interval merging, time attribution and run aggregation."""
+    
+    def test_merge_intervals_joins_overlapping_and_touching(self):
+        """Test overlapping and touching intervals merge and the result is sorted."""
+        merged = merge_intervals([(5, 7), (1, 3), (2, 4), (4, 4.5), (8, 9)])
+        
+        assert merged == [(1, 4.5), (5, 7), (8, 9)]
+    
+    def test_covered_counts_only_the_overlap(self):
+        """Test coverage of a window is clipped to the merged intervals inside it."""
+        merged = [(0, 10), (20, 30), (40, 50)]
+        starts = [start for start, _ in merged]
+        
+        assert covered(merged, starts, 5, 25) == 10
+        assert covered(merged, starts, 10, 20) == 0
+        assert covered(merged, starts, 0, 100) == 30
+    
+    def test_every_millisecond_lands_in_one_category(self, tmp_path):
+        """Test a synthetic trace is split into the expected categories."""
+        events = [
+            *call_events("call@1", "page.goto", "goto", 0, 100, {"url": "https://demoqa.com/text-box"}),
+            *call_events("call@2", "locator.click", "click", 110, 200, {"selector": "#submit"}, performing=150),
+            *call_events("call@3", "page.waitForSelector", "waitForSelector", 200, 230, {"selector": "#output"}),
+            # Awaited inside the wait above; its time is already counted
+            *call_events("call@4", "page.waitForEvent", "waitForEventInfo", 205, 220),
+            *call_events("call@5", "locator.click", "click", 240, 250, {"selector": "#submit"}),
+        ]
+        requests = [(20, 40), (245, 3), (246, 9)]
+        
+        result = analyze_trace(write_trace(tmp_path / "trace.zip", events, requests), "synthetic")
+        
+        assert result.name == "synthetic"
+        assert result.wall_ms == 250
+        assert result.categories == {
+            "python": 20,
+            "navigation": 60,
+            "network": 45,
+            "actionability": 40,
+            "explicit_wait": 30,
+            "browser": 55,
+        }
+        assert sum(result.categories.values()) == result.wall_ms
+        assert [call.api_name for call in result.calls][:2] == ["page.goto", "locator.click"]
+    
+    def test_run_keeps_only_the_slowest_tests(self):
+        """Test the run aggregate keeps the top N tests, slowest first."""
+        analysis = RunAnalysis({}, {}, top_n=2)
+        for name, wall_ms in (("fast", 10), ("slowest", 30), ("slow", 20)):
+            analysis.add(breakdown(name, wall_ms))
+        
+        assert analysis.traces == 3
+        assert analysis.wall_ms == 60
+        assert [test["name"] for test in analysis.slowest_tests()] == ["slowest", "slow"]
+    
+    def test_operations_are_named_after_page_locators(self):
+        """Test calls aggregate per page-class locator or page URL."""
+        analysis = RunAnalysis({"#submit": "TextBoxPage.SUBMIT"}, {"/text-box": "TextBoxPage"})
+        analysis.add(breakdown("first", 100, [
+            TraceCall("page.goto", "goto", None, "https://demoqa.com/text-box", 0, 40),
+            TraceCall("locator.click", "click", "#submit >> nth=0", None, 40, 50),
+        ]))
+        analysis.add(breakdown("second", 100, [
+            TraceCall("locator.click", "click", "#submit", None, 0, 30),
+            TraceCall("locator.fill", "fill", "#unknown", None, 30, 35),
+        ]))
+        
+        operations = {operation.pop("operation"): operation for operation in analysis.slowest_operations()}
+        
+        assert list(operations) == ["TextBoxPage page.goto", "TextBoxPage.SUBMIT locator.click", "#unknown locator.fill"]
+        assert operations["TextBoxPage.SUBMIT locator.click"] == {
+            "count": 2, "total_ms": 40, "mean_ms": 20, "max_ms": 30,
+        }
@@ -0,0 +1,58 @@
+"""Test cases for the trace store."""
+import zipfile
+import pytest
+from utils.trace_store import TraceStore
+
+
+SHARED_SCRIPT = b"console.log('shared bundle');" * 200
+
+
+def write_trace(path, entries):
+    """Write a trace-like zip with the given name -> bytes entries."""
+    with zipfile.ZipFile(path, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+        for name, data in entries.items():
+            archive.writestr(name, data)
+    return path
+
+
+@pytest.mark.parallel
+class TestTraceStore:
+    """Test cases for ingesting and rebuilding traces."""
+    
+    @pytest.fixture(autouse=True)
+    def setup(self, tmp_path):
+        """Setup for each test."""
+        self.tmp_path = tmp_path
+        self.store = TraceStore(tmp_path / "store")
+        self.first = write_trace(tmp_path / "first.zip", {
+            "trace.trace": b'{"type":"before","callId":"call@1"}\n',
+            "resources/shared.js": SHARED_SCRIPT,
+        })
+        self.second = write_trace(tmp_path / "second.zip", {
+            "trace.trace": b'{"type":"before","callId":"call@2"}\n',
+            "resources/shared.js": SHARED_SCRIPT,
+        })
+    
+    def test_shared_resource_stored_once(self):
+        """Test a resource both traces contain is stored as a single blob."""
+        first = self.store.ingest(self.first, "first")
+        second = self.store.ingest(self.second, "second")
+        
+        assert first.new_blobs == 2
+        assert second.new_blobs == 1
+        assert self.store.names() == ["first", "second"]
+        assert sum(1 for path in self.store.blob_dir.rglob("*") if path.is_file()) == 3
+    
+    def test_rebuild_round_trips_entries(self):
+        """Test a rebuilt trace has the same entries, contents and metadata as the original."""
+        self.store.ingest(self.first, "first")
+        self.store.ingest(self.second, "second")
+        
+        rebuilt = self.store.rebuild("second", self.tmp_path / "rebuilt" / "trace.zip")
+        
+        with zipfile.ZipFile(self.second) as original, zipfile.ZipFile(rebuilt) as copy:
+            assert [info.filename for info in copy.infolist()] == [info.filename for info in original.infolist()]
+            for info in original.infolist():
+                restored = copy.getinfo(info.filename)
+                assert copy.read(info.filename) == original.read(info.filename)
+                assert (restored.date_time, restored.compress_type) == (info.date_time, info.compress_type)
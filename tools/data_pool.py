@@ -0,0 +1,43 @@
+"""Build and inspect precomputed test-data pools.
+
+Usage:
+    python -m tools.data_pool build test_data/pools/users.pool --count 100000 [--seed 0] [--fields ...]
+    python -m tools.data_pool info test_data/pools/users.pool [--show 5]
+"""
+import argparse
+import time
+from pathlib import Path
+from utils.data_generator import USER_FIELDS, DataGenerator
+from utils.record_pool import RecordPool
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+    
+    build = commands.add_parser("build", help="Generate records into a pool file.")
+    build.add_argument("path", type=Path)
+    build.add_argument("--count", type=int, default=10000)
+    build.add_argument("--seed", type=int, default=0)
+    build.add_argument("--fields", nargs="+", choices=USER_FIELDS, default=list(USER_FIELDS))
+    build.add_argument("--locale", default="en_US")
+    
+    info = commands.add_parser("info", help="Show a pool's size and first records.")
+    info.add_argument("path", type=Path)
+    info.add_argument("--show", type=int, default=3)
+    args = parser.parse_args()
+    
+    if args.command == "build":
+        started = time.perf_counter()
+        DataGenerator(args.locale, seed=args.seed).build_pool(args.path, args.count, args.fields)
+        elapsed = time.perf_counter() - started
+        print(f"{args.count} records in {elapsed:.2f}s, {args.path.stat().st_size / 1024:.0f} KiB: {args.path}")
+    else:
+        pool = RecordPool(args.path)
+        print(f"{len(pool)} records, fields: {', '.join(pool.fields)}")
+        for record in pool.records(0, args.show):
+            print(record)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""Break down where test time goes, from Playwright traces.
+
+Usage:
+    python -m tools.trace_analyzer test-results --top 20 --json reports/trace-analysis.json
+"""
+import argparse
+import json
+from pathlib import Path
+from typing import Iterator, List
+from utils.trace_analysis import CATEGORIES, RunAnalysis, analyze_trace, load_page_locators
+
+
+def find_traces(paths: List[Path]) -> Iterator[Path]:
+    """Trace zips given directly or found under the given directories."""
+    for path in paths:
+        if path.is_dir():
+            yield from sorted(path.rglob("trace*.zip"))
+        else:
+            yield path
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("paths", type=Path, nargs="*", default=[Path("test-results")])
+    parser.add_argument("--top", type=int, default=20, help="Slowest tests and operations to list.")
+    parser.add_argument("--json", type=Path, default=None, help="Write the run summary here.")
+    parser.add_argument("--per-test", type=Path, default=None, help="Write one JSON line per test here.")
+    args = parser.parse_args()
+    
+    selectors, urls = load_page_locators()
+    analysis = RunAnalysis(selectors, urls, top_n=args.top)
+    per_test = open(args.per_test, "w") if args.per_test else None
+    try:
+        for trace_path in find_traces(args.paths):
+            breakdown = analyze_trace(trace_path)
+            analysis.add(breakdown)
+            if per_test:
+                per_test.write(json.dumps(breakdown.to_dict()) + "\n")
+    finally:
+        if per_test:
+            per_test.close()
+    
+    if not analysis.traces:
+        print("No traces found")
+        return
+    
+    wall_s = analysis.wall_ms / 1000
+    print(f"{analysis.traces} traces, {wall_s:.1f}s of test wall time")
+    for category in CATEGORIES:
+        value = analysis.categories[category]
+        print(f"  {category:<14}{value / 1000:>9.1f}s {value / analysis.wall_ms:>6.1%}")
+    
+    header = "".join(f"{category[:10]:>11}" for category in CATEGORIES)
+    print(f"\nslowest tests (ms){'wall':>8}{header}")
+    for test in analysis.slowest_tests():
+        row = "".join(f"{test[category]:>11.0f}" for category in CATEGORIES)
+        print(f"  {test['wall_ms']:>24.0f}{row}  {test['name']}")
+    
+    print(f"\nslowest operations{'count':>8}{'total ms':>10}{'mean ms':>9}{'max ms':>9}")
+    for operation in analysis.slowest_operations(args.top):
+        print(f"  {operation['count']:>24}{operation['total_ms']:>10.0f}{operation['mean_ms']:>9.0f}"
+              f"{operation['max_ms']:>9.0f}  {operation['operation']}")
+    
+    if args.json:
+        args.json.parent.mkdir(parents=True, exist_ok=True)
+        args.json.write_text(json.dumps(analysis.to_dict(), indent=2))
+
+
+if __name__ == "__main__":
+    main()
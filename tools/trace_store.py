@@ -0,0 +1,43 @@
+"""Deduplicate Playwright traces into a content-addressed store.
+
+Usage:
+    python -m tools.trace_store --store trace-store ingest test-results [--remove]
+    python -m tools.trace_store --store trace-store list
+    python -m tools.trace_store --store trace-store rebuild <name> [-o trace.zip]
+"""
+import argparse
+from pathlib import Path
+from utils.trace_store import TraceStore
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--store", type=Path, default=Path("trace-store"))
+    commands = parser.add_subparsers(dest="command", required=True)
+    
+    ingest = commands.add_parser("ingest", help="Add every trace zip under a results directory.")
+    ingest.add_argument("results", type=Path, nargs="?", default=Path("test-results"))
+    ingest.add_argument("--remove", action="store_true", help="Delete each zip once stored.")
+    
+    commands.add_parser("list", help="List stored traces.")
+    
+    rebuild = commands.add_parser("rebuild", help="Write a stored trace back out as a zip.")
+    rebuild.add_argument("name")
+    rebuild.add_argument("-o", "--output", type=Path, default=None)
+    args = parser.parse_args()
+    
+    store = TraceStore(args.store)
+    if args.command == "ingest":
+        stats = store.ingest_tree(args.results, remove=args.remove)
+        print(f"{stats.traces} traces, {stats.entries} entries, {stats.new_blobs} new blobs")
+        print(f"{stats.bytes_in / 1024 / 1024:.1f} MiB in, {stats.bytes_stored / 1024 / 1024:.1f} MiB stored, "
+              f"store now {store.disk_usage() / 1024 / 1024:.1f} MiB")
+    elif args.command == "list":
+        for name in store.names():
+            print(name)
+    else:
+        print(store.rebuild(args.name, args.output or Path(f"{args.name}.zip")))
+
+
+if __name__ == "__main__":
+    main()
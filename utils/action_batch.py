@@ -0,0 +1,166 @@
+"""Queue page actions and reads and run them in a single round-trip.
+
+An ``ActionBatch`` collects steps and hands them to the page runtime's
+``batch`` helper, which runs them in order inside the page: actions wait for
+a visible element and dispatch DOM events (like the ``fast`` fill mode), reads
+return values under their key. Steps take CSS selectors, optionally narrowed
+to the match whose trimmed text equals ``text``, and must not navigate.
+"""
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+
+@dataclass(frozen=True)
+class BatchStep:
+    """One queued action or read."""
+    
+    kind: str
+    selector: str
+    args: tuple = ()
+    text: Optional[str] = None
+    key: Optional[str] = None
+    
+    def describe(self) -> str:
+        target = self.selector if self.text is None else f"{self.selector} [text={self.text!r}]"
+        return f"{self.kind}({target})"
+    
+    def to_payload(self) -> Dict[str, Any]:
+        return {
+            "kind": self.kind,
+            "selector": self.selector,
+            "args": list(self.args),
+            "text": self.text,
+            "key": self.key,
+        }
+
+
+@dataclass(frozen=True)
+class StepTiming:
+    """How long a step took inside the page."""
+    
+    index: int
+    step: str
+    duration_ms: float
+
+
+@dataclass
+class BatchResult:
+    """Reads of a batch by key, plus per-step timings."""
+    
+    reads: Dict[str, Any]
+    steps: List[StepTiming]
+    elapsed_ms: float
+    
+    def __getitem__(self, key: str) -> Any:
+        return self.reads[key]
+    
+    def slowest(self, count: int = 3) -> List[StepTiming]:
+        return sorted(self.steps, key=lambda timing: timing.duration_ms, reverse=True)[:count]
+
+
+class BatchError(RuntimeError):
+    """A batch step failed; the steps after it did not run.
+    
+    ``index`` and ``step`` identify the failing step, ``result`` holds the
+    reads and timings of the steps that ran, including the failing one.
+    """
+    
+    def __init__(self, index: int, step: BatchStep, total: int, error: str, result: BatchResult):
+        self.index = index
+        self.step = step
+        self.error = error
+        self.result = result
+        duration = result.steps[-1].duration_ms if result.steps else 0.0
+        super().__init__(
+            f"Batch step {index + 1}/{total} {step.describe()} failed after {duration:.0f} ms: {error}"
+        )
+
+
+@dataclass
+class ActionBatch:
+    """Builder for a batch of steps; ``run()`` executes them (await it on async pages).
+    
+    Every method returns the batch, so steps chain::
+        
+        result = (page_object.batch()
+                  .fill("#userName", "Ann")
+                  .click("#submit")
+                  .wait_visible("#output p")
+                  .read_text("#name", key="name")
+                  .run())
+    """
+    
+    runner: Callable[["ActionBatch"], Any]
+    timeout: int = 5000
+    steps: List[BatchStep] = field(default_factory=list)
+    
+    def __len__(self) -> int:
+        return len(self.steps)
+    
+    def _add(self, kind: str, selector: str, *args, text: Optional[str] = None,
+             key: Optional[str] = None) -> "ActionBatch":
+        if key is not None and any(step.key == key for step in self.steps):
+            raise ValueError(f"Duplicate batch read key: {key}")
+        self.steps.append(BatchStep(kind, selector, args, text, key))
+        return self
+    
+    def click(self, selector: str, text: Optional[str] = None) -> "ActionBatch":
+        return self._add("click", selector, text=text)
+    
+    def double_click(self, selector: str, text: Optional[str] = None) -> "ActionBatch":
+        return self._add("doubleClick", selector, text=text)
+    
+    def right_click(self, selector: str, text: Optional[str] = None) -> "ActionBatch":
+        return self._add("rightClick", selector, text=text)
+    
+    def hover(self, selector: str, text: Optional[str] = None) -> "ActionBatch":
+        return self._add("hover", selector, text=text)
+    
+    def fill(self, selector: str, value: str) -> "ActionBatch":
+        return self._add("fill", selector, value)
+    
+    def fill_fields(self, values: Dict[str, str]) -> "ActionBatch":
+        for selector, value in values.items():
+            self.fill(selector, value)
+        return self
+    
+    def wait_visible(self, selector: str, text: Optional[str] = None) -> "ActionBatch":
+        return self._add("waitVisible", selector, text=text)
+    
+    def wait_hidden(self, selector: str, text: Optional[str] = None) -> "ActionBatch":
+        return self._add("waitHidden", selector, text=text)
+    
+    def read_text(self, selector: str, key: Optional[str] = None) -> "ActionBatch":
+        """Text content of the first match, waiting for it to be attached."""
+        return self._add("text", selector, key=key or selector)
+    
+    def read_all_text(self, selector: str, key: Optional[str] = None) -> "ActionBatch":
+        """Text content of every current match."""
+        return self._add("allText", selector, key=key or selector)
+    
+    def read_properties(self, selector: str, properties: Sequence[str], key: Optional[str] = None) -> "ActionBatch":
+        """Properties (``@name`` for attributes) of the first match, waiting for it to be attached."""
+        return self._add("properties", selector, list(properties), key=key or selector)
+    
+    def read_state(self, selector: str, key: Optional[str] = None) -> "ActionBatch":
+        """ElementState fields of the first match, without waiting."""
+        return self._add("state", selector, key=key or selector)
+    
+    def payload(self) -> List[Dict[str, Any]]:
+        return [step.to_payload() for step in self.steps]
+    
+    def result(self, outcome: Dict[str, Any], elapsed_ms: float) -> BatchResult:
+        """Turn the runtime's answer into a BatchResult, raising BatchError for a failed step."""
+        timings = [
+            StepTiming(index, self.steps[index].describe(), duration)
+            for index, duration in enumerate(outcome["timings"])
+        ]
+        result = BatchResult(outcome["results"], timings, elapsed_ms)
+        if outcome["failed"] is not None:
+            index = outcome["failed"]
+            raise BatchError(index, self.steps[index], len(self.steps), outcome["error"], result)
+        return result
+    
+    def run(self):
+        """Execute the queued steps; returns a BatchResult (a coroutine for async pages)."""
+        return self.runner(self)
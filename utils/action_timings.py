@@ -0,0 +1,112 @@
+"""Timing of BasePage primitives, buffered per test."""
+from contextvars import ContextVar
+from dataclasses import dataclass
+from functools import wraps
+from typing import Callable, List, Optional, Tuple
+import inspect
+import threading
+import time
+from utils.current_test import current_test
+
+
+@dataclass(frozen=True)
+class ActionTiming:
+    """One BasePage primitive call and how long it took."""
+    
+    page_object: str
+    method: str
+    selector: Optional[str]
+    duration_ms: float
+    
+    @property
+    def key(self) -> str:
+        """``Page.method(selector)``, the unit latencies are grouped by."""
+        return f"{self.page_object}.{self.method}({self.selector or ''})"
+
+
+class ActionTimings:
+    """Buffer of action timings; off until the action_timings plugin enables it.
+    
+    Records are tagged with ``current_test`` like the wait report, so tests
+    running concurrently in one worker only drain their own.
+    """
+    
+    def __init__(self):
+        self.enabled = False
+        self._lock = threading.Lock()
+        self._timings: List[Tuple[Optional[str], ActionTiming]] = []
+    
+    def record(self, page_object: str, method: str, selector: Optional[str], duration_ms: float):
+        """Add a timing to the buffer."""
+        with self._lock:
+            self._timings.append(
+                (current_test.get(), ActionTiming(page_object, method, selector, duration_ms))
+            )
+    
+    def drain(self, nodeid: Optional[str] = None) -> List[ActionTiming]:
+        """Return and clear the timings of a test plus any untagged ones."""
+        with self._lock:
+            drained = [timing for owner, timing in self._timings if owner in (None, nodeid)]
+            self._timings = [(owner, timing) for owner, timing in self._timings if owner not in (None, nodeid)]
+        return drained
+
+
+# Create a global instance
+action_timings = ActionTimings()
+
+# Set while a timed primitive runs, so primitives it calls are not counted twice
+_in_action: ContextVar[bool] = ContextVar("in_action", default=False)
+
+
+def timed_action(target: Optional[str] = "selector") -> Callable:
+    """Decorator timing a page-object method into ``action_timings``.
+    
+    ``target`` names the parameter recorded as the selector. Only the
+    outermost timed call is recorded, and nothing is when timings are off.
+    Works on both sync and async methods.
+    """
+    def decorate(method: Callable) -> Callable:
+        parameters = list(inspect.signature(method).parameters)
+        position = parameters.index(target) if target in parameters else None
+        
+        def selector_of(args, kwargs) -> Optional[str]:
+            if position is None:
+                return None
+            value = args[position] if len(args) > position else kwargs.get(target)
+            return None if value is None else str(value)
+        
+        def finish(args, kwargs, started: float):
+            action_timings.record(
+                args[0].__class__.__name__,
+                method.__name__,
+                selector_of(args, kwargs),
+                (time.perf_counter() - started) * 1000,
+            )
+        
+        if inspect.iscoroutinefunction(method):
+            @wraps(method)
+            async def timed_async(*args, **kwargs):
+                if not action_timings.enabled or _in_action.get():
+                    return await method(*args, **kwargs)
+                token = _in_action.set(True)
+                started = time.perf_counter()
+                try:
+                    return await method(*args, **kwargs)
+                finally:
+                    _in_action.reset(token)
+                    finish(args, kwargs, started)
+            return timed_async
+        
+        @wraps(method)
+        def timed(*args, **kwargs):
+            if not action_timings.enabled or _in_action.get():
+                return method(*args, **kwargs)
+            token = _in_action.set(True)
+            started = time.perf_counter()
+            try:
+                return method(*args, **kwargs)
+            finally:
+                _in_action.reset(token)
+                finish(args, kwargs, started)
+        return timed
+    return decorate
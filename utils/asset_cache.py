@@ -0,0 +1,349 @@
+"""On-disk cache of static responses shared by every context and worker.
+
+Responses are stored one file per URL under a shared directory: a JSON
+header line followed by the body, written to a temporary file and renamed
+into place so concurrent workers never see a partial entry. A hit refreshes
+the file's mtime, which makes eviction least-recently-used across workers.
+"""
+from collections import Counter
+from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
+from pathlib import Path
+from typing import Dict, FrozenSet, Optional, Set, Tuple
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from playwright.async_api import BrowserContext as AsyncBrowserContext, Route as AsyncRoute
+from playwright.sync_api import BrowserContext, Error as PlaywrightError, Route
+from utils.har_archive import HOP_BY_HOP_HEADERS
+
+
+# Resource types worth keeping between tests
+CACHED_TYPES = frozenset({"script", "stylesheet", "image", "font"})
+
+# Entries left by a worker that died mid-write are removed after this long
+STALE_TEMP_SECONDS = 3600
+
+ENTRY_SUFFIX = ".asset"
+
+# Headers a 304 may update on the stored response
+REFRESHED_HEADERS = ("cache-control", "expires", "etag", "last-modified")
+
+
+@dataclass
+class CachedAsset:
+    """A stored response and when it was last fetched or revalidated."""
+    
+    url: str
+    status: int
+    headers: Dict[str, str]
+    body: bytes
+    stored_at: float
+    
+    @property
+    def validators(self) -> Dict[str, str]:
+        """Conditional request headers built from the stored ETag/Last-Modified."""
+        validators = {}
+        if "etag" in self.headers:
+            validators["if-none-match"] = self.headers["etag"]
+        if "last-modified" in self.headers:
+            validators["if-modified-since"] = self.headers["last-modified"]
+        return validators
+    
+    def is_fresh(self, now: Optional[float] = None) -> bool:
+        """Whether Cache-Control max-age or Expires still covers the entry."""
+        now = time.time() if now is None else now
+        directives = _cache_control(self.headers)
+        if "no-cache" in directives:
+            return False
+        if "max-age" in directives:
+            try:
+                return now - self.stored_at < int(directives["max-age"])
+            except ValueError:
+                return False
+        if "expires" in self.headers:
+            try:
+                return now < parsedate_to_datetime(self.headers["expires"]).timestamp()
+            except (TypeError, ValueError):
+                return False
+        return False
+
+
+def _cache_control(headers: Dict[str, str]) -> Dict[str, str]:
+    directives = {}
+    for part in headers.get("cache-control", "").split(","):
+        name, _, value = part.strip().partition("=")
+        if name:
+            directives[name.lower()] = value.strip('"')
+    return directives
+
+
+def is_cacheable(status: int, headers: Dict[str, str]) -> bool:
+    """Only complete, shareable responses without cookies are stored."""
+    if status != 200 or "set-cookie" in headers or "*" in headers.get("vary", ""):
+        return False
+    return not {"no-store", "private"} & set(_cache_control(headers))
+
+
+class AssetCache:
+    """Size-capped store of responses keyed by URL, safe to share between processes.
+    
+    ``max_bytes`` is enforced by whichever worker notices the directory has
+    grown past it; each worker tracks what it has written since its last
+    scan, so the directory may briefly overshoot by what other workers wrote
+    meanwhile.
+    """
+    
+    def __init__(self, directory: Path, max_bytes: int = 200 * 1024 * 1024):
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self.stats = Counter()
+        self._lock = threading.Lock()
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._size = self._scan_size()
+    
+    def path_for(self, url: str) -> Path:
+        digest = hashlib.sha256(url.encode("utf-8")).hexdigest()
+        return self.directory / digest[:2] / f"{digest}{ENTRY_SUFFIX}"
+    
+    def lookup(self, url: str) -> Optional[CachedAsset]:
+        """Return the stored response for a URL and mark it recently used."""
+        path = self.path_for(url)
+        try:
+            with open(path, "rb") as handle:
+                header = json.loads(handle.readline())
+                body = handle.read()
+            os.utime(path)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as error:
+            self.logger.debug("Ignoring unreadable cache entry %s: %s", path, error)
+            return None
+        if header.get("url") != url:
+            return None
+        return CachedAsset(url, header["status"], header["headers"], body, header["stored_at"])
+    
+    def store(self, url: str, status: int, headers: Dict[str, str], body: bytes) -> CachedAsset:
+        """Write a response atomically, replacing any earlier version."""
+        asset = CachedAsset(
+            url=url,
+            status=status,
+            headers={name.lower(): value for name, value in headers.items() if name.lower() not in HOP_BY_HOP_HEADERS},
+            body=body,
+            stored_at=time.time(),
+        )
+        self._write(asset)
+        return asset
+    
+    def refresh(self, asset: CachedAsset, headers: Dict[str, str]) -> CachedAsset:
+        """Record a successful revalidation, taking updated headers from the 304."""
+        for name, value in headers.items():
+            if name.lower() in REFRESHED_HEADERS:
+                asset.headers[name.lower()] = value
+        asset.stored_at = time.time()
+        self._write(asset)
+        return asset
+    
+    def _write(self, asset: CachedAsset):
+        path = self.path_for(asset.url)
+        path.parent.mkdir(exist_ok=True)
+        header = json.dumps({
+            "url": asset.url,
+            "status": asset.status,
+            "headers": asset.headers,
+            "stored_at": asset.stored_at,
+        }).encode("utf-8")
+        descriptor, temp_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(descriptor, "wb") as handle:
+                handle.write(header + b"\n")
+                handle.write(asset.body)
+            os.replace(temp_name, path)
+        except OSError:
+            Path(temp_name).unlink(missing_ok=True)
+            raise
+        
+        with self._lock:
+            self.stats["stored"] += 1
+            self._size += len(header) + 1 + len(asset.body)
+            over = self._size > self.max_bytes
+        if over:
+            self.evict()
+    
+    def _entries(self):
+        for path in self.directory.glob(f"*/*{ENTRY_SUFFIX}"):
+            try:
+                yield path, path.stat()
+            except FileNotFoundError:
+                continue
+    
+    def _scan_size(self) -> int:
+        return sum(stat.st_size for _, stat in self._entries())
+    
+    def evict(self, target: float = 0.9):
+        """Delete least recently used entries until the cache fits in ``target`` of its cap."""
+        entries = sorted(self._entries(), key=lambda item: item[1].st_mtime)
+        size = sum(stat.st_size for _, stat in entries)
+        evicted = 0
+        for path, stat in entries:
+            if size <= self.max_bytes * target:
+                break
+            path.unlink(missing_ok=True)
+            size -= stat.st_size
+            evicted += 1
+        
+        cutoff = time.time() - STALE_TEMP_SECONDS
+        for temp in self.directory.glob("*/*.tmp"):
+            try:
+                if temp.stat().st_mtime < cutoff:
+                    temp.unlink()
+            except FileNotFoundError:
+                continue
+        
+        with self._lock:
+            self._size = size
+            self.stats["evicted"] += evicted
+        if evicted:
+            self.logger.info("Evicted %s cached assets, %.1f MiB left", evicted, size / 1024 / 1024)
+    
+    def clear(self):
+        """Delete every entry."""
+        for path, _ in list(self._entries()):
+            path.unlink(missing_ok=True)
+        with self._lock:
+            self._size = 0
+
+
+class AssetCacheRouter:
+    """Serves a context's static requests from an AssetCache.
+    
+    A fresh entry (per Cache-Control/Expires, or already revalidated by
+    this process during the run) is served without touching the network.
+    A stale one is revalidated with If-None-Match/If-Modified-Since and
+    served from disk on a 304. Everything else goes to the network and is
+    stored if cacheable.
+    """
+    
+    def __init__(self, cache: AssetCache, resource_types: FrozenSet[str] = CACHED_TYPES,
+                 validated: Optional[Set[str]] = None):
+        self.cache = cache
+        self.resource_types = resource_types
+        # URLs revalidated during this run; the site does not change mid-run
+        self.validated = validated if validated is not None else set()
+        self.counts = Counter()
+        self.logger = logging.getLogger(self.__class__.__name__)
+    
+    def attach(self, context: BrowserContext):
+        """Install the caching route on a context."""
+        context.route("**/*", self._handle)
+    
+    async def attach_async(self, context: AsyncBrowserContext):
+        """Install the caching route on an async context."""
+        await context.route("**/*", self._handle_async)
+    
+    def detach(self, context: BrowserContext):
+        """Remove the caching route from a context."""
+        context.unroute("**/*", self._handle)
+    
+    def summary(self) -> Dict[str, int]:
+        """Counters for this router's requests."""
+        return {
+            "asset_cache_hits": self.counts["hits"],
+            "asset_cache_revalidated": self.counts["revalidated"],
+            "asset_cache_misses": self.counts["misses"],
+            "asset_cache_bytes": self.counts["bytes"],
+        }
+    
+    def _handles(self, request) -> bool:
+        return request.method == "GET" and request.resource_type in self.resource_types
+    
+    def _cached(self, url: str) -> Tuple[Optional[CachedAsset], bool]:
+        """The stored asset for a URL and whether it can be served without the network."""
+        asset = self.cache.lookup(url)
+        return asset, asset is not None and (url in self.validated or asset.is_fresh())
+    
+    def _revalidated(self, url: str, asset: Optional[CachedAsset], validators: Dict[str, str],
+                     status: int, headers: Dict[str, str]) -> Optional[CachedAsset]:
+        """The refreshed asset if the server answered a conditional request with 304."""
+        if asset is None or not validators or status != 304:
+            return None
+        self.validated.add(url)
+        return self.cache.refresh(asset, headers)
+    
+    def _store(self, url: str, status: int, headers: Dict[str, str], body: bytes):
+        try:
+            self.cache.store(url, status, headers, body)
+            self.validated.add(url)
+        except OSError as error:
+            self.logger.warning("Could not cache %s: %s", url, error)
+    
+    def _served(self, asset: CachedAsset, outcome: str) -> Dict[str, object]:
+        """Count a response served from the cache and return its fulfill arguments."""
+        self.counts[outcome] += 1
+        self.counts["bytes"] += len(asset.body)
+        return {"status": asset.status, "headers": asset.headers, "body": asset.body}
+    
+    def _handle(self, route: Route):
+        request = route.request
+        if not self._handles(request):
+            route.fallback()
+            return
+        
+        url = request.url
+        asset, fresh = self._cached(url)
+        if fresh:
+            route.fulfill(**self._served(asset, "hits"))
+            return
+        
+        validators = asset.validators if asset is not None else {}
+        try:
+            response = route.fetch(headers={**request.headers, **validators})
+        except PlaywrightError as error:
+            self.logger.debug("Fetching %s failed: %s", url, error)
+            route.fallback()
+            return
+        
+        refreshed = self._revalidated(url, asset, validators, response.status, response.headers)
+        if refreshed is not None:
+            route.fulfill(**self._served(refreshed, "revalidated"))
+            return
+        
+        self.counts["misses"] += 1
+        if is_cacheable(response.status, response.headers):
+            self._store(url, response.status, response.headers, response.body())
+        route.fulfill(response=response)
+    
+    async def _handle_async(self, route: AsyncRoute):
+        request = route.request
+        if not self._handles(request):
+            await route.fallback()
+            return
+        
+        url = request.url
+        asset, fresh = self._cached(url)
+        if fresh:
+            await route.fulfill(**self._served(asset, "hits"))
+            return
+        
+        validators = asset.validators if asset is not None else {}
+        try:
+            response = await route.fetch(headers={**request.headers, **validators})
+        except PlaywrightError as error:
+            self.logger.debug("Fetching %s failed: %s", url, error)
+            await route.fallback()
+            return
+        
+        refreshed = self._revalidated(url, asset, validators, response.status, response.headers)
+        if refreshed is not None:
+            await route.fulfill(**self._served(refreshed, "revalidated"))
+            return
+        
+        self.counts["misses"] += 1
+        if is_cacheable(response.status, response.headers):
+            self._store(url, response.status, response.headers, await response.body())
+        await route.fulfill(response=response)
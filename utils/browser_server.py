@@ -0,0 +1,218 @@
+"""Chromium servers shared by test processes over the DevTools protocol."""
+from playwright.sync_api import Error as PlaywrightError
+from typing import Dict, List, Optional
+import json
+import logging
+import shutil
+import socket
+import subprocess
+import tempfile
+import threading
+import time
+import urllib.error
+import urllib.request
+
+
+# Roughly what Playwright passes when it launches Chromium itself
+CHROMIUM_ARGS = [
+    "--no-first-run",
+    "--no-default-browser-check",
+    "--disable-background-networking",
+    "--disable-background-timer-throttling",
+    "--disable-backgrounding-occluded-windows",
+    "--disable-renderer-backgrounding",
+    "--disable-dev-shm-usage",
+    "--no-sandbox",
+]
+
+
+def free_port() -> int:
+    with socket.socket() as probe:
+        probe.bind(("127.0.0.1", 0))
+        return probe.getsockname()[1]
+
+
+class BrowserServer:
+    """One Chromium process listening for DevTools connections on a fixed port.
+    
+    The port survives restarts, so clients reconnect to the same endpoint
+    after the process dies and is started again.
+    """
+    
+    def __init__(self, executable: str, headless: bool = True, args: Optional[List[str]] = None):
+        self.executable = executable
+        self.headless = headless
+        self.args = args or []
+        self.port = free_port()
+        self.restarts = 0
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self._process: Optional[subprocess.Popen] = None
+        self._profile: Optional[str] = None
+    
+    @property
+    def endpoint(self) -> str:
+        return f"http://127.0.0.1:{self.port}"
+    
+    @property
+    def pid(self) -> Optional[int]:
+        return self._process.pid if self._process else None
+    
+    @property
+    def alive(self) -> bool:
+        return self._process is not None and self._process.poll() is None
+    
+    def start(self, timeout: float = 30.0):
+        """Launch Chromium and wait until it accepts connections."""
+        self._profile = tempfile.mkdtemp(prefix="browser-server-")
+        command = [
+            self.executable,
+            *CHROMIUM_ARGS,
+            *self.args,
+            f"--remote-debugging-port={self.port}",
+            "--remote-debugging-address=127.0.0.1",
+            f"--user-data-dir={self._profile}",
+        ]
+        if self.headless:
+            command.append("--headless=new")
+        command.append("about:blank")
+        self._process = subprocess.Popen(command, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            if not self.alive:
+                raise RuntimeError(f"Browser server exited with code {self._process.returncode}")
+            if self.version() is not None:
+                self.logger.info("Browser server %s listening on %s", self.pid, self.endpoint)
+                return
+            time.sleep(0.1)
+        self.stop()
+        raise TimeoutError(f"Browser server did not listen on {self.endpoint} within {timeout}s")
+    
+    def version(self) -> Optional[Dict[str, str]]:
+        """The server's /json/version document, or None if it is not answering."""
+        try:
+            with urllib.request.urlopen(f"{self.endpoint}/json/version", timeout=1) as response:
+                return json.load(response)
+        except (urllib.error.URLError, OSError, ValueError):
+            return None
+    
+    def restart(self):
+        self.stop()
+        self.restarts += 1
+        self.start()
+    
+    def stop(self):
+        if self._process is not None:
+            self._process.terminate()
+            try:
+                self._process.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                self._process.kill()
+                self._process.wait()
+            self._process = None
+        if self._profile is not None:
+            shutil.rmtree(self._profile, ignore_errors=True)
+            self._profile = None
+
+
+class BrowserServerPool:
+    """Starts ``count`` browser servers and restarts any that die."""
+    
+    # Seconds between liveness checks
+    CHECK_INTERVAL = 1.0
+    
+    def __init__(self, count: int, executable: str, headless: bool = True, args: Optional[List[str]] = None):
+        self.servers = [BrowserServer(executable, headless, args) for _ in range(count)]
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self._stopping = threading.Event()
+        self._monitor: Optional[threading.Thread] = None
+    
+    @property
+    def endpoints(self) -> List[str]:
+        return [server.endpoint for server in self.servers]
+    
+    @property
+    def pids(self) -> List[int]:
+        return [server.pid for server in self.servers if server.pid is not None]
+    
+    def start(self):
+        for server in self.servers:
+            server.start()
+        self._monitor = threading.Thread(target=self._watch, name="browser-server-monitor", daemon=True)
+        self._monitor.start()
+    
+    def _watch(self):
+        while not self._stopping.wait(self.CHECK_INTERVAL):
+            for server in self.servers:
+                if server.alive or self._stopping.is_set():
+                    continue
+                self.logger.warning("Browser server on %s died; restarting", server.endpoint)
+                try:
+                    server.restart()
+                except (RuntimeError, TimeoutError, OSError):
+                    self.logger.exception("Could not restart the browser server on %s", server.endpoint)
+    
+    def stop(self):
+        self._stopping.set()
+        if self._monitor is not None:
+            self._monitor.join()
+        for server in self.servers:
+            server.stop()
+
+
+class SharedBrowser:
+    """A worker's connection to a browser server, reconnecting when it drops.
+    
+    Stands in for pytest-playwright's ``browser``: attribute access goes to
+    the connected ``Browser``, reconnecting first if the server went away
+    (waiting up to ``reconnect_timeout`` while it is restarted). Contexts
+    from a dropped connection are gone; tests running at that moment fail,
+    later ones get a fresh connection. ``close`` closes this worker's
+    contexts and leaves the server running for the others.
+    """
+    
+    def __init__(self, browser_type, endpoint: str, slow_mo: Optional[float] = None, reconnect_timeout: float = 30.0):
+        self.browser_type = browser_type
+        self.endpoint = endpoint
+        self.slow_mo = slow_mo
+        self.reconnect_timeout = reconnect_timeout
+        self.reconnects = 0
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self._browser = None
+        self._contexts: List = []
+    
+    @property
+    def browser(self):
+        if self._browser is None or not self._browser.is_connected():
+            self._browser = self._connect()
+        return self._browser
+    
+    def _connect(self):
+        if self._browser is not None:
+            self.reconnects += 1
+            self.logger.warning("Lost the browser server on %s; reconnecting", self.endpoint)
+            self._contexts.clear()
+        deadline = time.monotonic() + self.reconnect_timeout
+        while True:
+            try:
+                return self.browser_type.connect_over_cdp(self.endpoint, slow_mo=self.slow_mo)
+            except PlaywrightError:
+                if time.monotonic() >= deadline:
+                    raise
+                time.sleep(0.5)
+    
+    def new_context(self, **kwargs):
+        context = self.browser.new_context(**kwargs)
+        self._contexts.append(context)
+        context.on("close", self._contexts.remove)
+        return context
+    
+    def close(self):
+        """Close the contexts this worker opened; other workers' stay open."""
+        if self._browser is None or not self._browser.is_connected():
+            return
+        for context in list(self._contexts):
+            context.close()
+    
+    def __getattr__(self, name):
+        return getattr(self.browser, name)
@@ -0,0 +1,213 @@
+"""Bounded pool of reusable, reset-on-return browser contexts."""
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Deque, Dict, List, Optional, Set
+from urllib.parse import urlsplit
+from weakref import WeakSet
+import logging
+from playwright.sync_api import Browser, BrowserContext, Download, Error as PlaywrightError, Frame, Page
+
+
+# Clears every storage area reachable from the current origin
+CLEAR_ORIGIN_STORAGE_SCRIPT = """
+async () => {
+    try { localStorage.clear(); } catch (error) {}
+    try { sessionStorage.clear(); } catch (error) {}
+    if (self.indexedDB && indexedDB.databases) {
+        for (const database of await indexedDB.databases()) {
+            indexedDB.deleteDatabase(database.name);
+        }
+    }
+    if (self.caches) {
+        for (const key of await caches.keys()) {
+            await caches.delete(key);
+        }
+    }
+    if (navigator.serviceWorker) {
+        for (const registration of await navigator.serviceWorker.getRegistrations()) {
+            await registration.unregister();
+        }
+    }
+}
+"""
+
+RESET_PATH = "/__context_pool_reset__"
+
+# Contexts carrying state the pool cannot reset (init scripts, clocks, ...)
+_DIRTY_CONTEXTS: "WeakSet[BrowserContext]" = WeakSet()
+
+
+def mark_context_dirty(context: BrowserContext):
+    """Flag a context so the pool closes it instead of reusing it."""
+    _DIRTY_CONTEXTS.add(context)
+
+
+@dataclass
+class _PoolEntry:
+    """A pooled context plus what it has touched since the last reset."""
+    
+    context: BrowserContext
+    uses: int = 0
+    origins: Set[str] = field(default_factory=set)
+    downloads: List[Download] = field(default_factory=list)
+    # Page handed to tests and kept open between leases when pages are kept
+    page: Optional[Page] = None
+    
+    def track_page(self, page: Page):
+        page.on("framenavigated", self._track_frame)
+        page.on("download", self.downloads.append)
+    
+    def _track_frame(self, frame: Frame):
+        parts = urlsplit(frame.url)
+        if parts.scheme in ("http", "https"):
+            self.origins.add(f"{parts.scheme}://{parts.netloc}")
+
+
+class ContextPool:
+    """Hands out pre-warmed contexts and resets them between tests.
+    
+    On release the pool closes leftover pages, drops routes, cookies,
+    permissions, geolocation, offline mode, extra headers and downloads, and
+    wipes storage for every origin the context visited. A context is closed
+    and replaced after ``max_uses`` leases, or as soon as any state survives
+    the reset or it was flagged with ``mark_context_dirty``.
+    
+    With ``keep_pages`` each context's main page (see ``main_page``)
+    survives the reset, still showing whatever it loaded, so the next test
+    can reset it in place instead of navigating; its storage is wiped like
+    every other origin's.
+    """
+    
+    def __init__(self, browser: Browser, context_args: Dict, size: int = 2, max_uses: int = 25,
+                 keep_pages: bool = False):
+        self.browser = browser
+        self.context_args = context_args
+        self.size = size
+        self.max_uses = max_uses
+        self.keep_pages = keep_pages
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self._idle: Deque[_PoolEntry] = deque()
+        self._leased: Dict[BrowserContext, _PoolEntry] = {}
+        self.stats = {"created": 0, "leases": 0, "recycled_max_uses": 0, "recycled_leaks": 0, "pages_kept": 0}
+        
+        for _ in range(size):
+            self._idle.append(self._create())
+    
+    def acquire(self) -> BrowserContext:
+        """Lease an idle context, creating one if the pool has room."""
+        if self._idle:
+            entry = self._idle.popleft()
+        elif len(self._leased) < self.size:
+            entry = self._create()
+        else:
+            raise RuntimeError(f"Context pool exhausted ({self.size} contexts leased)")
+        
+        entry.uses += 1
+        self.stats["leases"] += 1
+        self._leased[entry.context] = entry
+        return entry.context
+    
+    def main_page(self, context: BrowserContext) -> Page:
+        """The leased context's main page: the one kept from its last lease, or a new one."""
+        entry = self._leased[context]
+        if entry.page is None or entry.page.is_closed():
+            entry.page = context.new_page()
+        return entry.page
+    
+    def release(self, context: BrowserContext, keep_page: bool = True):
+        """Reset a leased context and return it to the pool (or replace it).
+        
+        ``keep_page=False`` closes the main page too, e.g. after a failed
+        test left it in an unknown state.
+        """
+        entry = self._leased.pop(context)
+        
+        try:
+            clean = self._reset(entry, keep_page and self.keep_pages)
+        except Exception as error:
+            self.logger.warning("Context reset failed, recycling: %s", error)
+            clean = False
+        
+        if not clean:
+            self.stats["recycled_leaks"] += 1
+        elif entry.uses >= self.max_uses:
+            self.stats["recycled_max_uses"] += 1
+        else:
+            self._idle.append(entry)
+            return
+        
+        self._discard(entry)
+        self._idle.append(self._create())
+    
+    def close(self):
+        """Close every pooled context."""
+        for entry in list(self._idle) + list(self._leased.values()):
+            self._discard(entry)
+        self._idle.clear()
+        self._leased.clear()
+        self.logger.info("Context pool stats: %s", self.stats)
+    
+    def _create(self) -> _PoolEntry:
+        context = self.browser.new_context(**self.context_args)
+        entry = _PoolEntry(context)
+        context.on("page", entry.track_page)
+        self.stats["created"] += 1
+        return entry
+    
+    def _discard(self, entry: _PoolEntry):
+        _DIRTY_CONTEXTS.discard(entry.context)
+        try:
+            entry.context.close()
+        except Exception as error:
+            self.logger.debug("Ignoring error while closing context: %s", error)
+    
+    def _reset(self, entry: _PoolEntry, keep_page: bool = False) -> bool:
+        """Reset a context in place; returns False if state leaked through."""
+        context = entry.context
+        if context in _DIRTY_CONTEXTS:
+            return False
+        
+        context.unroute_all(behavior="ignoreErrors")
+        kept = entry.page if keep_page and entry.page is not None and not entry.page.is_closed() else None
+        for page in context.pages:
+            if page is not kept:
+                page.close()
+        entry.page = kept
+        
+        # Session storage belongs to the tab, so the scratch page cannot reach the kept page's
+        if kept is not None and urlsplit(kept.url).scheme in ("http", "https"):
+            try:
+                kept.evaluate(CLEAR_ORIGIN_STORAGE_SCRIPT)
+            except PlaywrightError as error:
+                self.logger.debug("Closing kept page that could not be wiped: %s", error)
+                kept.close()
+                kept = entry.page = None
+        
+        # Wipe each visited origin from a scratch page served without network
+        if entry.origins:
+            scratch = context.new_page()
+            scratch.route("**/*", lambda route: route.fulfill(body="", content_type="text/html"))
+            for origin in sorted(entry.origins):
+                scratch.goto(f"{origin}{RESET_PATH}")
+                scratch.evaluate(CLEAR_ORIGIN_STORAGE_SCRIPT)
+            scratch.close()
+            entry.origins.clear()
+        
+        # Restore the options the context was created with
+        context.clear_cookies()
+        context.clear_permissions()
+        if self.context_args.get("permissions"):
+            context.grant_permissions(self.context_args["permissions"])
+        context.set_geolocation(self.context_args.get("geolocation"))
+        context.set_offline(self.context_args.get("offline", False))
+        context.set_extra_http_headers(self.context_args.get("extra_http_headers", {}))
+        
+        for download in entry.downloads:
+            download.delete()
+        entry.downloads.clear()
+        
+        state = context.storage_state()
+        leaked_storage = state["cookies"] or any(origin["localStorage"] for origin in state["origins"])
+        if kept is not None:
+            self.stats["pages_kept"] += 1
+        return context.pages == ([kept] if kept else []) and not leaked_storage
@@ -0,0 +1,7 @@
+"""Which test the running code belongs to, for per-test attribution."""
+from contextvars import ContextVar
+from typing import Optional
+
+
+# Node id of the test a task runs for; unset when tests run one at a time
+current_test: ContextVar[Optional[str]] = ContextVar("current_test", default=None)
@@ -1,15 +1,94 @@
 """Utility for generating test data."""
 from faker import Faker
-from typing import Dict
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence
+from utils.record_pool import write_pool
+import hashlib
 import random
+import re
 import string
 
 
+DEPARTMENTS = [
+    "Engineering",
+    "QA",
+    "Sales",
+    "Marketing",
+    "HR",
+    "Finance",
+    "Operations",
+    "IT",
+    "Legal",
+    "Support"
+]
+
+USER_FIELDS = (
+    "first_name", "last_name", "full_name", "email", "age", "salary",
+    "department", "current_address", "permanent_address", "phone",
+)
+TEXT_BOX_FIELDS = ("full_name", "email", "current_address", "permanent_address")
+TABLE_FIELDS = ("first_name", "last_name", "email", "age", "salary", "department")
+
+# Distinct Faker values drawn per vocabulary; batches sample from these
+VOCABULARY_SIZE = 512
+
+# Vocabularies are the same for every seed, so they are built once per locale
+VOCABULARY_SEED = 0
+
+
+@lru_cache(maxsize=None)
+def vocabularies(locale: str) -> Dict[str, List[str]]:
+    """Faker values that batch generation combines, built once per locale."""
+    faker = Faker(locale)
+    faker.seed_instance(VOCABULARY_SEED)
+    calls = {
+        "first_name": faker.first_name,
+        "last_name": faker.last_name,
+        "street": faker.street_address,
+        "city": lambda: f"{faker.city()}, {faker.state_abbr()} {faker.postcode()}",
+        "phone": faker.phone_number,
+        "domain": faker.free_email_domain,
+    }
+    return {name: sorted({call() for _ in range(VOCABULARY_SIZE)}) for name, call in calls.items()}
+
+
+def seed_for(*parts: object) -> int:
+    """A stable 32-bit seed from e.g. a run seed and a test node id."""
+    digest = hashlib.sha256(":".join(map(str, parts)).encode()).digest()
+    return int.from_bytes(digest[:4], "big")
+
+
 class DataGenerator:
-    """Generate test data for automation tests."""
+    """Generate test data for automation tests.
     
-    def __init__(self, locale: str = "en_US"):
-        self.faker = Faker(locale)
+    With a ``seed`` every value is reproducible: the same seed gives the
+    same records on any machine or xdist worker. Single values come from
+    Faker; ``generate_records`` builds whole batches column by column from
+    per-locale vocabularies of Faker values, which is far cheaper than a
+    Faker call per field.
+    """
+    
+    def __init__(self, locale: str = "en_US", seed: Optional[int] = None):
+        self.locale = locale
+        self.seed = seed
+        self.random = random.Random(seed)
+        self._faker: Optional[Faker] = None
+        self._emails_issued = 0
+    
+    @classmethod
+    def for_test(cls, nodeid: str, run_seed: int, locale: str = "en_US") -> "DataGenerator":
+        """A generator whose data depends only on the run seed and the test."""
+        return cls(locale, seed=seed_for(run_seed, nodeid))
+    
+    @property
+    def faker(self) -> Faker:
+        """Faker instance, created on first use (it is slow to set up)."""
+        if self._faker is None:
+            self._faker = Faker(self.locale)
+            if self.seed is not None:
+                self._faker.seed_instance(self.seed)
+        return self._faker
     
     def generate_full_name(self) -> str:
         """Generate a random full name."""
@@ -37,31 +116,19 @@ class DataGenerator:
     
     def generate_age(self, min_age: int = 18, max_age: int = 80) -> str:
         """Generate a random age."""
-        return str(random.randint(min_age, max_age))
+        return str(self.random.randint(min_age, max_age))
     
     def generate_salary(self, min_salary: int = 30000, max_salary: int = 150000) -> str:
         """Generate a random salary."""
-        return str(random.randint(min_salary, max_salary))
+        return str(self.random.randint(min_salary, max_salary))
     
     def generate_department(self) -> str:
         """Generate a random department name."""
-        departments = [
-            "Engineering",
-            "QA",
-            "Sales",
-            "Marketing",
-            "HR",
-            "Finance",
-            "Operations",
-            "IT",
-            "Legal",
-            "Support"
-        ]
-        return random.choice(departments)
+        return self.random.choice(DEPARTMENTS)
     
     def generate_random_string(self, length: int = 10) -> str:
         """Generate a random string."""
-        return ''.join(random.choices(string.ascii_letters + string.digits, k=length))
+        return ''.join(self.random.choices(string.ascii_letters + string.digits, k=length))
     
     def generate_user_data(self) -> Dict[str, str]:
         """Generate complete user data."""
@@ -100,7 +167,61 @@ class DataGenerator:
     
     def generate_multiple_records(self, count: int = 5) -> list:
         """Generate multiple table records."""
-        return [self.generate_table_record() for _ in range(count)]
+        return self.generate_records(count, TABLE_FIELDS)
+    
+    def generate_records(self, count: int, fields: Sequence[str] = USER_FIELDS) -> List[Dict[str, str]]:
+        """Generate ``count`` records with ``fields`` in one batch."""
+        columns = self.generate_columns(count, fields)
+        return [dict(zip(fields, row)) for row in zip(*(columns[field] for field in fields))]
+    
+    def generate_columns(self, count: int, fields: Sequence[str] = USER_FIELDS) -> Dict[str, List[str]]:
+        """Generate ``count`` values per field, as one list per field.
+        
+        Emails are unique within a generator; names and addresses are
+        combined from the locale's vocabularies.
+        """
+        unknown = set(fields) - set(USER_FIELDS)
+        if unknown:
+            raise ValueError(f"Unknown fields: {sorted(unknown)}")
+        vocabulary = vocabularies(self.locale)
+        pick = self.random.choices
+        
+        first_names = pick(vocabulary["first_name"], k=count)
+        last_names = pick(vocabulary["last_name"], k=count)
+        columns = {"first_name": first_names, "last_name": last_names}
+        if "full_name" in fields:
+            columns["full_name"] = [f"{first} {last}" for first, last in zip(first_names, last_names)]
+        if "email" in fields:
+            start = self._emails_issued
+            self._emails_issued += count
+            columns["email"] = [
+                f"{_local_part(first)}.{_local_part(last)}{start + index}@{domain}"
+                for index, (first, last, domain)
+                in enumerate(zip(first_names, last_names, pick(vocabulary["domain"], k=count)))
+            ]
+        if "age" in fields:
+            columns["age"] = [str(self.random.randint(18, 80)) for _ in range(count)]
+        if "salary" in fields:
+            columns["salary"] = [str(self.random.randint(30000, 150000)) for _ in range(count)]
+        if "department" in fields:
+            columns["department"] = pick(DEPARTMENTS, k=count)
+        for field in ("current_address", "permanent_address"):
+            if field in fields:
+                columns[field] = [
+                    f"{street}, {city}"
+                    for street, city in zip(pick(vocabulary["street"], k=count), pick(vocabulary["city"], k=count))
+                ]
+        if "phone" in fields:
+            columns["phone"] = pick(vocabulary["phone"], k=count)
+        return {field: columns[field] for field in fields}
+    
+    def build_pool(self, path: Path, count: int, fields: Sequence[str] = USER_FIELDS):
+        """Write ``count`` records to a columnar pool file (see ``utils.record_pool``)."""
+        write_pool(path, self.generate_columns(count, fields))
+
+
+def _local_part(name: str) -> str:
+    return re.sub(r"[^a-z0-9]", "", name.lower()) or "user"
 
 
 # Create a global instance
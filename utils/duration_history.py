@@ -0,0 +1,107 @@
+"""Per-test duration history and duration-balanced work planning."""
+from dataclasses import dataclass, field
+from statistics import median
+from typing import Dict, Iterable, List, Optional, Sequence
+
+
+# Weight of the newest run in the moving average of a test's duration
+SMOOTHING = 0.5
+
+# Estimate for tests without history when nothing is known at all
+DEFAULT_DURATION = 1.0
+
+
+def module_of(nodeid: str) -> str:
+    """Test module part of a node ID, the fallback affinity key."""
+    return nodeid.split("::", 1)[0]
+
+
+@dataclass
+class WorkUnit:
+    """Tests that should run on the same worker, in collection order."""
+    
+    key: str
+    nodeids: List[str] = field(default_factory=list)
+    duration: float = 0.0
+
+
+class DurationHistory:
+    """Smoothed duration and page-object affinity of every test seen so far.
+    
+    Stored as a plain dict so it fits in the pytest cache: ``{nodeid:
+    {"duration": seconds, "affinity": key}}``.
+    """
+    
+    def __init__(self, data: Optional[Dict[str, dict]] = None):
+        self.tests: Dict[str, dict] = dict(data or {})
+    
+    def record(self, nodeid: str, duration: float, affinity: Optional[str] = None):
+        """Fold one run of a test into its moving average."""
+        entry = self.tests.setdefault(nodeid, {"duration": duration})
+        entry["duration"] = SMOOTHING * duration + (1 - SMOOTHING) * entry["duration"]
+        if affinity:
+            entry["affinity"] = affinity
+    
+    def to_dict(self) -> Dict[str, dict]:
+        return self.tests
+    
+    def default_duration(self) -> float:
+        """Estimate for unseen tests: the median of the known ones."""
+        durations = [entry["duration"] for entry in self.tests.values()]
+        return median(durations) if durations else DEFAULT_DURATION
+    
+    def estimate(self, nodeid: str, default: Optional[float] = None) -> float:
+        entry = self.tests.get(nodeid)
+        if entry:
+            return entry["duration"]
+        return self.default_duration() if default is None else default
+    
+    def affinity(self, nodeid: str) -> str:
+        """Page objects the test used last time, else its module."""
+        return self.tests.get(nodeid, {}).get("affinity") or module_of(nodeid)
+    
+    def plan_units(
+        self,
+        nodeids: Sequence[str],
+        bins: int,
+        affinity: Optional[Dict[str, str]] = None,
+    ) -> List[WorkUnit]:
+        """Group tests by page-object affinity into units, longest first.
+        
+        A group estimated to take longer than an even share of the total is
+        cut into consecutive chunks no longer than that share, so affinity
+        never keeps a worker busy after the others are done.
+        """
+        affinity = affinity or {}
+        default = self.default_duration()
+        durations = {nodeid: self.estimate(nodeid, default) for nodeid in nodeids}
+        share = sum(durations.values()) / max(bins, 1)
+        
+        groups: Dict[str, List[str]] = {}
+        for nodeid in nodeids:
+            key = affinity.get(nodeid) or self.affinity(nodeid)
+            groups.setdefault(key, []).append(nodeid)
+        
+        units: List[WorkUnit] = []
+        for key, members in groups.items():
+            chunk = WorkUnit(key)
+            for nodeid in members:
+                if chunk.nodeids and chunk.duration + durations[nodeid] > share:
+                    units.append(chunk)
+                    chunk = WorkUnit(f"{key}#{len(units)}")
+                chunk.nodeids.append(nodeid)
+                chunk.duration += durations[nodeid]
+            units.append(chunk)
+        
+        return sorted(units, key=lambda unit: (-unit.duration, unit.key))
+
+
+def lpt_partition(units: Iterable[WorkUnit], bins: int) -> List[List[WorkUnit]]:
+    """Longest-processing-time-first: each unit goes to the least loaded bin."""
+    partition: List[List[WorkUnit]] = [[] for _ in range(bins)]
+    loads = [0.0] * bins
+    for unit in sorted(units, key=lambda unit: (-unit.duration, unit.key)):
+        target = loads.index(min(loads))
+        partition[target].append(unit)
+        loads[target] += unit.duration
+    return partition
@@ -0,0 +1,49 @@
+"""Asyncio event loop hosted on a background thread."""
+from concurrent.futures import Future
+from typing import Any, Coroutine, Optional
+import asyncio
+import threading
+
+
+class EventLoopThread:
+    """Runs an asyncio event loop on a daemon thread.
+    
+    Playwright's sync API marks its own loop as running on the calling
+    thread, so async Playwright code cannot share that thread. Coroutines
+    submitted here run on a private loop and their results are handed back
+    to the caller.
+    """
+    
+    def __init__(self, name: str = "event-loop"):
+        self.name = name
+        self.loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+    
+    @property
+    def running(self) -> bool:
+        return self.loop is not None
+    
+    def start(self) -> "EventLoopThread":
+        """Start the loop thread if it is not running yet."""
+        if self.loop is None:
+            self.loop = asyncio.new_event_loop()
+            self._thread = threading.Thread(target=self.loop.run_forever, name=self.name, daemon=True)
+            self._thread.start()
+        return self
+    
+    def submit(self, coroutine: Coroutine) -> Future:
+        """Schedule a coroutine on the loop and return its future."""
+        return asyncio.run_coroutine_threadsafe(coroutine, self.start().loop)
+    
+    def run(self, coroutine: Coroutine, timeout: Optional[float] = None) -> Any:
+        """Run a coroutine on the loop and wait for its result."""
+        return self.submit(coroutine).result(timeout)
+    
+    def stop(self):
+        """Stop the loop and join its thread."""
+        if self.loop is None:
+            return
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self._thread.join()
+        self.loop.close()
+        self.loop = self._thread = None
@@ -0,0 +1,272 @@
+"""HAR-like on-disk archive for recording and replaying network traffic."""
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+import base64
+import hashlib
+import json
+import logging
+import time
+from weakref import WeakKeyDictionary
+from playwright.async_api import APIRequestContext as AsyncAPIRequestContext
+from playwright.async_api import BrowserContext as AsyncBrowserContext, Route as AsyncRoute
+from playwright.sync_api import APIRequestContext, BrowserContext, Error as PlaywrightError, Page, Route
+
+
+# Headers that describe the wire encoding rather than the stored body
+HOP_BY_HOP_HEADERS = {"content-encoding", "content-length", "transfer-encoding", "connection"}
+
+ArchiveKey = Tuple[str, str, str]
+
+
+@dataclass
+class ArchivedResponse:
+    """Response served back from the archive."""
+    
+    status: int
+    headers: Dict[str, str]
+    body: bytes
+
+
+class HarArchive:
+    """Indexed collection of recorded request/response pairs.
+    
+    Entries are keyed by method, URL and a SHA-256 of the request body, so
+    lookups stay O(1) regardless of how many entries were recorded. Files use
+    the HAR 1.2 layout with bodies stored base64-encoded.
+    """
+    
+    VERSION = "1.2"
+    
+    def __init__(self):
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self._entries: Dict[ArchiveKey, dict] = {}
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+    
+    @staticmethod
+    def make_key(method: str, url: str, body: Optional[bytes] = None) -> ArchiveKey:
+        """Build the index key for a request."""
+        body_hash = hashlib.sha256(body or b"").hexdigest()
+        return method.upper(), url, body_hash
+    
+    def add(self, method: str, url: str, request_body: Optional[bytes], status: int,
+            status_text: str, headers: Dict[str, str], body: bytes, elapsed_ms: float = 0.0):
+        """Record a response, replacing any earlier one for the same request."""
+        key = self.make_key(method, url, request_body)
+        self._entries[key] = {
+            "startedDateTime": datetime.now(timezone.utc).isoformat(),
+            "time": elapsed_ms,
+            "request": {
+                "method": key[0],
+                "url": url,
+                "headers": [],
+                "bodySize": len(request_body or b""),
+                "_bodySha256": key[2],
+            },
+            "response": {
+                "status": status,
+                "statusText": status_text,
+                "headers": [
+                    {"name": name, "value": value}
+                    for name, value in headers.items()
+                    if name.lower() not in HOP_BY_HOP_HEADERS
+                ],
+                "content": {
+                    "size": len(body),
+                    "mimeType": headers.get("content-type", ""),
+                    "text": base64.b64encode(body).decode("ascii"),
+                    "encoding": "base64",
+                },
+            },
+        }
+    
+    def lookup(self, method: str, url: str, body: Optional[bytes] = None) -> Optional[ArchivedResponse]:
+        """Return the archived response for a request, if any."""
+        entry = self._entries.get(self.make_key(method, url, body))
+        if entry is None:
+            return None
+        
+        response = entry["response"]
+        content = response["content"]
+        text = content.get("text", "")
+        payload = base64.b64decode(text) if content.get("encoding") == "base64" else text.encode("utf-8")
+        return ArchivedResponse(
+            status=response["status"],
+            headers={header["name"]: header["value"] for header in response["headers"]},
+            body=payload,
+        )
+    
+    def load(self, path: Path) -> "HarArchive":
+        """Merge the entries of a HAR file into the index."""
+        with open(path, encoding="utf-8") as handle:
+            entries = json.load(handle)["log"]["entries"]
+        
+        for entry in entries:
+            request = entry["request"]
+            body_hash = request.get("_bodySha256")
+            if body_hash is None:
+                post_text = request.get("postData", {}).get("text", "")
+                body_hash = hashlib.sha256(post_text.encode("utf-8")).hexdigest()
+            self._entries[(request["method"].upper(), request["url"], body_hash)] = entry
+        
+        self.logger.info("Loaded %s HAR entries from %s", len(entries), path)
+        return self
+    
+    def load_dir(self, directory: Path) -> "HarArchive":
+        """Merge every ``*.har`` file in a directory (one per xdist worker)."""
+        for path in sorted(Path(directory).glob("*.har")):
+            self.load(path)
+        return self
+    
+    @staticmethod
+    def clear_dir(directory: Path):
+        """Remove the ``*.har`` files of an earlier recording from a directory."""
+        for path in Path(directory).glob("*.har"):
+            path.unlink()
+    
+    def save(self, path: Path):
+        """Write the archive to disk atomically."""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        document = {
+            "log": {
+                "version": self.VERSION,
+                "creator": {"name": "qa-automation-playbook", "version": "1.0"},
+                "entries": self.entries(),
+            }
+        }
+        
+        temp_path = path.with_suffix(path.suffix + ".tmp")
+        with open(temp_path, "w", encoding="utf-8") as handle:
+            json.dump(document, handle)
+        temp_path.replace(path)
+        self.logger.info("Saved %s HAR entries to %s", len(self), path)
+    
+    def entries(self) -> List[dict]:
+        """Return the raw HAR entries."""
+        return list(self._entries.values())
+
+
+_ROUTERS: "WeakKeyDictionary[BrowserContext, HarRouter]" = WeakKeyDictionary()
+
+
+class HarRouter:
+    """Routes a browser context through a HarArchive.
+    
+    ``record`` sends every request through the network and stores the
+    responses; ``replay`` serves them back and lets unrecorded requests
+    through; ``strict`` aborts unrecorded requests and lists them in
+    ``unrecorded``. API requests (``page.request``) bypass context routing,
+    so page objects send them through ``fetch`` instead.
+    """
+    
+    def __init__(self, archive: HarArchive, mode: str):
+        self.archive = archive
+        self.mode = mode
+        self.unrecorded = []
+    
+    @classmethod
+    def for_page(cls, page: Page) -> Optional["HarRouter"]:
+        """Return the router attached to a page's context, if any."""
+        return _ROUTERS.get(page.context)
+    
+    def attach(self, context: BrowserContext):
+        """Install the record or replay route on a context."""
+        _ROUTERS[context] = self
+        context.route("**/*", self._record if self.mode == "record" else self._replay)
+    
+    async def attach_async(self, context: AsyncBrowserContext):
+        """Install the record or replay route on an async context."""
+        _ROUTERS[context] = self
+        await context.route("**/*", self._record_async if self.mode == "record" else self._replay_async)
+    
+    def detach(self, context: BrowserContext):
+        """Remove the record or replay route from a context."""
+        _ROUTERS.pop(context, None)
+        context.unroute("**/*", self._record if self.mode == "record" else self._replay)
+    
+    def fetch(self, api: APIRequestContext, url: str, method: str = "GET"):
+        """Send an API request through the archive; returns an object with ``status``."""
+        if self.mode == "record":
+            started = time.perf_counter()
+            response = api.fetch(url, method=method)
+            self._archive(method, url, None, response, response.body(), started)
+            return response
+        archived = self._lookup(method, url, None)
+        if archived is not None:
+            return archived
+        if self.mode == "strict":
+            raise PlaywrightError(f"{method} {url} is missing from the HAR archive")
+        return api.fetch(url, method=method)
+    
+    async def fetch_async(self, api: AsyncAPIRequestContext, url: str, method: str = "GET"):
+        """Send an async API request through the archive; returns an object with ``status``."""
+        if self.mode == "record":
+            started = time.perf_counter()
+            response = await api.fetch(url, method=method)
+            self._archive(method, url, None, response, await response.body(), started)
+            return response
+        archived = self._lookup(method, url, None)
+        if archived is not None:
+            return archived
+        if self.mode == "strict":
+            raise PlaywrightError(f"{method} {url} is missing from the HAR archive")
+        return await api.fetch(url, method=method)
+    
+    def _archive(self, method: str, url: str, request_body: Optional[bytes], response, body: bytes,
+                 started: float):
+        self.archive.add(
+            method=method,
+            url=url,
+            request_body=request_body,
+            status=response.status,
+            status_text=response.status_text,
+            headers=response.headers,
+            body=body,
+            elapsed_ms=(time.perf_counter() - started) * 1000,
+        )
+    
+    def _lookup(self, method: str, url: str, request_body: Optional[bytes]) -> Optional[ArchivedResponse]:
+        """The archived response for a request; records it as missing in strict mode."""
+        archived = self.archive.lookup(method, url, request_body)
+        if archived is None and self.mode == "strict":
+            self.unrecorded.append(f"{method} {url}")
+        return archived
+    
+    def _record(self, route: Route):
+        request = route.request
+        started = time.perf_counter()
+        response = route.fetch()
+        self._archive(request.method, request.url, request.post_data_buffer, response, response.body(), started)
+        route.fulfill(response=response)
+    
+    async def _record_async(self, route: AsyncRoute):
+        request = route.request
+        started = time.perf_counter()
+        response = await route.fetch()
+        body = await response.body()
+        self._archive(request.method, request.url, request.post_data_buffer, response, body, started)
+        await route.fulfill(response=response)
+    
+    def _replay(self, route: Route):
+        request = route.request
+        archived = self._lookup(request.method, request.url, request.post_data_buffer)
+        if archived is not None:
+            route.fulfill(status=archived.status, headers=archived.headers, body=archived.body)
+        elif self.mode == "strict":
+            route.abort("internetdisconnected")
+        else:
+            route.fallback()
+    
+    async def _replay_async(self, route: AsyncRoute):
+        request = route.request
+        archived = self._lookup(request.method, request.url, request.post_data_buffer)
+        if archived is not None:
+            await route.fulfill(status=archived.status, headers=archived.headers, body=archived.body)
+        elif self.mode == "strict":
+            await route.abort("internetdisconnected")
+        else:
+            await route.fallback()
@@ -0,0 +1,56 @@
+"""Interleave blocking Playwright sync-API calls made from several greenlets."""
+from functools import partial
+from typing import Callable, Sequence
+import asyncio
+import contextvars
+from greenlet import greenlet
+from playwright.sync_api import Playwright
+
+
+def run_interleaved(playwright: Playwright, tasks: Sequence[Callable[[], None]]):
+    """Run callables concurrently, switching whenever one waits on the browser.
+    
+    Every sync-API call parks its greenlet and hands control to Playwright's
+    dispatcher greenlet, which runs the event loop until the call's result
+    arrives and then switches back to the caller. Running each task in its
+    own greenlet, parented to the dispatcher, lets the dispatcher resume
+    whichever task's call finishes first, so one task's waits overlap with
+    the others' work. Each task runs in a copy of the caller's context.
+    
+    Tasks must handle their own exceptions: anything raised would surface in
+    the dispatcher and stop Playwright. Relies on the sync API's private
+    ``_loop`` and ``_dispatcher_fiber`` attributes (Playwright 1.48) and
+    raises RuntimeError if they are missing.
+    """
+    if not tasks:
+        return
+    loop = getattr(playwright, "_loop", None)
+    dispatcher = getattr(playwright, "_dispatcher_fiber", None)
+    if not isinstance(loop, asyncio.AbstractEventLoop) or not isinstance(dispatcher, greenlet):
+        raise RuntimeError(
+            "Playwright's sync API no longer exposes _loop/_dispatcher_fiber; "
+            "run without --concurrent-tests"
+        )
+    caller = greenlet.getcurrent()
+    finished = loop.create_future()
+    pending = len(tasks)
+    
+    def run(task: Callable[[], None]):
+        nonlocal pending
+        try:
+            task()
+        finally:
+            pending -= 1
+            if not pending:
+                finished.set_result(None)
+    
+    for task in tasks:
+        worker = greenlet(partial(run, task), parent=dispatcher)
+        worker.gr_context = contextvars.copy_context()
+        loop.call_soon(worker.switch)
+    
+    finished.add_done_callback(lambda _: caller.switch())
+    while not finished.done():
+        dispatcher.switch()
+    # Same bookkeeping as the sync API after handing control back
+    asyncio._set_running_loop(loop)
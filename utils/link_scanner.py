@@ -0,0 +1,282 @@
+"""Concurrent HTTP health checks for the links and images on a page."""
+from dataclasses import dataclass, field, asdict
+from typing import Dict, Iterable, List, Optional
+from urllib.parse import urljoin
+import asyncio
+import logging
+import time
+from playwright.async_api import APIRequestContext, Error as PlaywrightError, Playwright, async_playwright
+from playwright.sync_api import Page
+from utils.event_loop_thread import EventLoopThread
+
+
+# Collects every http(s) link and image URL with its occurrence count
+COLLECT_TARGETS_SCRIPT = """
+({links, images}) => {
+    const targets = new Map();
+    const add = (kind, url) => {
+        url = url.split("#")[0];
+        if (!/^https?:/i.test(url)) return;
+        const key = `${kind} ${url}`;
+        const target = targets.get(key);
+        if (target) {
+            target.occurrences++;
+        } else {
+            targets.set(key, {kind, url, occurrences: 1});
+        }
+    };
+    for (const anchor of document.querySelectorAll(links)) add("link", anchor.href);
+    for (const image of document.querySelectorAll(images)) add("image", image.currentSrc || image.src);
+    return Array.from(targets.values());
+}
+"""
+
+# HEAD answers that mean "ask again with GET" rather than "broken"
+HEAD_FALLBACK_STATUSES = {405, 501}
+
+
+@dataclass(frozen=True)
+class UrlCheck:
+    """Outcome of checking a single URL."""
+    
+    url: str
+    status: Optional[int]
+    latency_ms: float
+    method: str
+    final_url: str
+    redirect_chain: List[str] = field(default_factory=list)
+    error: Optional[str] = None
+    
+    @property
+    def ok(self) -> bool:
+        return self.error is None and self.status is not None and self.status < 400
+
+
+@dataclass(frozen=True)
+class ScanResult:
+    """A link or image found on the page and its check."""
+    
+    kind: str
+    url: str
+    occurrences: int
+    check: UrlCheck
+    cached: bool = False
+    
+    @property
+    def ok(self) -> bool:
+        return self.check.ok
+    
+    @property
+    def status(self) -> Optional[int]:
+        return self.check.status
+
+
+@dataclass
+class ScanReport:
+    """Every link and image on a page with its HTTP health."""
+    
+    page_url: str
+    results: List[ScanResult]
+    elapsed_s: float
+    
+    @property
+    def broken(self) -> List[ScanResult]:
+        return [result for result in self.results if not result.ok]
+    
+    def by_kind(self, kind: str) -> List[ScanResult]:
+        return [result for result in self.results if result.kind == kind]
+    
+    def result_for(self, url: str) -> Optional[ScanResult]:
+        """Find the result for a URL (relative URLs resolve against the page)."""
+        url = urljoin(self.page_url, url)
+        return next((result for result in self.results if result.url == url), None)
+    
+    def to_dict(self) -> Dict:
+        return {
+            "page_url": self.page_url,
+            "elapsed_s": round(self.elapsed_s, 3),
+            "checked": len(self.results),
+            "broken": len(self.broken),
+            "results": [
+                {**asdict(result.check), "kind": result.kind, "occurrences": result.occurrences,
+                 "cached": result.cached, "ok": result.ok}
+                for result in self.results
+            ],
+        }
+
+
+class LinkScanner:
+    """Checks URLs concurrently over one pooled API request context.
+    
+    Playwright's sync API cannot issue requests in parallel, so the scanner
+    runs the async API on a private event loop thread, started on first use.
+    Each URL is probed with HEAD (falling back to GET when HEAD is refused
+    or fails), redirects are followed by hand to record the chain, and at
+    most ``max_concurrency`` requests are in flight. Results are cached for
+    the scanner's lifetime, so a URL repeated across pages is checked once.
+    """
+    
+    def __init__(self, max_concurrency: int = 8, timeout: int = 10000, max_redirects: int = 10,
+                 ignore_https_errors: bool = True, extra_http_headers: Optional[Dict[str, str]] = None):
+        self.max_concurrency = max_concurrency
+        self.timeout = timeout
+        self.max_redirects = max_redirects
+        self.ignore_https_errors = ignore_https_errors
+        self.extra_http_headers = extra_http_headers
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self.stats = {"checked": 0, "cache_hits": 0, "get_fallbacks": 0}
+        self._cache: Dict[str, UrlCheck] = {}
+        self._runner = EventLoopThread("link-scanner")
+        self._playwright: Optional[Playwright] = None
+        self._request: Optional[APIRequestContext] = None
+    
+    def __enter__(self) -> "LinkScanner":
+        return self
+    
+    def __exit__(self, *exc_info):
+        self.close()
+    
+    def collect(self, page: Page, links: str = "a[href]", images: str = "img[src]") -> List[Dict]:
+        """Gather unique link and image URLs from a page in one evaluation."""
+        return page.evaluate(COLLECT_TARGETS_SCRIPT, {"links": links, "images": images})
+    
+    def scan(self, page: Page, links: str = "a[href]", images: str = "img[src]") -> ScanReport:
+        """Check every link and image on a page."""
+        started = time.perf_counter()
+        return self.report(page.url, self.collect(page, links, images), started)
+    
+    def report(self, page_url: str, targets: List[Dict], started: Optional[float] = None) -> ScanReport:
+        """Check targets gathered with ``COLLECT_TARGETS_SCRIPT`` and build the report."""
+        started = time.perf_counter() if started is None else started
+        cached = {target["url"] for target in targets if target["url"] in self._cache}
+        checks = self.check_urls(target["url"] for target in targets)
+        
+        report = ScanReport(
+            page_url=page_url,
+            results=[
+                ScanResult(
+                    kind=target["kind"],
+                    url=target["url"],
+                    occurrences=target["occurrences"],
+                    check=checks[target["url"]],
+                    cached=target["url"] in cached,
+                )
+                for target in targets
+            ],
+            elapsed_s=time.perf_counter() - started,
+        )
+        self.logger.info(
+            "Scanned %s URLs on %s in %.2fs, %s broken",
+            len(report.results), report.page_url, report.elapsed_s, len(report.broken),
+        )
+        return report
+    
+    def check_urls(self, urls: Iterable[str]) -> Dict[str, UrlCheck]:
+        """Check URLs concurrently, reusing cached results."""
+        urls = list(dict.fromkeys(urls))
+        pending = [url for url in urls if url not in self._cache]
+        self.stats["cache_hits"] += len(urls) - len(pending)
+        
+        if pending:
+            self._start()
+            for check in self._runner.run(self._check_all(pending)):
+                self._cache[check.url] = check
+            self.stats["checked"] += len(pending)
+        return {url: self._cache[url] for url in urls}
+    
+    def clear_cache(self):
+        """Forget every cached result."""
+        self._cache.clear()
+    
+    @property
+    def opened(self) -> bool:
+        """Whether the request context is open."""
+        return self._request is not None
+    
+    def close(self):
+        """Dispose the request context and stop the event loop thread."""
+        if not self.opened:
+            self._runner.stop()
+            return
+        try:
+            self._runner.run(self._close())
+        finally:
+            self._runner.stop()
+        self.logger.info("Link scanner stats: %s", self.stats)
+    
+    def _start(self):
+        if self.opened:
+            return
+        try:
+            self._runner.run(self._open())
+        except BaseException:
+            # Leave nothing running, so the next check starts from scratch
+            self._runner.stop()
+            raise
+    
+    async def _open(self):
+        playwright = await async_playwright().start()
+        try:
+            request = await playwright.request.new_context(
+                ignore_https_errors=self.ignore_https_errors,
+                extra_http_headers=self.extra_http_headers,
+            )
+        except BaseException:
+            await playwright.stop()
+            raise
+        self._playwright, self._request = playwright, request
+    
+    async def _close(self):
+        await self._request.dispose()
+        await self._playwright.stop()
+        self._request = self._playwright = None
+    
+    async def _check_all(self, urls: List[str]) -> List[UrlCheck]:
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        
+        async def bounded(url: str) -> UrlCheck:
+            async with semaphore:
+                return await self._check(url)
+        
+        return await asyncio.gather(*(bounded(url) for url in urls))
+    
+    async def _check(self, url: str) -> UrlCheck:
+        started = time.perf_counter()
+        check = await self._follow("HEAD", url, started)
+        if check.error is not None or check.status in HEAD_FALLBACK_STATUSES:
+            self.stats["get_fallbacks"] += 1
+            check = await self._follow("GET", url, time.perf_counter())
+        return check
+    
+    async def _follow(self, method: str, url: str, started: float) -> UrlCheck:
+        """Request a URL, following redirects one hop at a time."""
+        chain = []
+        current = url
+        status = None
+        error = None
+        try:
+            for _ in range(self.max_redirects + 1):
+                response = await self._request.fetch(
+                    current, method=method, max_redirects=0, timeout=self.timeout
+                )
+                status = response.status
+                location = response.headers.get("location")
+                await response.dispose()
+                if not (300 <= status < 400 and location):
+                    break
+                chain.append(current)
+                current = urljoin(current, location)
+            else:
+                error = f"More than {self.max_redirects} redirects"
+        except PlaywrightError as exc:
+            error = exc.message.splitlines()[0]
+        
+        return UrlCheck(
+            url=url,
+            status=status,
+            latency_ms=round((time.perf_counter() - started) * 1000, 1),
+            method=method,
+            final_url=current,
+            redirect_chain=chain,
+            error=error,
+        )
@@ -0,0 +1,228 @@
+"""Versioned helper library installed in every page of a context.
+
+The runtime defines ``window.__qaHelpers`` once per document through a
+context init script. Page objects then call its primitives with small,
+constant call scripts and pass selectors and values as arguments, so no
+selector is ever formatted into JavaScript and the browser compiles the
+same few scripts over and over. Bulk helpers take CSS selectors; the
+element helpers run on elements Playwright resolved, so any selector works.
+"""
+from weakref import WeakSet
+from playwright.sync_api import BrowserContext
+
+
+# Bump when the helpers change; pages with another version get them replaced
+RUNTIME_VERSION = 2
+
+RUNTIME_SCRIPT = """
+(() => {
+    const VERSION = %d;
+    if (window.__qaHelpers && window.__qaHelpers.version === VERSION) return;
+    
+    const state = element => {
+        if (!element) {
+            return {attached: false, visible: false, enabled: false, checked: false, text: ""};
+        }
+        const style = getComputedStyle(element);
+        const rect = element.getBoundingClientRect();
+        return {
+            attached: true,
+            visible: rect.width > 0 && rect.height > 0 && style.visibility !== "hidden",
+            enabled: !element.disabled,
+            checked: Boolean(element.checked),
+            text: element.textContent || ""
+        };
+    };
+    // "@name" reads an attribute, anything else a property; objects come back as null
+    const read = (element, properties) => {
+        const values = {};
+        for (const name of properties) {
+            const value = name.startsWith("@") ? element.getAttribute(name.slice(1)) : element[name];
+            values[name] = value === undefined || (typeof value === "object" && value !== null) ? null : value;
+        }
+        return values;
+    };
+    // Goes through the prototype's value setter so React's value tracker notices
+    const setValue = (element, value) => {
+        const descriptor = Object.getOwnPropertyDescriptor(Object.getPrototypeOf(element), "value");
+        if (descriptor && descriptor.set) {
+            descriptor.set.call(element, value);
+        } else {
+            element.value = value;
+        }
+        element.dispatchEvent(new Event("input", {bubbles: true}));
+        element.dispatchEvent(new Event("change", {bubbles: true}));
+    };
+    const mutations = {
+        remove: element => element.remove(),
+        setValue,
+        setAttribute: (element, name, value) => element.setAttribute(name, value),
+        removeAttribute: (element, name) => element.removeAttribute(name),
+        click: element => element.click(),
+        scrollIntoView: element => element.scrollIntoView({block: "center"})
+    };
+    const mutation = name => {
+        if (!Object.hasOwn(mutations, name)) throw new Error(`Unknown mutation: ${name}`);
+        return mutations[name];
+    };
+    
+    // Batch steps: CSS selector, optionally the match whose trimmed text equals `text`
+    const find = (selector, text) => {
+        if (text === null) return document.querySelector(selector);
+        return Array.from(document.querySelectorAll(selector)).find(element => element.textContent.trim() === text) || null;
+    };
+    const waitFor = async (predicate, timeout) => {
+        const deadline = performance.now() + timeout;
+        for (;;) {
+            const value = predicate();
+            if (value) return value;
+            if (performance.now() > deadline) return null;
+            await new Promise(resolve => requestAnimationFrame(resolve));
+        }
+    };
+    const mouse = (element, type, init = {}) => element.dispatchEvent(new MouseEvent(type, {
+        bubbles: type !== "mouseenter", cancelable: true, composed: true, view: window, ...init
+    }));
+    const actions = {
+        click: element => element.click(),
+        doubleClick: element => {
+            for (const detail of [1, 2]) {
+                mouse(element, "mousedown", {detail});
+                mouse(element, "mouseup", {detail});
+                mouse(element, "click", {detail});
+            }
+            mouse(element, "dblclick", {detail: 2});
+        },
+        rightClick: element => {
+            mouse(element, "mousedown", {button: 2, buttons: 2});
+            mouse(element, "mouseup", {button: 2});
+            mouse(element, "contextmenu", {button: 2});
+        },
+        hover: element => {
+            mouse(element, "mouseover");
+            mouse(element, "mouseenter");
+            mouse(element, "mousemove");
+        },
+        fill: (element, value) => setValue(element, value)
+    };
+    const runStep = async ({kind, selector, args, text}, timeout) => {
+        const visible = () => {
+            const element = find(selector, text);
+            return element && state(element).visible ? element : null;
+        };
+        const attached = () => find(selector, text);
+        if (Object.hasOwn(actions, kind)) {
+            const element = await waitFor(visible, timeout);
+            if (!element) throw new Error(`no visible element within ${timeout} ms`);
+            return actions[kind](element, ...args);
+        }
+        switch (kind) {
+            case "waitVisible":
+                if (!await waitFor(visible, timeout)) throw new Error(`not visible within ${timeout} ms`);
+                return;
+            case "waitHidden":
+                if (!await waitFor(() => !visible(), timeout)) throw new Error(`still visible after ${timeout} ms`);
+                return;
+            case "text": {
+                const element = await waitFor(attached, timeout);
+                if (!element) throw new Error(`no element within ${timeout} ms`);
+                return element.textContent || "";
+            }
+            case "allText":
+                return Array.from(document.querySelectorAll(selector), element => element.textContent || "");
+            case "properties": {
+                const element = await waitFor(attached, timeout);
+                if (!element) throw new Error(`no element within ${timeout} ms`);
+                return read(element, args[0]);
+            }
+            case "state":
+                return state(attached());
+            default:
+                throw new Error(`Unknown batch step: ${kind}`);
+        }
+    };
+    
+    window.__qaHelpers = Object.freeze({
+        version: VERSION,
+        
+        // Bulk helpers on CSS selectors
+        states: selectors => selectors.map(selector => state(document.querySelector(selector))),
+        query: queries => Object.fromEntries(Object.entries(queries).map(([key, {selector, properties, all}]) => {
+            if (all) {
+                return [key, Array.from(document.querySelectorAll(selector), element => read(element, properties))];
+            }
+            const element = document.querySelector(selector);
+            return [key, element ? read(element, properties) : null];
+        })),
+        // Applies [name, selector, ...args] operations in order; returns selectors not found
+        mutate: operations => {
+            const missing = [];
+            for (const [name, selector, ...args] of operations) {
+                const apply = mutation(name);
+                const element = document.querySelector(selector);
+                if (element) {
+                    apply(element, ...args);
+                } else {
+                    missing.push(selector);
+                }
+            }
+            return missing;
+        },
+        
+        // Element helpers on what a Playwright locator matched
+        stateOf: elements => state(elements[0]),
+        readOf: (elements, properties, all) => all
+            ? elements.map(element => read(element, properties))
+            : elements[0] ? read(elements[0], properties) : null,
+        mutateOf: (elements, name, args, all) => {
+            const apply = mutation(name);
+            const targets = all ? elements : elements.slice(0, 1);
+            targets.forEach(element => apply(element, ...args));
+            return targets.length;
+        },
+        
+        // Runs batch steps in order; stops at the first failing one
+        batch: async (steps, timeout) => {
+            const results = {};
+            const timings = [];
+            for (const [index, step] of steps.entries()) {
+                const started = performance.now();
+                try {
+                    const value = await runStep(step, timeout);
+                    if (step.key !== null) results[step.key] = value;
+                } catch (error) {
+                    timings.push(performance.now() - started);
+                    return {results, timings, failed: index, error: String(error && error.message || error)};
+                }
+                timings.push(performance.now() - started);
+            }
+            return {results, timings, failed: null, error: null};
+        }
+    });
+})();
+""" % RUNTIME_VERSION
+
+# Call a bulk helper; null means this document has no (or another) runtime
+CALL_HELPER_SCRIPT = """
+async ([name, args]) => window.__qaHelpers && window.__qaHelpers.version === %d
+    ? {value: await window.__qaHelpers[name](...args)}
+    : null
+""" % RUNTIME_VERSION
+
+# Call an element helper on a locator's elements
+CALL_ELEMENT_HELPER_SCRIPT = """
+async (elements, [name, args]) => window.__qaHelpers && window.__qaHelpers.version === %d
+    ? {value: await window.__qaHelpers[name](elements, ...args)}
+    : null
+""" % RUNTIME_VERSION
+
+# Contexts that already run the init script
+_INSTALLED: "WeakSet[BrowserContext]" = WeakSet()
+
+
+def install_runtime(context: BrowserContext):
+    """Add the runtime to every page the context opens from now on (once per context)."""
+    if context in _INSTALLED:
+        return
+    context.add_init_script(RUNTIME_SCRIPT)
+    _INSTALLED.add(context)
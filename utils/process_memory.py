@@ -0,0 +1,67 @@
+"""Memory used by a process and its descendants, read from /proc (Linux)."""
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+import os
+
+
+PROC = Path("/proc")
+
+
+def available() -> bool:
+    return (PROC / str(os.getpid()) / "status").exists()
+
+
+def _parents() -> Dict[int, int]:
+    parents = {}
+    for entry in PROC.iterdir():
+        if not entry.name.isdigit():
+            continue
+        try:
+            stat = (entry / "stat").read_text()
+        except OSError:
+            continue
+        # The command name may contain spaces and parentheses; fields follow the last ")"
+        parents[int(entry.name)] = int(stat.rsplit(")", 1)[1].split()[1])
+    return parents
+
+
+def process_tree(roots: Iterable[int]) -> List[int]:
+    """``roots`` and every process descended from them."""
+    children: Dict[int, List[int]] = {}
+    for pid, parent in _parents().items():
+        children.setdefault(parent, []).append(pid)
+    tree, pending = [], list(roots)
+    while pending:
+        pid = pending.pop()
+        tree.append(pid)
+        pending.extend(children.get(pid, []))
+    return tree
+
+
+def process_memory_kib(pid: int) -> int:
+    """Proportional set size (shared pages split between their users), or RSS where PSS is unavailable."""
+    try:
+        for line in (PROC / str(pid) / "smaps_rollup").read_text().splitlines():
+            if line.startswith("Pss:"):
+                return int(line.split()[1])
+    except OSError:
+        pass
+    try:
+        for line in (PROC / str(pid) / "status").read_text().splitlines():
+            if line.startswith("VmRSS:"):
+                return int(line.split()[1])
+    except OSError:
+        pass
+    return 0
+
+
+def tree_memory_mib(roots: Iterable[int], exclude: Iterable[int] = ()) -> Optional[float]:
+    """Memory of the given processes and all their descendants, in MiB.
+    
+    Processes under ``exclude`` (e.g. shared browser servers started by
+    this process) are left out.
+    """
+    if not available():
+        return None
+    pids = set(process_tree(roots)) - set(process_tree(exclude))
+    return sum(process_memory_kib(pid) for pid in pids) / 1024
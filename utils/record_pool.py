@@ -0,0 +1,141 @@
+"""Compact columnar file of precomputed test records, loaded lazily."""
+from array import array
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Sequence
+import json
+import os
+import struct
+import sys
+import tempfile
+import threading
+import zlib
+
+
+MAGIC = b"DQAPOOL1"
+
+# Magic, then the header length as a little-endian uint32
+PREAMBLE = struct.Struct("<8sI")
+
+SEPARATOR = "\x00"
+
+
+def write_pool(path: Path, columns: Dict[str, List[str]]):
+    """Write equally long string columns to ``path``.
+    
+    Each column is dictionary-encoded (distinct values once, plus one
+    integer index per record) and both parts are zlib-compressed. A JSON
+    header holds the record count and where every column starts, so
+    opening the file reads only the header. Written to a temporary file
+    and renamed into place, so concurrent builders never see a partial
+    pool.
+    """
+    lengths = {len(values) for values in columns.values()}
+    if len(lengths) > 1:
+        raise ValueError(f"Columns differ in length: {sorted(lengths)}")
+    
+    blocks = []
+    header = {"count": lengths.pop() if lengths else 0, "columns": {}}
+    offset = 0
+    for name, values in columns.items():
+        distinct = sorted(set(values))
+        if any(SEPARATOR in value for value in distinct):
+            raise ValueError(f"Column {name!r} contains NUL characters")
+        positions = {value: index for index, value in enumerate(distinct)}
+        indices = array("H" if len(distinct) <= 0xFFFF else "I", (positions[value] for value in values))
+        if sys.byteorder == "big":
+            indices.byteswap()
+        dictionary = zlib.compress(SEPARATOR.join(distinct).encode("utf-8"))
+        encoded = zlib.compress(indices.tobytes())
+        header["columns"][name] = {
+            "offset": offset,
+            "dictionary": len(dictionary),
+            "indices": len(encoded),
+            "typecode": indices.typecode,
+        }
+        blocks += [dictionary, encoded]
+        offset += len(dictionary) + len(encoded)
+    
+    encoded_header = json.dumps(header).encode()
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    descriptor, temporary = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(descriptor, "wb") as target:
+            target.write(PREAMBLE.pack(MAGIC, len(encoded_header)))
+            target.write(encoded_header)
+            for block in blocks:
+                target.write(block)
+        os.replace(temporary, path)
+    except BaseException:
+        os.unlink(temporary)
+        raise
+
+
+class RecordPool:
+    """Read-only view of a pool written by ``write_pool``.
+    
+    Opening reads only the header, so ``len(pool)`` is free and a test
+    module can parametrize over ``range(len(pool))`` at collection time.
+    A column is read and decoded the first time a record needs it, then
+    kept. Safe to share between threads.
+    """
+    
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        with open(self.path, "rb") as source:
+            magic, header_length = PREAMBLE.unpack(source.read(PREAMBLE.size))
+            if magic != MAGIC:
+                raise ValueError(f"{self.path} is not a record pool")
+            header = json.loads(source.read(header_length))
+        self._data_start = PREAMBLE.size + header_length
+        self._count: int = header["count"]
+        self._layout: Dict[str, dict] = header["columns"]
+        self._columns: Dict[str, List[str]] = {}
+        self._lock = threading.Lock()
+    
+    @property
+    def fields(self) -> List[str]:
+        return list(self._layout)
+    
+    def __len__(self) -> int:
+        return self._count
+    
+    def column(self, name: str) -> List[str]:
+        """Every value of one field, decoded on first use."""
+        values = self._columns.get(name)
+        if values is None:
+            with self._lock:
+                values = self._columns.get(name)
+                if values is None:
+                    values = self._columns[name] = self._read_column(self._layout[name])
+        return values
+    
+    def record(self, index: int, fields: Optional[Sequence[str]] = None) -> Dict[str, str]:
+        """One record, with all fields or only ``fields``."""
+        if not -self._count <= index < self._count:
+            raise IndexError(f"Record {index} out of range for a pool of {self._count}")
+        return {name: self.column(name)[index] for name in fields or self._layout}
+    
+    def records(self, start: int = 0, stop: Optional[int] = None, fields: Optional[Sequence[str]] = None) -> List[Dict[str, str]]:
+        """Records ``start`` to ``stop`` as a list."""
+        names = list(fields or self._layout)
+        columns = [self.column(name)[start:stop] for name in names]
+        return [dict(zip(names, row)) for row in zip(*columns)]
+    
+    def __getitem__(self, index: int) -> Dict[str, str]:
+        return self.record(index)
+    
+    def __iter__(self) -> Iterator[Dict[str, str]]:
+        return iter(self.records())
+    
+    def _read_column(self, layout: dict) -> List[str]:
+        with open(self.path, "rb") as source:
+            source.seek(self._data_start + layout["offset"])
+            dictionary = source.read(layout["dictionary"])
+            encoded = source.read(layout["indices"])
+        distinct = zlib.decompress(dictionary).decode("utf-8").split(SEPARATOR)
+        indices = array(layout["typecode"])
+        indices.frombytes(zlib.decompress(encoded))
+        if sys.byteorder == "big":
+            indices.byteswap()
+        return [distinct[index] for index in indices]
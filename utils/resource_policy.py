@@ -0,0 +1,190 @@
+"""Declarative request-blocking policies applied through context routing."""
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Dict, FrozenSet, Optional
+from urllib.parse import urlsplit
+from weakref import WeakKeyDictionary
+import logging
+from playwright.async_api import BrowserContext as AsyncBrowserContext, Route as AsyncRoute
+from playwright.sync_api import BrowserContext, Error as PlaywrightError, Page, Route
+
+
+@dataclass(frozen=True)
+class ResourcePolicy:
+    """Which requests a page object lets through.
+    
+    Resource types are Playwright's ``request.resource_type`` values (image,
+    font, media, stylesheet, script, ...). Hosts match by suffix, so
+    ``doubleclick.net`` also covers ``ad.doubleclick.net``. Allowed hosts win
+    over blocked hosts, blocked hosts win over allowed types, and allowed
+    types win over blocked types.
+    """
+    
+    block_types: FrozenSet[str] = field(default_factory=frozenset)
+    block_hosts: FrozenSet[str] = field(default_factory=frozenset)
+    allow_types: FrozenSet[str] = field(default_factory=frozenset)
+    allow_hosts: FrozenSet[str] = field(default_factory=frozenset)
+    
+    def combine(self, other: "ResourcePolicy") -> "ResourcePolicy":
+        """Return a policy with the rules of both policies."""
+        return ResourcePolicy(
+            block_types=self.block_types | other.block_types,
+            block_hosts=self.block_hosts | other.block_hosts,
+            allow_types=self.allow_types | other.allow_types,
+            allow_hosts=self.allow_hosts | other.allow_hosts,
+        )
+    
+    def blocks(self, resource_type: str, url: str) -> bool:
+        """Decide whether a request should be aborted."""
+        host = urlsplit(url).hostname or ""
+        if _host_matches(host, self.allow_hosts):
+            return False
+        if _host_matches(host, self.block_hosts):
+            return True
+        if resource_type in self.allow_types:
+            return False
+        return resource_type in self.block_types
+
+
+def _host_matches(host: str, suffixes: FrozenSet[str]) -> bool:
+    """Check a hostname against a set of domain suffixes."""
+    if not suffixes:
+        return False
+    parts = host.split(".")
+    return any(".".join(parts[index:]) in suffixes for index in range(len(parts)))
+
+
+# Global deny-list applied on top of every page object's policy
+DEFAULT_POLICY = ResourcePolicy(
+    block_types=frozenset({"media", "font"}),
+    block_hosts=frozenset({
+        "doubleclick.net",
+        "googlesyndication.com",
+        "googleadservices.com",
+        "googletagservices.com",
+        "googletagmanager.com",
+        "google-analytics.com",
+        "adservice.google.com",
+        "amazon-adsystem.com",
+        "adnxs.com",
+        "pubmatic.com",
+        "rubiconproject.com",
+        "criteo.com",
+        "taboola.com",
+        "outbrain.com",
+        "fonts.googleapis.com",
+        "fonts.gstatic.com",
+    }),
+)
+
+_BLOCKERS: "WeakKeyDictionary[BrowserContext, ResourceBlocker]" = WeakKeyDictionary()
+
+
+class ResourceBlocker:
+    """Aborts requests that the active policy blocks and counts the savings.
+    
+    Saved bytes are estimated from ``size_hints``, a URL -> body size map
+    learned from responses that were allowed through and from a HEAD request
+    sent the first time a blocked URL is seen, in this or earlier runs. A
+    URL whose size could not be learned maps to None and is counted in
+    ``blocked_unsized`` instead of adding 0 bytes.
+    """
+    
+    # Milliseconds a HEAD request may take before the size is left unknown
+    PROBE_TIMEOUT = 2000
+    
+    def __init__(self, default_policy: ResourcePolicy = DEFAULT_POLICY,
+                 size_hints: Optional[Dict[str, int]] = None):
+        self.default_policy = default_policy
+        self.policy = default_policy
+        self.size_hints = size_hints if size_hints is not None else {}
+        self.blocked_requests = 0
+        self.blocked_bytes = 0
+        self.blocked_unsized = 0
+        self.blocked_by_type = Counter()
+        self.logger = logging.getLogger(self.__class__.__name__)
+    
+    @classmethod
+    def for_page(cls, page: Page) -> Optional["ResourceBlocker"]:
+        """Return the blocker attached to a page's context, if any."""
+        return _BLOCKERS.get(page.context)
+    
+    def attach(self, context: BrowserContext):
+        """Install the blocking route and size tracking on a context."""
+        _BLOCKERS[context] = self
+        context.route("**/*", self._handle)
+        context.on("response", self._learn_size)
+    
+    async def attach_async(self, context: AsyncBrowserContext):
+        """Install the blocking route and size tracking on an async context."""
+        _BLOCKERS[context] = self
+        await context.route("**/*", self._handle_async)
+        context.on("response", self._learn_size)
+    
+    def detach(self, context: BrowserContext):
+        """Remove the blocking route and size tracking from a context."""
+        _BLOCKERS.pop(context, None)
+        context.unroute("**/*", self._handle)
+        context.remove_listener("response", self._learn_size)
+    
+    def use_policy(self, policy: ResourcePolicy):
+        """Activate a page object's policy on top of the default deny-list."""
+        self.policy = self.default_policy.combine(policy)
+    
+    def summary(self) -> Dict[str, int]:
+        """Counters for the requests blocked so far."""
+        return {
+            "blocked_requests": self.blocked_requests,
+            "blocked_bytes": self.blocked_bytes,
+            "blocked_unsized": self.blocked_unsized,
+            **{f"blocked_{kind}": count for kind, count in sorted(self.blocked_by_type.items())},
+        }
+    
+    def _blocks(self, request) -> bool:
+        """Whether the active policy blocks a request."""
+        return self.policy.blocks(request.resource_type, request.url)
+    
+    def _count(self, request):
+        """Count a blocked request and its size, if known."""
+        self.blocked_requests += 1
+        self.blocked_by_type[request.resource_type] += 1
+        size = self.size_hints.get(request.url)
+        if size is None:
+            self.blocked_unsized += 1
+        else:
+            self.blocked_bytes += size
+    
+    def _handle(self, route: Route):
+        request = route.request
+        if not self._blocks(request):
+            route.fallback()
+            return
+        if request.url not in self.size_hints:
+            try:
+                self._learn_size(route.fetch(method="HEAD", timeout=self.PROBE_TIMEOUT), request.url)
+            except PlaywrightError as error:
+                self.logger.debug("Could not probe the size of %s: %s", request.url, error)
+            self.size_hints.setdefault(request.url, None)
+        self._count(request)
+        route.abort("blockedbyclient")
+    
+    async def _handle_async(self, route: AsyncRoute):
+        request = route.request
+        if not self._blocks(request):
+            await route.fallback()
+            return
+        if request.url not in self.size_hints:
+            try:
+                self._learn_size(await route.fetch(method="HEAD", timeout=self.PROBE_TIMEOUT), request.url)
+            except PlaywrightError as error:
+                self.logger.debug("Could not probe the size of %s: %s", request.url, error)
+            self.size_hints.setdefault(request.url, None)
+        self._count(request)
+        await route.abort("blockedbyclient")
+    
+    def _learn_size(self, response, url: Optional[str] = None):
+        """Record the body size of a response, or of a HEAD probe for ``url``."""
+        url = url or response.url
+        length = response.headers.get("content-length")
+        if response.ok and length and length.isdigit():
+            self.size_hints[url] = int(length)
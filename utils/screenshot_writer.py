@@ -0,0 +1,156 @@
+"""Background writer for screenshots captured as bytes."""
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional
+import hashlib
+import logging
+import os
+import threading
+
+
+@dataclass
+class ScreenshotStats:
+    """What the writer has done so far."""
+    
+    written: int = 0
+    duplicates: int = 0
+    failed: int = 0
+    bytes_written: int = 0
+
+
+class ScreenshotWriter:
+    """Hashes and writes screenshot bytes on a small thread pool.
+    
+    Callers capture with ``page.screenshot()`` (no path, so the browser only
+    encodes) and hand the bytes over; the test moves on while the pool
+    writes them. At most ``max_pending`` screenshots wait in memory: once
+    that many are queued, ``submit`` blocks until one is written.
+    Screenshots identical to one already written are not written again;
+    their future resolves to the existing file instead, once that file's own
+    write has succeeded. If it fails, the duplicate is written itself.
+    """
+    
+    # Digests remembered for deduplication
+    MAX_DIGESTS = 1024
+    
+    def __init__(self, max_workers: int = 2, max_pending: int = 16):
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+        self.stats = ScreenshotStats()
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._slots: Optional[threading.BoundedSemaphore] = None
+        self._lock = threading.Lock()
+        # Digest -> future of the write that claimed it
+        self._written: "OrderedDict[str, Future[Path]]" = OrderedDict()
+    
+    def configure(self, max_workers: int, max_pending: int):
+        """Change the pool and queue sizes; waits for pending writes first."""
+        self.close()
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+    
+    def submit(self, data: bytes, path: Path) -> "Future[Path]":
+        """Queue bytes to be written to ``path``; blocks while the queue is full."""
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(self.max_workers, thread_name_prefix="screenshots")
+                self._slots = threading.BoundedSemaphore(self.max_pending)
+            executor, slots = self._executor, self._slots
+        slots.acquire()
+        future = executor.submit(self._write, data, Path(path))
+        future.add_done_callback(lambda _: slots.release())
+        return future
+    
+    def _write(self, data: bytes, path: Path) -> Path:
+        digest = hashlib.sha1(data).hexdigest()
+        while True:
+            with self._lock:
+                claim = self._written.get(digest)
+                if claim is None:
+                    # Claim the digest now so a duplicate queued meanwhile waits for this write
+                    claim = self._written[digest] = Future()
+                    if len(self._written) > self.MAX_DIGESTS:
+                        self._written.popitem(last=False)
+                    break
+                self._written.move_to_end(digest)
+            try:
+                existing = claim.result()
+            except OSError:
+                # The original write failed and released the digest; try to claim it
+                continue
+            if existing.exists():
+                with self._lock:
+                    self.stats.duplicates += 1
+                self.logger.info("Screenshot identical to %s, not written again", existing)
+                return existing
+            # Removed since it was written
+            with self._lock:
+                if self._written.get(digest) is claim:
+                    del self._written[digest]
+        
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            temporary = path.with_name(f".{path.name}.tmp")
+            temporary.write_bytes(data)
+            os.replace(temporary, path)
+        except OSError as error:
+            with self._lock:
+                if self._written.get(digest) is claim:
+                    del self._written[digest]
+                self.stats.failed += 1
+            claim.set_exception(error)
+            self.logger.exception("Could not write screenshot %s", path)
+            raise
+        with self._lock:
+            self.stats.written += 1
+            self.stats.bytes_written += len(data)
+        claim.set_result(path)
+        self.logger.info("Screenshot saved: %s", path)
+        return path
+    
+    def flush(self):
+        """Wait until every queued screenshot is written."""
+        with self._lock:
+            slots, count = self._slots, self.max_pending
+        if slots is None:
+            return
+        for _ in range(count):
+            slots.acquire()
+        for _ in range(count):
+            slots.release()
+    
+    def close(self):
+        """Write everything still queued and stop the pool."""
+        with self._lock:
+            executor, self._executor, self._slots = self._executor, None, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+
+
+def capture_options(
+    config,
+    full_page: Optional[bool] = None,
+    image_type: Optional[str] = None,
+    quality: Optional[int] = None,
+) -> dict:
+    """Keyword arguments for ``page.screenshot()``, defaulting to ``config``."""
+    image_type = image_type or config.SCREENSHOT_FORMAT
+    options = {
+        "full_page": config.SCREENSHOT_FULL_PAGE if full_page is None else full_page,
+        "type": image_type,
+    }
+    # Playwright rejects a quality for PNG
+    if image_type == "jpeg":
+        options["quality"] = config.SCREENSHOT_QUALITY if quality is None else quality
+    return options
+
+
+def extension(options: dict) -> str:
+    return ".jpg" if options["type"] == "jpeg" else ".png"
+
+
+# Create a global instance
+screenshot_writer = ScreenshotWriter()
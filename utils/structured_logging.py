@@ -0,0 +1,172 @@
+"""Queue-based logging writing JSON lines from a background thread."""
+from fnmatch import fnmatchcase
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from pathlib import Path
+from typing import Dict, Optional
+from utils.current_test import current_test
+import copy
+import gzip
+import json
+import logging
+import os
+import queue
+import shutil
+import threading
+
+
+# Arguments that cannot change between the call and the listener formatting them
+IMMUTABLE_ARGS = (str, int, float, bool, type(None))
+
+# Keep 1 in N of these DEBUG records; keys are "<logger>.<function>" patterns
+DEFAULT_SAMPLING = {"*.click": 10, "*.fill": 10}
+
+
+def parse_sampling(spec: str) -> Dict[str, int]:
+    """Parse ``"pattern=N,pattern=N"`` into sampling rules."""
+    rules = {}
+    for part in filter(None, (part.strip() for part in spec.split(","))):
+        pattern, _, every = part.partition("=")
+        if not every.isdigit() or int(every) < 1:
+            raise ValueError(f"Invalid log sampling rule: {part!r} (expected pattern=N)")
+        rules[pattern.strip()] = int(every)
+    return rules
+
+
+class SamplingFilter(logging.Filter):
+    """Keeps 1 in N DEBUG records per matching ``"<logger>.<function>"``.
+    
+    ``BasePage.click`` logs through the page object's logger, so
+    ``"*.click"`` samples clicks on every page while ``"ButtonsPage.click"``
+    samples one page only. Counting instead of random choice keeps a
+    sampled log reproducible. INFO and above always pass.
+    """
+    
+    def __init__(self, rules: Dict[str, int]):
+        super().__init__()
+        self.rules = rules
+        self._counts: Dict[str, int] = {}
+        self._every: Dict[str, int] = {}
+        self._lock = threading.Lock()
+    
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno > logging.DEBUG or not self.rules:
+            return True
+        key = f"{record.name}.{record.funcName}"
+        every = self._every.get(key)
+        if every is None:
+            every = next((n for pattern, n in self.rules.items() if fnmatchcase(key, pattern)), 1)
+            self._every[key] = every
+        if every == 1:
+            return True
+        with self._lock:
+            count = self._counts.get(key, 0)
+            self._counts[key] = count + 1
+        return count % every == 0
+
+
+class LazyQueueHandler(QueueHandler):
+    """Queues records without formatting them on the calling thread.
+    
+    ``QueueHandler`` merges the arguments into the message before queueing.
+    Here that only happens when an argument could still change (a list, a
+    page object); plain strings and numbers travel as they are and the
+    listener formats them. Tracebacks are rendered up front so the frames
+    are not kept alive in the queue.
+    """
+    
+    def __init__(self, log_queue: queue.Queue, worker: str):
+        super().__init__(log_queue)
+        self.worker = worker
+        self._formatter = logging.Formatter()
+    
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Other handlers on the root logger still see the original record
+        record = copy.copy(record)
+        if record.args and not all(isinstance(arg, IMMUTABLE_ARGS) for arg in _args(record)):
+            record.msg, record.args = record.getMessage(), None
+        if record.exc_info:
+            record.exc_text = self._formatter.formatException(record.exc_info)
+            record.exc_info = None
+        record.worker = self.worker
+        record.test = current_test.get() or os.environ.get("PYTEST_CURRENT_TEST", "").split(" ")[0] or None
+        return record
+
+
+def _args(record: logging.LogRecord):
+    return record.args.values() if isinstance(record.args, dict) else record.args
+
+
+class JsonLinesFormatter(logging.Formatter):
+    """One JSON object per record."""
+    
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "time": round(record.created, 3),
+            "level": record.levelname,
+            "logger": record.name,
+            "function": record.funcName,
+            "message": record.getMessage(),
+            "worker": getattr(record, "worker", None),
+            "test": getattr(record, "test", None),
+        }
+        if record.exc_text:
+            entry["exception"] = record.exc_text
+        return json.dumps(entry, default=str)
+
+
+class CompressingRotatingFileHandler(RotatingFileHandler):
+    """``RotatingFileHandler`` gzipping each file it rotates out."""
+    
+    def __init__(self, filename: Path, max_bytes: int, backup_count: int):
+        super().__init__(filename, maxBytes=max_bytes, backupCount=backup_count, encoding="utf-8", delay=True)
+        self.namer = lambda name: f"{name}.gz"
+        self.rotator = self._compress
+    
+    @staticmethod
+    def _compress(source: str, destination: str):
+        with open(source, "rb") as plain, gzip.open(destination, "wb") as compressed:
+            shutil.copyfileobj(plain, compressed)
+        os.remove(source)
+
+
+class LogPipeline:
+    """Root logger feeding a queue that a listener thread writes out.
+    
+    Logging calls only append to the queue; the listener writes JSON lines
+    to ``<log_dir>/<run>-<worker>.jsonl``, rotated by size and gzipped.
+    Start it once per process.
+    """
+    
+    def __init__(
+        self,
+        log_dir: Path,
+        run_name: str,
+        worker: str = "main",
+        level: str = "INFO",
+        sampling: Optional[Dict[str, int]] = None,
+        max_bytes: int = 10 * 1024 * 1024,
+        backup_count: int = 5,
+    ):
+        self.path = Path(log_dir) / f"{run_name}-{worker}.jsonl"
+        self.level = logging.getLevelName(level.upper())
+        self.queue: queue.Queue = queue.Queue()
+        self.queue_handler = LazyQueueHandler(self.queue, worker)
+        self.queue_handler.addFilter(SamplingFilter(DEFAULT_SAMPLING if sampling is None else sampling))
+        
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        file_handler = CompressingRotatingFileHandler(self.path, max_bytes, backup_count)
+        file_handler.setFormatter(JsonLinesFormatter())
+        self.listener = QueueListener(self.queue, file_handler, respect_handler_level=True)
+    
+    def start(self):
+        root = logging.getLogger()
+        root.setLevel(self.level)
+        root.addHandler(self.queue_handler)
+        self.listener.start()
+    
+    def stop(self):
+        """Write out everything queued and detach from the root logger."""
+        logging.getLogger().removeHandler(self.queue_handler)
+        self.listener.stop()
+        for handler in self.listener.handlers:
+            handler.close()
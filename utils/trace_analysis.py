@@ -0,0 +1,281 @@
+"""Break down where a test's wall time went, from its Playwright trace."""
+from bisect import bisect_left
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, IO, Iterable, Iterator, List, Optional, Tuple
+from urllib.parse import urlsplit
+import heapq
+import importlib
+import io
+import json
+import pkgutil
+import zipfile
+
+
+# Every millisecond of a test's wall time lands in exactly one category
+CATEGORIES = ("python", "navigation", "network", "actionability", "explicit_wait", "browser")
+
+NAVIGATION_METHODS = {"goto", "reload", "goBack", "goForward", "waitForLoadState", "waitForURL"}
+
+EXPLICIT_WAIT_METHODS = {"waitForSelector", "waitForTimeout", "waitForFunction", "waitForEventInfo", "expect"}
+
+# Log line marking the end of an action's actionability checks
+PERFORMING_PREFIX = "performing "
+
+# Trace lines the analysis never needs; skipped before JSON parsing
+SKIPPED_PREFIXES = ('{"type":"frame-snapshot"', '{"type":"screencast-frame"', '{"type":"console"')
+
+Interval = Tuple[float, float]
+
+
+@dataclass
+class TraceCall:
+    """One Playwright API call recorded in a trace."""
+    
+    api_name: str
+    method: str
+    selector: Optional[str]
+    url: Optional[str]
+    start: float
+    end: float
+    # When actionability checks finished and the action itself started
+    performing: Optional[float] = None
+    
+    @property
+    def duration(self) -> float:
+        return self.end - self.start
+    
+    @property
+    def category(self) -> str:
+        if self.method in NAVIGATION_METHODS:
+            return "navigation"
+        if self.method in EXPLICIT_WAIT_METHODS or self.api_name.startswith("expect"):
+            return "explicit_wait"
+        return "browser"
+
+
+@dataclass
+class TraceBreakdown:
+    """Wall time of one test split into ``CATEGORIES``, in milliseconds."""
+    
+    name: str
+    wall_ms: float = 0.0
+    categories: Dict[str, float] = field(default_factory=lambda: dict.fromkeys(CATEGORIES, 0.0))
+    calls: List[TraceCall] = field(default_factory=list)
+    
+    def to_dict(self) -> dict:
+        return {
+            "name": self.name,
+            "wall_ms": round(self.wall_ms, 1),
+            **{category: round(value, 1) for category, value in self.categories.items()},
+        }
+
+
+def merge_intervals(intervals: Iterable[Interval]) -> List[Interval]:
+    merged: List[Interval] = []
+    for start, end in sorted(intervals):
+        if merged and start <= merged[-1][1]:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else:
+            merged.append((start, end))
+    return merged
+
+
+def covered(merged: List[Interval], starts: List[float], start: float, end: float) -> float:
+    """How much of ``[start, end]`` the merged intervals cover."""
+    total = 0.0
+    index = max(bisect_left(starts, start) - 1, 0)
+    while index < len(merged) and merged[index][0] < end:
+        low, high = max(merged[index][0], start), min(merged[index][1], end)
+        total += max(high - low, 0.0)
+        index += 1
+    return total
+
+
+def _json_lines(stream: IO[bytes]) -> Iterator[dict]:
+    for line in io.TextIOWrapper(stream, encoding="utf-8"):
+        if line.startswith(SKIPPED_PREFIXES):
+            continue
+        line = line.strip()
+        if line:
+            yield json.loads(line)
+
+
+def analyze_trace(trace_path: Path, name: Optional[str] = None) -> TraceBreakdown:
+    """Stream a trace zip and attribute its wall time.
+    
+    The test's span runs from the first API call to the last. Time outside
+    any call is Python-side overhead. Inside a call: explicit waits count as
+    such; an action counts as actionability until its "performing" log
+    line; navigation and other calls count as network while a request is in
+    flight, and as navigation or browser time otherwise.
+    """
+    breakdown = TraceBreakdown(name or Path(trace_path).parent.name)
+    open_calls: Dict[str, TraceCall] = {}
+    requests: List[Interval] = []
+    
+    with zipfile.ZipFile(trace_path) as archive:
+        names = set(archive.namelist())
+        trace_names = sorted(entry for entry in names if entry.endswith(".trace"))
+        for trace_name in trace_names:
+            with archive.open(trace_name) as stream:
+                for event in _json_lines(stream):
+                    kind = event.get("type")
+                    if kind == "before":
+                        params = event.get("params") or {}
+                        open_calls[event["callId"]] = TraceCall(
+                            api_name=event.get("apiName", ""),
+                            method=event.get("method", ""),
+                            selector=params.get("selector"),
+                            url=params.get("url"),
+                            start=event["startTime"],
+                            end=event["startTime"],
+                        )
+                    elif kind == "log":
+                        call = open_calls.get(event.get("callId"))
+                        if call and event.get("message", "").strip().startswith(PERFORMING_PREFIX):
+                            call.performing = event["time"]
+                    elif kind == "after":
+                        call = open_calls.pop(event["callId"], None)
+                        if call:
+                            call.end = event.get("endTime", call.start)
+                            breakdown.calls.append(call)
+            
+            network_name = trace_name[: -len(".trace")] + ".network"
+            if network_name in names:
+                with archive.open(network_name) as stream:
+                    for event in _json_lines(stream):
+                        snapshot = event.get("snapshot") or {}
+                        started = snapshot.get("_monotonicTime")
+                        if started is not None and snapshot.get("time", -1) >= 0:
+                            requests.append((started, started + snapshot["time"]))
+    
+    _attribute(breakdown, merge_intervals(requests))
+    return breakdown
+
+
+def _attribute(breakdown: TraceBreakdown, network: List[Interval]):
+    calls = sorted(breakdown.calls, key=lambda call: call.start)
+    if not calls:
+        return
+    categories = breakdown.categories
+    network_starts = [start for start, _ in network]
+    span_start = calls[0].start
+    span_end = max(call.end for call in calls)
+    breakdown.wall_ms = span_end - span_start
+    
+    busy = merge_intervals((call.start, call.end) for call in calls)
+    categories["python"] = breakdown.wall_ms - sum(end - start for start, end in busy)
+    
+    # Calls can overlap (e.g. events awaited around an action); count each
+    # millisecond once, for the call that started first
+    claimed_until = span_start
+    for call in calls:
+        start, end = max(call.start, claimed_until), call.end
+        if end <= start:
+            continue
+        claimed_until = end
+        if call.performing is not None and call.performing > start:
+            checks_end = min(call.performing, end)
+            categories["actionability"] += checks_end - start
+            start = checks_end
+        category = call.category
+        if category == "explicit_wait":
+            categories[category] += end - start
+            continue
+        in_flight = covered(network, network_starts, start, end)
+        categories["network"] += in_flight
+        categories[category] += (end - start) - in_flight
+
+
+def load_page_locators(package: str = "pages.elements") -> Tuple[Dict[str, str], Dict[str, str]]:
+    """Map selectors and page URLs declared on page classes to their names.
+    
+    Returns ``({selector: "Page.ATTRIBUTE"}, {path: "Page"})``.
+    """
+    from pages.base_page import BasePage
+    
+    selectors: Dict[str, str] = {}
+    urls: Dict[str, str] = {}
+    module = importlib.import_module(package)
+    for info in pkgutil.iter_modules(module.__path__):
+        submodule = importlib.import_module(f"{package}.{info.name}")
+        for value in vars(submodule).values():
+            if not (isinstance(value, type) and issubclass(value, BasePage)) or value is BasePage:
+                continue
+            for attribute, locator in sorted(vars(value).items()):
+                if not attribute.isupper() or not isinstance(locator, str):
+                    continue
+                if attribute == "PAGE_URL":
+                    urls.setdefault(locator, value.__name__)
+                else:
+                    selectors.setdefault(locator, f"{value.__name__}.{attribute}")
+    return selectors, urls
+
+
+class RunAnalysis:
+    """Aggregates breakdowns across a run in bounded memory.
+    
+    Keeps category totals, per-operation count/total/max, and only the
+    ``top_n`` slowest tests, so thousands of traces can be analyzed without
+    holding their calls.
+    """
+    
+    def __init__(self, selectors: Dict[str, str], urls: Dict[str, str], top_n: int = 20):
+        self.selectors = selectors
+        self.urls = urls
+        self.top_n = top_n
+        self.traces = 0
+        self.wall_ms = 0.0
+        self.categories = dict.fromkeys(CATEGORIES, 0.0)
+        self.operations: Dict[str, List[float]] = {}
+        self._slowest: List[Tuple[float, str, dict]] = []
+    
+    def operation_of(self, call: TraceCall) -> str:
+        """Name a call by the page-class locator or page URL it used."""
+        if call.selector:
+            target = self.selectors.get(call.selector)
+            if target is None:
+                target = self.selectors.get(call.selector.split(" >> ")[0], call.selector)
+            return f"{target} {call.api_name}"
+        if call.url:
+            path = urlsplit(call.url).path or "/"
+            return f"{self.urls.get(path, path)} {call.api_name}"
+        return call.api_name
+    
+    def add(self, breakdown: TraceBreakdown):
+        self.traces += 1
+        self.wall_ms += breakdown.wall_ms
+        for category, value in breakdown.categories.items():
+            self.categories[category] += value
+        for call in breakdown.calls:
+            stats = self.operations.setdefault(self.operation_of(call), [0, 0.0, 0.0])
+            stats[0] += 1
+            stats[1] += call.duration
+            stats[2] = max(stats[2], call.duration)
+        
+        entry = (breakdown.wall_ms, breakdown.name, breakdown.to_dict())
+        if len(self._slowest) < self.top_n:
+            heapq.heappush(self._slowest, entry)
+        else:
+            heapq.heappushpop(self._slowest, entry)
+    
+    def slowest_tests(self) -> List[dict]:
+        return [entry for _, _, entry in sorted(self._slowest, reverse=True)]
+    
+    def slowest_operations(self, limit: Optional[int] = None) -> List[dict]:
+        ranked = sorted(self.operations.items(), key=lambda item: item[1][1], reverse=True)
+        return [
+            {"operation": key, "count": count, "total_ms": round(total, 1),
+             "mean_ms": round(total / count, 1), "max_ms": round(longest, 1)}
+            for key, (count, total, longest) in ranked[:limit]
+        ]
+    
+    def to_dict(self) -> dict:
+        return {
+            "traces": self.traces,
+            "wall_ms": round(self.wall_ms, 1),
+            "categories": {category: round(value, 1) for category, value in self.categories.items()},
+            "slowest_tests": self.slowest_tests(),
+            "operations": self.slowest_operations(),
+        }
@@ -0,0 +1,176 @@
+"""Content-addressed store deduplicating the entries of Playwright traces."""
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterator, List, Optional, Tuple
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import zipfile
+import zlib
+
+
+CHUNK_SIZE = 1024 * 1024
+
+
+@dataclass
+class IngestStats:
+    """What ingesting one or more trace zips added to the store."""
+    
+    traces: int = 0
+    entries: int = 0
+    new_blobs: int = 0
+    bytes_in: int = 0
+    bytes_stored: int = 0
+    
+    def add(self, other: "IngestStats"):
+        self.traces += other.traces
+        self.entries += other.entries
+        self.new_blobs += other.new_blobs
+        self.bytes_in += other.bytes_in
+        self.bytes_stored += other.bytes_stored
+
+
+class TraceStore:
+    """Directory of zlib-compressed blobs plus one JSON index per trace.
+    
+    Layout::
+        
+        <root>/blobs/<sha[:2]>/<sha>    entry content, keyed by SHA-256
+        <root>/index/<name>.json        entry names, hashes and zip metadata
+    
+    Entries are streamed out of the zip and into the store in chunks, so no
+    entry is ever held in memory or extracted to disk as a whole. Blobs and
+    indexes are written to a temporary file and renamed into place, so an
+    interrupted ingest never leaves a partial file behind.
+    """
+    
+    def __init__(self, root: Path):
+        self.root = Path(root)
+        self.blob_dir = self.root / "blobs"
+        self.index_dir = self.root / "index"
+        self.logger = logging.getLogger(self.__class__.__name__)
+    
+    def blob_path(self, digest: str) -> Path:
+        return self.blob_dir / digest[:2] / digest
+    
+    def index_path(self, name: str) -> Path:
+        return self.index_dir / f"{name}.json"
+    
+    def names(self) -> List[str]:
+        """Names of every trace in the store."""
+        return sorted(path.stem for path in self.index_dir.glob("*.json"))
+    
+    def ingest(self, trace_path: Path, name: str) -> IngestStats:
+        """Add a trace zip to the store under ``name``."""
+        stats = IngestStats(traces=1)
+        entries = []
+        with zipfile.ZipFile(trace_path) as archive:
+            for info in archive.infolist():
+                with archive.open(info) as source:
+                    digest, stored = self._put_blob(source)
+                entries.append({
+                    "name": info.filename,
+                    "sha256": digest,
+                    "size": info.file_size,
+                    "date_time": list(info.date_time),
+                    "compress_type": info.compress_type,
+                })
+                stats.entries += 1
+                stats.bytes_in += info.compress_size
+                if stored is not None:
+                    stats.new_blobs += 1
+                    stats.bytes_stored += stored
+        
+        self._write_atomically(
+            self.index_path(name),
+            json.dumps({"source": str(trace_path), "entries": entries}, indent=1).encode(),
+        )
+        return stats
+    
+    def ingest_tree(self, results_dir: Path, remove: bool = False) -> IngestStats:
+        """Ingest every trace zip under a pytest-playwright output directory.
+        
+        Each trace is named after its test folder (plus the file stem when a
+        test left several traces). With ``remove`` the zips are deleted once
+        their index is written.
+        """
+        results_dir = Path(results_dir)
+        total = IngestStats()
+        for trace_path in sorted(results_dir.rglob("trace*.zip")):
+            relative = trace_path.relative_to(results_dir)
+            name = "--".join(relative.parent.parts)
+            if trace_path.stem != "trace":
+                name = f"{name}--{trace_path.stem}"
+            total.add(self.ingest(trace_path, name or trace_path.stem))
+            if remove:
+                trace_path.unlink()
+        self.logger.info(
+            "Ingested %s traces: %s entries, %s new blobs, %.1f MiB in, %.1f MiB stored",
+            total.traces, total.entries, total.new_blobs,
+            total.bytes_in / 1024 / 1024, total.bytes_stored / 1024 / 1024,
+        )
+        return total
+    
+    def rebuild(self, name: str, destination: Path) -> Path:
+        """Write the trace zip for ``name`` back out, e.g. for the trace viewer."""
+        index = json.loads(self.index_path(name).read_text())
+        destination = Path(destination)
+        destination.parent.mkdir(parents=True, exist_ok=True)
+        temporary = self._temporary(destination)
+        with zipfile.ZipFile(temporary, "w") as archive:
+            for entry in index["entries"]:
+                info = zipfile.ZipInfo(entry["name"], date_time=tuple(entry["date_time"]))
+                info.compress_type = entry["compress_type"]
+                with archive.open(info, "w") as target:
+                    for chunk in self._read_blob(entry["sha256"]):
+                        target.write(chunk)
+        os.replace(temporary, destination)
+        return destination
+    
+    def disk_usage(self) -> int:
+        """Bytes used by blobs and indexes."""
+        return sum(path.stat().st_size for path in self.root.rglob("*") if path.is_file())
+    
+    def _put_blob(self, source) -> Tuple[str, Optional[int]]:
+        """Stream an entry into the store; returns its hash and stored size if new."""
+        self.blob_dir.mkdir(parents=True, exist_ok=True)
+        digest = hashlib.sha256()
+        compressor = zlib.compressobj()
+        temporary = self._temporary(self.blob_dir / "blob")
+        with open(temporary, "wb") as target:
+            for chunk in iter(lambda: source.read(CHUNK_SIZE), b""):
+                digest.update(chunk)
+                target.write(compressor.compress(chunk))
+            target.write(compressor.flush())
+        
+        path = self.blob_path(digest.hexdigest())
+        if path.exists():
+            os.unlink(temporary)
+            return digest.hexdigest(), None
+        path.parent.mkdir(exist_ok=True)
+        os.replace(temporary, path)
+        return digest.hexdigest(), path.stat().st_size
+    
+    def _read_blob(self, digest: str) -> Iterator[bytes]:
+        decompressor = zlib.decompressobj()
+        with open(self.blob_path(digest), "rb") as source:
+            for chunk in iter(lambda: source.read(CHUNK_SIZE), b""):
+                yield decompressor.decompress(chunk)
+        yield decompressor.flush()
+    
+    def _write_atomically(self, path: Path, data: bytes):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temporary = self._temporary(path)
+        with open(temporary, "wb") as target:
+            target.write(data)
+        os.replace(temporary, path)
+    
+    @staticmethod
+    def _temporary(path: Path) -> str:
+        """A new empty file next to ``path``, so renaming it into place is atomic."""
+        descriptor, temporary = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+        os.close(descriptor)
+        return temporary
+
@@ -0,0 +1,46 @@
+"""Records explicit waits that ran out their timeout."""
+from dataclasses import dataclass
+from typing import List, Optional, Tuple
+import threading
+from utils.current_test import current_test
+
+
+@dataclass(frozen=True)
+class ExpiredWait:
+    """A wait that hit its timeout instead of seeing the expected state."""
+    
+    page_object: str
+    method: str
+    selector: str
+    timeout_ms: int
+    elapsed_ms: float
+
+
+class WaitReport:
+    """Per-test buffer of expired waits; reset by the wait_report plugin.
+    
+    Waits are tagged with ``current_test`` so that tests running
+    concurrently in one worker only drain their own.
+    """
+    
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._expired: List[Tuple[Optional[str], ExpiredWait]] = []
+    
+    def record(self, page_object: str, method: str, selector: str, timeout_ms: int, elapsed_ms: float):
+        """Add an expired wait to the buffer."""
+        with self._lock:
+            self._expired.append(
+                (current_test.get(), ExpiredWait(page_object, method, selector, timeout_ms, elapsed_ms))
+            )
+    
+    def drain(self, nodeid: Optional[str] = None) -> List[ExpiredWait]:
+        """Return and clear the waits of a test plus any untagged ones."""
+        with self._lock:
+            drained = [wait for owner, wait in self._expired if owner in (None, nodeid)]
+            self._expired = [(owner, wait) for owner, wait in self._expired if owner not in (None, nodeid)]
+        return drained
+
+
+# Create a global instance
+wait_report = WaitReport()
@@ -0,0 +1,56 @@
+"""xdist scheduler handing out page-object work units longest first."""
+from collections import OrderedDict
+from typing import Dict
+import pytest
+from xdist.scheduler import LoadScopeScheduling
+from utils.duration_history import DurationHistory
+
+
+class DurationScheduling(LoadScopeScheduling):
+    """Load-scope scheduling where scopes come from the duration history.
+    
+    Tests are grouped into work units by the page objects they use (see
+    ``DurationHistory.plan_units``) and the units are queued longest first.
+    Whichever worker runs low on work takes the next unit, which is
+    longest-processing-time-first balancing done online, so the long units
+    start early instead of piling up at the tail.
+    """
+    
+    def __init__(self, config: pytest.Config, history: DurationHistory, log=None):
+        super().__init__(config, log)
+        self.history = history
+        self._scope_of: Dict[str, str] = {}
+    
+    def _split_scope(self, nodeid: str) -> str:
+        return self._scope_of.get(nodeid) or super()._split_scope(nodeid)
+    
+    def schedule(self) -> None:
+        assert self.collection_is_completed
+        if self.collection is not None:
+            for node in self.nodes:
+                self._reschedule(node)
+            return
+        
+        if not self._check_nodes_have_same_collection():
+            self.log("**Different tests collected, aborting run**")
+            return
+        self.collection = list(next(iter(self.registered_collections.values())))
+        if not self.collection:
+            return
+        
+        units = self.history.plan_units(self.collection, bins=len(self.nodes))
+        self.workqueue = OrderedDict()
+        for unit in units:
+            self.workqueue[unit.key] = {nodeid: False for nodeid in unit.nodeids}
+            self._scope_of.update((nodeid, unit.key) for nodeid in unit.nodeids)
+        self.log(f"Planned {len(units)} units, longest ~{units[0].duration:.1f}s")
+        
+        extra_nodes = len(self.nodes) - len(self.workqueue)
+        for _ in range(max(extra_nodes, 0)):
+            unused_node, _ = self.assigned_work.popitem()
+            unused_node.shutdown()
+        
+        for node in self.nodes:
+            self._assign_work_unit(node)
+        for node in self.nodes:
+            self._reschedule(node)